@@ -1,17 +1,66 @@
+import time
+
+# Taken before anything else is imported so startup profiles cover it
+LAUNCH_TIME = time.perf_counter()
+
 import json
-import importlib.util
+import argparse
 import sys
-import os
 
-def load_component(component_path):
-    """Dynamically load a component from a Python file"""
-    module_name = os.path.basename(component_path).replace('.py', '')
-    spec = importlib.util.spec_from_file_location(module_name, component_path)
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-    return module
+from components.startup import load_component, StartupProfiler
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Axion engine launcher")
+    parser.add_argument("--headless", action="store_true",
+                        help="run the engine frame loop without a window")
+    parser.add_argument("--project", help="project directory to run")
+    parser.add_argument("--frames", type=int, help="frames to run in headless mode")
+    parser.add_argument("--seconds", type=float, help="seconds to run in headless mode")
+    parser.add_argument("--report",
+                        help="write headless frame timings or the startup profile JSON here")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="report per-import and per-phase time up to first paint")
+    parser.add_argument("--trace",
+                        help="write a Chrome trace of the last headless frames here")
+    parser.add_argument("--record",
+                        help="record the headless run as a replay here")
+    return parser.parse_args()
+
+def first_paint_reporter(profiler, args):
+    """Callback for components: report the startup profile, then exit"""
+    def on_ready(app):
+        profiler.mark("run until first paint")
+        profiler.uninstall()
+        profiler.report(path=args.report)
+        if app is not None:
+            app.destroy()
+    return on_ready
+
+def run_headless(config, args, on_ready=None):
+    """Run the engine without Tk, using load.json defaults for missing flags"""
+    headless = config.get("headless", {})
+    engine = load_component('components/core/engine/engine.py')
+    engine.run_headless(
+        project_path=args.project or headless.get("project"),
+        frames=args.frames if args.frames is not None else headless.get("frames"),
+        seconds=args.seconds if args.seconds is not None else headless.get("seconds"),
+        report=None if on_ready else args.report or headless.get("report"),
+        on_ready=on_ready,
+        trace=args.trace or headless.get("trace"),
+        record=args.record or headless.get("record"),
+    )
 
 def main():
+    args = parse_args()
+    
+    on_ready = None
+    profiler = None
+    if args.profile_startup:
+        profiler = StartupProfiler(LAUNCH_TIME)
+        profiler.install()
+        profiler.mark("launcher")
+        on_ready = first_paint_reporter(profiler, args)
+
     # Load configuration
     try:
         with open('load.json') as f:
@@ -19,6 +68,16 @@ def main():
     except FileNotFoundError:
         print("Error: load.json not found!")
         sys.exit(1)
+    if profiler:
+        profiler.mark("config")
+    # Imported here so the startup profiler sees PIL load
+    from components.image_cache import images
+    images.configure(int(config.get("image_cache_mb", 64) * 1024 * 1024))
+    
+    # Headless runs never touch Tk, so there is nothing to fall back to
+    if args.headless or config.get("headless", {}).get("enabled", False):
+        run_headless(config, args, on_ready)
+        return
     
     # Determine which component to load
     component_to_load = config['default_mode']
@@ -27,20 +86,24 @@ def main():
     try:
         if component_to_load == "project_manager":
             pm = load_component('components/manager/project_manager.py')
-            pm.run()
+            if profiler:
+                profiler.mark("load project_manager")
+            pm.run(on_ready=on_ready)
         elif component_to_load == "engine":
             engine = load_component('components/core/engine/engine.py')
-            engine.run()
+            if profiler:
+                profiler.mark("load engine")
+            engine.run(args.project, on_ready=on_ready)
         else:
             raise ValueError(f"Unknown component: {component_to_load}")
     except Exception as e:
         print(f"Failed to load {component_to_load}: {str(e)}")
         print(f"Falling back to {config['fallback_mode']}")
         
-        # Fallback to engine mode
+        # Fallback to engine mode (reuses the module if it already loaded)
         try:
             engine = load_component('components/core/engine/engine.py')
-            engine.run()
+            engine.run(on_ready=on_ready)
         except Exception as fallback_error:
             print(f"Critical failure: {str(fallback_error)}")
             sys.exit(1)
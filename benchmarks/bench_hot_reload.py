@@ -0,0 +1,71 @@
+"""Hot reload latency: edit one entity in a large scene and time the update.
+
+Copies the editor template into a temporary project, fills its scene
+with synthetic entities, starts an Engine with hot reload and then
+saves single-entity edits, stepping frames until each edit is live.
+Run from the repository root:
+
+    python -m benchmarks.bench_hot_reload --count 10000
+"""
+import argparse
+import json
+import os
+import shutil
+import tempfile
+import time
+
+import numpy as np
+
+from components.core.engine.ecs import Transform
+from components.core.engine.engine import Engine, TEMPLATE_PATH
+from benchmarks.bench_scene_load import write_scene
+
+
+def bench(count, edits):
+    with tempfile.TemporaryDirectory() as directory:
+        project = os.path.join(directory, "project")
+        shutil.copytree(TEMPLATE_PATH, project)
+        scene_path = os.path.join(project, "scene", "main.scene")
+        write_scene(scene_path, count)
+        with open(scene_path, "r") as f:
+            scene = json.load(f)
+
+        engine = Engine(project)
+        reloader = engine.enable_hot_reload()
+        engine.frame(1 / 60)
+        positions = engine.world.store(Transform).columns["position"]
+
+        waits = []
+        rng = np.random.default_rng(0)
+        for _ in range(edits):
+            i = int(rng.integers(count))
+            scene["entities"][i]["components"][0]["position"] = [-1.0, -1.0]
+            with open(scene_path, "w") as f:
+                json.dump(scene, f)
+            saved = time.perf_counter()
+            before = len(reloader.latencies)
+            while len(reloader.latencies) == before:
+                engine.frame(1 / 60)
+            waits.append(time.perf_counter() - saved)
+            slot = engine.world.store(Transform).sparse[i]
+            assert tuple(positions[slot]) == (-1.0, -1.0)
+        reloader.close()
+
+    work = np.array(reloader.durations) * 1000
+    ms = np.array(reloader.latencies) * 1000
+    print(f"{count} entities, {edits} single-entity edits")
+    print(f"  parse and apply  median {np.median(work):.1f} ms, max {work.max():.1f} ms")
+    print(f"  save to applied  median {np.median(ms):.1f} ms, max {ms.max():.1f} ms")
+    print(f"  save to next frame done  median {np.median(waits) * 1000:.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark scene hot reload")
+    parser.add_argument("--count", type=int, default=10_000)
+    parser.add_argument("--edits", type=int, default=10)
+    args = parser.parse_args()
+    bench(args.count, args.edits)
+
+
+if __name__ == "__main__":
+    main()
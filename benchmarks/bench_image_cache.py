@@ -0,0 +1,73 @@
+"""Image cache benchmark: cold, prefetched and warm texture loads.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_image_cache --count 256 --size 128
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+from PIL import Image
+
+from components.image_cache import ImageCache
+
+
+def write_images(directory, count, size, seed=0):
+    rng = np.random.default_rng(seed)
+    paths = []
+    for i in range(count):
+        path = os.path.join(directory, f"tex_{i}.png")
+        pixels = rng.integers(0, 256, (size, size, 4), dtype=np.uint8)
+        Image.fromarray(pixels, "RGBA").save(path)
+        paths.append(path)
+    return paths
+
+
+def timed(fn):
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1000
+
+
+def bench(count, size):
+    with tempfile.TemporaryDirectory() as directory:
+        paths = write_images(directory, count, size)
+
+        cache = ImageCache()
+        cold = timed(lambda: [cache.get(p) for p in paths])
+        warm = timed(lambda: [cache.get(p) for p in paths])
+
+        cache = ImageCache()
+        prefetched = timed(lambda: [f.result() for f in cache.prefetch(paths)])
+
+        # Budget for half the images, accessed with a hot working set
+        budget = count * size * size * 4 // 2
+        cache = ImageCache(budget_bytes=budget)
+        rng = np.random.default_rng(1)
+        hot = paths[:count // 4]
+        for _ in range(2000):
+            pool = hot if rng.random() < 0.8 else paths
+            cache.get(pool[rng.integers(len(pool))])
+        stats = cache.stats()
+
+    print(f"{count} images of {size}x{size}")
+    print(f"  cold sequential {cold:8.1f} ms")
+    print(f"  cold prefetch   {prefetched:8.1f} ms")
+    print(f"  warm            {warm:8.2f} ms")
+    print(f"  half budget, 80% hot set: hit rate {stats['hit_rate']:.0%}, "
+          f"{stats['evictions']} evictions, {stats['bytes'] / 2**20:.1f} MB resident")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the image cache")
+    parser.add_argument("--count", type=int, default=256)
+    parser.add_argument("--size", type=int, default=128)
+    args = parser.parse_args()
+    bench(args.count, args.size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Particle system benchmark, fully offscreen.
+
+Loads a scene whose emitters keep the given number of particles alive,
+runs the particle system until it reaches that count, then times the
+simulation step, the batch build and the full render per frame. Run
+from the repository root:
+
+    python -m benchmarks.bench_particles --counts 50000 200000
+"""
+import argparse
+import time
+
+import numpy as np
+from PIL import Image
+
+from components.core.engine.particles import ParticleSystem
+from components.core.engine.renderer import SpriteRenderer
+from components.core.engine.scene import load_scene_data
+
+EMITTERS = 4
+LIFETIME = [0.8, 1.2]
+
+
+def build_scene(count, width=1280, height=720):
+    """World with emitters spread along the screen, renderer with a 4x4 spark"""
+    scene = {"entities": [
+        {
+            "name": f"Emitter {i}",
+            "components": [
+                {"type": "Transform", "position": [width * (i + 0.5) / EMITTERS, height * 0.8]},
+                {
+                    "type": "ParticleEmitter",
+                    "texture": "spark.png",
+                    "layer": 1,
+                    # Rate times mean lifetime is the steady-state count
+                    "rate": count / EMITTERS / np.mean(LIFETIME),
+                    "lifetime": LIFETIME,
+                    "speed": [200, 600],
+                    "spread": 60,
+                    "radius": 8,
+                    "max_particles": count,
+                },
+            ],
+        }
+        for i in range(EMITTERS)
+    ]}
+    world = load_scene_data(scene)
+    renderer = SpriteRenderer(width, height)
+    spark = Image.new("RGBA", (4, 4), (255, 200, 80, 255))
+    renderer.atlas.add(world.strings.intern("spark.png"), spark)
+    return world, renderer
+
+
+def bench(count, frames=60, dt=1 / 60):
+    world, renderer = build_scene(count)
+    particles = ParticleSystem()
+    renderer.particles = particles
+    # Run until births and deaths balance
+    for _ in range(int(max(LIFETIME) / dt) + 10):
+        particles.update(world, dt)
+
+    update_times, batch_times, frame_times = [], [], []
+    for _ in range(frames):
+        start = time.perf_counter()
+        particles.update(world, dt)
+        update_times.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        renderer.build_batches(world)
+        batch_times.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        renderer.render(world)
+        frame_times.append(time.perf_counter() - start)
+    update_ms = float(np.mean(update_times) * 1000)
+    render_ms = float(np.mean(frame_times) * 1000)
+    return {
+        "particles": len(particles),
+        "update_ms": update_ms,
+        "update_p99_ms": float(np.percentile(update_times, 99) * 1000),
+        "batch_ms": float(np.mean(batch_times) * 1000),
+        "render_ms": render_ms,
+        "fps": 1000 / (update_ms + render_ms),
+        "drawn": renderer.sprites_drawn,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the particle system")
+    parser.add_argument("--counts", type=int, nargs="+", default=[50_000, 200_000])
+    parser.add_argument("--frames", type=int, default=60)
+    args = parser.parse_args()
+
+    for count in args.counts:
+        r = bench(count, args.frames)
+        print(
+            f"{r['particles']:>8} particles: update {r['update_ms']:.2f} ms "
+            f"(p99 {r['update_p99_ms']:.2f}) | batch build {r['batch_ms']:.2f} ms | "
+            f"render {r['render_ms']:.2f} ms ({r['drawn']} drawn) | {r['fps']:.0f} fps"
+        )
+
+
+if __name__ == "__main__":
+    main()
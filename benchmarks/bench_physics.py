@@ -0,0 +1,65 @@
+"""Physics step benchmark.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_physics --counts 10000 100000
+"""
+import argparse
+import time
+
+import numpy as np
+
+from components.core.engine.ecs import World, Transform, RigidBody
+from components.core.engine.physics import PhysicsSystem
+
+
+def build_world(count, seed=0):
+    """World with count bodies scattered at roughly constant density"""
+    rng = np.random.default_rng(seed)
+    extent = np.sqrt(count) * 48
+    world = World()
+    eids = world.create_entities(count)
+    world.add_components(Transform, eids, position=rng.uniform(0, extent, (count, 2)))
+    world.add_components(
+        RigidBody, eids,
+        velocity=rng.uniform(-100, 100, (count, 2)),
+        size=rng.uniform(8, 32, (count, 1)).repeat(2, axis=1),
+    )
+    return world
+
+
+def bench(count, steps=50, warmup=5):
+    world = build_world(count)
+    physics = PhysicsSystem()
+    for _ in range(warmup):
+        physics.step(world, physics.fixed_dt)
+    timings = []
+    for _ in range(steps):
+        start = time.perf_counter()
+        physics.step(world, physics.fixed_dt)
+        timings.append(time.perf_counter() - start)
+    timings = np.array(timings) * 1000
+    return {
+        "bodies": count,
+        "mean_ms": float(timings.mean()),
+        "p95_ms": float(np.percentile(timings, 95)),
+        "contacts": len(physics.contacts),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the physics step")
+    parser.add_argument("--counts", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--steps", type=int, default=50)
+    args = parser.parse_args()
+
+    for count in args.counts:
+        result = bench(count, args.steps)
+        print(
+            f"{result['bodies']:>8} bodies: {result['mean_ms']:.2f} ms/step "
+            f"(p95 {result['p95_ms']:.2f} ms, {result['contacts']} contacts)"
+        )
+
+
+if __name__ == "__main__":
+    main()
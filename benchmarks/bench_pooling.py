@@ -0,0 +1,130 @@
+"""Spawn/despawn stress: frame time jitter and GC while entities churn.
+
+Every frame a bullet prefab spawns a batch of entities, physics moves
+everything and the batch spawned ``lifetime`` frames ago is despawned,
+so the live count stays constant while ids and component slots are
+recycled. Compares deferred batched destruction (``World.despawn`` plus
+the end-of-frame flush) with destroying entities one at a time, and
+reports garbage collections, time spent in them and allocated blocks
+left over across the measured frames. Run from the repository root:
+
+    python -m benchmarks.bench_pooling --spawn 500 --lifetime 60
+"""
+import argparse
+import gc
+import sys
+import time
+
+import numpy as np
+
+from components.core.engine.ecs import World, RigidBody
+from components.core.engine.physics import PhysicsSystem
+from components.core.engine.prefab import Prefab
+
+BULLET = Prefab("Bullet", {
+    "Transform": {},
+    "Sprite": {"texture": "bullet.png", "layer": 2},
+    "RigidBody": {"velocity": [0, -400], "size": [4, 4], "gravity_scale": 0},
+})
+
+
+class GCTimer:
+    """Counts collections and their duration through gc.callbacks"""
+
+    def __init__(self):
+        self.collections = 0
+        self.seconds = 0.0
+        self.started = 0.0
+
+    def __call__(self, phase, info):
+        if phase == "start":
+            self.started = time.perf_counter()
+        else:
+            self.collections += 1
+            self.seconds += time.perf_counter() - self.started
+
+
+def bench(spawn, lifetime, frames=600, batched=True, seed=0):
+    rng = np.random.default_rng(seed)
+    world = World()
+    physics = PhysicsSystem()
+    # Ids spawned per frame, by frame slot, so despawning allocates nothing
+    spawned = np.zeros((lifetime, spawn), dtype=np.int64)
+    positions = rng.uniform(0, 4096, (frames + lifetime * 2, spawn, 2)).astype(np.float32)
+    overrides = {"position": None}
+
+    def frame(i):
+        """Runs one frame; returns the seconds spent spawning and despawning"""
+        start = time.perf_counter()
+        slot = i % lifetime
+        if i >= lifetime:
+            if batched:
+                world.despawn(spawned[slot])
+            else:
+                for eid in spawned[slot].tolist():
+                    world.destroy_entity(eid)
+        overrides["position"] = positions[i]
+        spawned[slot] = BULLET.spawn(world, spawn, Transform=overrides)
+        lifecycle = time.perf_counter() - start
+        physics.step(world, physics.fixed_dt)
+        start = time.perf_counter()
+        world.flush_despawned()
+        return lifecycle + time.perf_counter() - start
+
+    # Warm up until every id and store slot has been recycled at least once
+    for i in range(lifetime * 2):
+        frame(i)
+    ids = world.entity_count
+
+    timer = GCTimer()
+    gc.callbacks.append(timer)
+    blocks = sys.getallocatedblocks()
+    times = np.empty(frames)
+    lifecycle = np.empty(frames)
+    try:
+        for i in range(frames):
+            start = time.perf_counter()
+            lifecycle[i] = frame(lifetime * 2 + i)
+            times[i] = time.perf_counter() - start
+    finally:
+        gc.callbacks.remove(timer)
+    times *= 1000
+    lifecycle *= 1000
+    return {
+        "live": len(world.store(RigidBody)),
+        "ids": world.entity_count,
+        "ids_grown": world.entity_count - ids,
+        "mean_ms": float(times.mean()),
+        "p99_ms": float(np.percentile(times, 99)),
+        "max_ms": float(times.max()),
+        "jitter_ms": float(times.std()),
+        "lifecycle_ms": float(lifecycle.mean()),
+        "lifecycle_p99_ms": float(np.percentile(lifecycle, 99)),
+        "gc_collections": timer.collections,
+        "gc_ms": timer.seconds * 1000,
+        "blocks_leaked": sys.getallocatedblocks() - blocks,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stress entity spawn/despawn")
+    parser.add_argument("--spawn", type=int, default=500, help="entities spawned per frame")
+    parser.add_argument("--lifetime", type=int, default=60, help="frames each entity lives")
+    parser.add_argument("--frames", type=int, default=600)
+    args = parser.parse_args()
+
+    for batched in (False, True):
+        r = bench(args.spawn, args.lifetime, args.frames, batched)
+        print(
+            f"{'batched despawn' if batched else 'destroy one by one':>18}: "
+            f"{r['live']} live, {r['ids']} ids (+{r['ids_grown']}) | "
+            f"{r['mean_ms']:.2f} ms/frame, p99 {r['p99_ms']:.2f}, max {r['max_ms']:.2f}, "
+            f"jitter {r['jitter_ms']:.2f} ms | "
+            f"spawn+despawn {r['lifecycle_ms']:.2f} ms (p99 {r['lifecycle_p99_ms']:.2f}) | "
+            f"{r['gc_collections']} GCs ({r['gc_ms']:.2f} ms), "
+            f"{r['blocks_leaked']} blocks left"
+        )
+
+
+if __name__ == "__main__":
+    main()
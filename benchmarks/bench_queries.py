@@ -0,0 +1,95 @@
+"""Entity lookup benchmark: cached queries and the name index.
+
+Compares re-joining the stores every frame (``World.view``) with a
+cached ``World.query`` while a few entities change per frame (timing
+the changes too, since the query has to follow them), and a
+name lookup through the index with a scan of the names array. Run from
+the repository root:
+
+    python -m benchmarks.bench_queries --counts 10000 100000
+"""
+import argparse
+import time
+
+import numpy as np
+
+from components.core.engine.ecs import Transform, Sprite, RigidBody
+from components.core.engine.scene import load_scene_data
+
+
+def build_world(count, seed=0):
+    """Every entity has a Transform, half a Sprite, a third a RigidBody"""
+    rng = np.random.default_rng(seed)
+    entities = []
+    for i in range(count):
+        components = [{"type": "Transform", "position": rng.uniform(0, 4096, 2).tolist()}]
+        if i % 2 == 0:
+            components.append({"type": "Sprite", "texture": "sprite.png"})
+        if i % 3 == 0:
+            components.append({"type": "RigidBody"})
+        entities.append({"name": f"Entity {i}", "components": components})
+    return load_scene_data({"entities": entities})
+
+
+def bench(count, frames=200, churn=10):
+    world = build_world(count)
+    rng = np.random.default_rng(1)
+
+    def run(lookup):
+        times = np.empty(frames)
+        for i in range(frames):
+            # A few bodies come and go, as in a game
+            eids = np.flatnonzero(world.alive[:world.entity_count])
+            changed = rng.choice(eids, churn, replace=False)
+            # Timed with the changes, which a cached query has to follow
+            start = time.perf_counter()
+            world.destroy_entities(changed)
+            new = world.create_entities(churn)
+            world.add_components(Transform, new)
+            world.add_components(Sprite, new)
+            world.add_components(RigidBody, new)
+            lookup()
+            times[i] = time.perf_counter() - start
+        return float(times.mean() * 1000)
+
+    view_ms = run(lambda: world.view(Transform, Sprite, RigidBody))
+    query = world.query(Transform, Sprite, RigidBody)
+    query_ms = run(query.view)
+
+    names = [f"Entity {i}" for i in rng.integers(0, count, 1000)]
+    start = time.perf_counter()
+    for name in names:
+        name_id = world.strings.ids.get(name, -1)
+        np.flatnonzero(world.names[:world.entity_count] == name_id)
+    scan_us = (time.perf_counter() - start) / len(names) * 1e6
+    start = time.perf_counter()
+    for name in names:
+        world.find_all(name)
+    find_us = (time.perf_counter() - start) / len(names) * 1e6
+    return {
+        "entities": count,
+        "matched": len(query),
+        "view_ms": view_ms,
+        "query_ms": query_ms,
+        "scan_us": scan_us,
+        "find_us": find_us,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark cached queries and name lookup")
+    parser.add_argument("--counts", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--frames", type=int, default=200)
+    args = parser.parse_args()
+
+    for count in args.counts:
+        r = bench(count, args.frames)
+        print(
+            f"{r['entities']:>7} entities ({r['matched']} matched): "
+            f"view {r['view_ms']:.3f} ms, cached query {r['query_ms']:.3f} ms | "
+            f"find by name: scan {r['scan_us']:.1f} us, index {r['find_us']:.1f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Sprite renderer benchmark, fully offscreen.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_render --counts 1000 10000
+"""
+import argparse
+import time
+
+import numpy as np
+from PIL import Image
+
+from components.core.engine.ecs import World, Transform, Sprite
+from components.core.engine.renderer import SpriteRenderer
+
+
+def build_scene(count, textures=16, width=1280, height=720, seed=0):
+    """World plus renderer with count sprites over a few synthetic textures"""
+    rng = np.random.default_rng(seed)
+    world = World()
+    renderer = SpriteRenderer(width, height)
+    names = [f"sprite_{i}.png" for i in range(textures)]
+    for i, name in enumerate(names):
+        size = int(rng.integers(16, 48))
+        color = tuple(int(c) for c in rng.integers(0, 256, 3)) + (255,)
+        renderer.atlas.add(world.strings.intern(name), Image.new("RGBA", (size, size), color))
+
+    eids = world.create_entities(count)
+    world.add_components(
+        Transform, eids,
+        position=rng.uniform((-32, -32), (width + 32, height + 32), (count, 2)),
+    )
+    world.add_components(
+        Sprite, eids,
+        texture=rng.choice(names, count).tolist(),
+        layer=rng.integers(0, 4, count),
+    )
+    return world, renderer
+
+
+def bench(count, frames=30):
+    world, renderer = build_scene(count)
+    renderer.render(world)
+    batch_times, frame_times = [], []
+    for _ in range(frames):
+        start = time.perf_counter()
+        renderer.build_batches(world)
+        batch_times.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        renderer.render(world)
+        frame_times.append(time.perf_counter() - start)
+    frame_ms = np.mean(frame_times) * 1000
+    return {
+        "sprites": count,
+        "batch_ms": float(np.mean(batch_times) * 1000),
+        "frame_ms": float(frame_ms),
+        "fps": float(1000 / frame_ms),
+        "draw_calls": renderer.draw_calls,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark offscreen sprite rendering")
+    parser.add_argument("--counts", type=int, nargs="+", default=[1_000, 10_000])
+    parser.add_argument("--frames", type=int, default=30)
+    parser.add_argument("--save", help="write the last frame to this image file")
+    args = parser.parse_args()
+
+    for count in args.counts:
+        result = bench(count, args.frames)
+        print(
+            f"{result['sprites']:>8} sprites: {result['fps']:.1f} fps "
+            f"({result['frame_ms']:.2f} ms/frame, batch build {result['batch_ms']:.2f} ms, "
+            f"{result['draw_calls']} draw calls)"
+        )
+    if args.save:
+        world, renderer = build_scene(args.counts[-1])
+        renderer.render(world).save(args.save)
+
+
+if __name__ == "__main__":
+    main()
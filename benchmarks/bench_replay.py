@@ -0,0 +1,116 @@
+"""Replay recording benchmark, fully offscreen.
+
+Simulates a scene of falling rigid bodies with a particle emitter, once
+plainly and once while recording a replay, and reports the time the
+recorder adds per frame, the file size, how long seeking to a frame
+takes and whether re-simulating the recording matches it bit for bit.
+Run from the repository root:
+
+    python -m benchmarks.bench_replay --entities 10000 --frames 600
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from components.core.engine.engine import Engine
+from components.core.engine.replay import Replay
+from components.core.engine.scene import load_scene_data
+
+
+def build_engine(count, seed=0):
+    """Template engine with count rigid bodies and one particle emitter"""
+    rng = np.random.default_rng(seed)
+    positions = rng.uniform((0, -2000), (4096, 0), (count, 2)).round(1).tolist()
+    entities = [
+        {
+            "name": f"Body {i}",
+            "components": [
+                {"type": "Transform", "position": position},
+                {"type": "Sprite", "texture": "body.png", "layer": 1},
+                {"type": "RigidBody", "size": [8, 8], "velocity": [0, 0]},
+            ],
+        }
+        for i, position in enumerate(positions)
+    ]
+    entities.append({"name": "Sparks", "components": [
+        {"type": "Transform", "position": [640, 360]},
+        {"type": "ParticleEmitter", "texture": "spark.png", "rate": 2000, "lifetime": [0.5, 1.5]},
+    ]})
+    engine = Engine()
+    engine.world = load_scene_data({"entities": entities})
+    return engine
+
+
+def simulate(engine, frames, dt, rng):
+    """Step frames with a few random key presses; returns seconds per frame"""
+    times = np.empty(frames)
+    for i in range(frames):
+        if rng.random() < 0.1:
+            engine.input.press(f"k{int(rng.integers(8))}")
+        start = time.perf_counter()
+        engine.step(dt)
+        times[i] = time.perf_counter() - start
+    return times
+
+
+def bench(count, frames=600, dt=1 / 60, compression="zlib", interval=30):
+    plain = simulate(build_engine(count), frames, dt, np.random.default_rng(1))
+
+    path = os.path.join(tempfile.mkdtemp(), "bench.axreplay")
+    engine = build_engine(count)
+    engine.record(path, snapshot_interval=interval, compression=compression)
+    recorded = simulate(engine, frames, dt, np.random.default_rng(1))
+    record = np.array(engine.stats.systems["record"])
+    start = time.perf_counter()
+    engine.stop_recording()
+    close_ms = (time.perf_counter() - start) * 1000
+
+    replay = Replay(path)
+    seek_times = []
+    for frame in (frames // 2, frames // 2 + interval // 2, frames - 1):
+        start = time.perf_counter()
+        replay.seek(build_engine(0), frame)
+        seek_times.append(time.perf_counter() - start)
+    mismatches = replay.verify(build_engine(0))
+    replay.close()
+
+    size = os.path.getsize(path)
+    os.remove(path)
+    return {
+        "entities": count,
+        "plain_ms": float(plain.mean() * 1000),
+        "recorded_ms": float(recorded.mean() * 1000),
+        "record_ms": float(record.mean() * 1000),
+        "record_p99_ms": float(np.percentile(record, 99) * 1000),
+        "close_ms": close_ms,
+        "size_kb": size / 1024,
+        "snapshots": len(replay.snapshots),
+        "seek_ms": float(np.mean(seek_times) * 1000),
+        "exact": not mismatches,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark replay recording and seeking")
+    parser.add_argument("--entities", type=int, nargs="+", default=[10_000])
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--interval", type=int, default=30, help="frames between snapshots")
+    parser.add_argument("--compression", choices=["zlib", "lzma"], default="zlib")
+    args = parser.parse_args()
+
+    for count in args.entities:
+        r = bench(count, args.frames, compression=args.compression, interval=args.interval)
+        print(
+            f"{r['entities']:>7} entities: {r['plain_ms']:.2f} ms/frame plain, "
+            f"{r['recorded_ms']:.2f} recording | recorder {r['record_ms']:.3f} ms/frame "
+            f"(p99 {r['record_p99_ms']:.2f}), close {r['close_ms']:.1f} ms | "
+            f"{r['size_kb']:.0f} KiB, {r['snapshots']} snapshots | "
+            f"seek {r['seek_ms']:.1f} ms | {'frame-exact' if r['exact'] else 'MISMATCH'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Scene load benchmark: JSON .scene vs cooked binary scene.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_scene_load --counts 10000 100000
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+from components.core.engine.cooked import cook_scene, load_cooked
+from components.core.engine.scene import load_scene
+
+
+def write_scene(path, count, textures=32, seed=0, prefab=False):
+    """Write a synthetic JSON scene shaped like the editor template.
+
+    With prefab, entities are instances of one prefab that only
+    override their position.
+    """
+    rng = np.random.default_rng(seed)
+    positions = rng.uniform(0, 10_000, (count, 2)).round(2).tolist()
+    texture_ids = rng.integers(0, textures, count).tolist()
+    if prefab:
+        scene = {
+            "name": f"Synthetic {count}",
+            "prefabs": {"Enemy": {"components": [
+                {"type": "Transform"},
+                {"type": "Sprite", "texture": "tex_0.png", "layer": 1},
+                {"type": "RigidBody", "size": [24, 24]},
+            ]}},
+            "entities": [
+                {
+                    "name": f"Entity {i}",
+                    "prefab": "Enemy",
+                    "components": [{"type": "Transform", "position": positions[i]}],
+                }
+                for i in range(count)
+            ],
+        }
+    else:
+        scene = {
+            "name": f"Synthetic {count}",
+            "entities": [
+                {
+                    "name": f"Entity {i}",
+                    "components": [
+                        {"type": "Transform", "position": positions[i]},
+                        {"type": "Sprite", "texture": f"tex_{texture_ids[i]}.png"},
+                    ],
+                }
+                for i in range(count)
+            ],
+        }
+    with open(path, "w") as f:
+        json.dump(scene, f, indent=4)
+
+
+def measure(loader, path, repeat=3):
+    """Best-of wall time and peak traced allocation for one loader"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        world = loader(path)
+        best = min(best, time.perf_counter() - start)
+        del world
+    tracemalloc.start()
+    world = loader(path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best * 1000, peak / 2**20
+
+
+def bench(count, directory, prefab=False):
+    scene_path = os.path.join(directory, f"bench_{count}.scene")
+    write_scene(scene_path, count, prefab=prefab)
+    cooked_path = cook_scene(scene_path)
+    json_ms, json_mb = measure(load_scene, scene_path)
+    cooked_ms, cooked_mb = measure(load_cooked, cooked_path)
+    return {
+        "entities": count,
+        "json_ms": json_ms,
+        "json_peak_mb": json_mb,
+        "json_file_mb": os.path.getsize(scene_path) / 2**20,
+        "cooked_ms": cooked_ms,
+        "cooked_peak_mb": cooked_mb,
+        "cooked_file_mb": os.path.getsize(cooked_path) / 2**20,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare JSON and cooked scene loading")
+    parser.add_argument("--counts", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--prefab", action="store_true",
+                        help="entities are prefab instances overriding only position")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        for count in args.counts:
+            r = bench(count, directory, args.prefab)
+            print(
+                f"{r['entities']:>8} entities: "
+                f"json {r['json_ms']:.1f} ms ({r['json_file_mb']:.1f} MB file, "
+                f"{r['json_peak_mb']:.1f} MB peak) | "
+                f"cooked {r['cooked_ms']:.2f} ms ({r['cooked_file_mb']:.1f} MB file, "
+                f"{r['cooked_peak_mb']:.2f} MB peak)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""System scheduler benchmark: serial vs parallel updates.
+
+Four NumPy-heavy systems each own a different component type, plus one
+that reads all of them, so the first four can run side by side. Run
+from the repository root:
+
+    python -m benchmarks.bench_scheduler --count 200000 --workers 4
+"""
+import argparse
+import time
+
+import numpy as np
+
+from components.core.engine.ecs import World, ComponentType, Field
+from components.core.engine.scheduler import Scheduler
+
+LANES = [ComponentType(f"Lane{i}", value=Field(np.float32)) for i in range(4)]
+
+
+class LaneSystem:
+    """Does some transcendental math over one component column"""
+
+    reads = ()
+
+    def __init__(self, ctype):
+        self.name = ctype.name.lower()
+        self.writes = (ctype,)
+
+    def update(self, world, dt):
+        value = world.store(self.writes[0]).column("value")
+        np.sin(value, out=value)
+        np.sqrt(np.abs(value) + dt, out=value)
+        np.exp(-value, out=value)
+
+
+class SumSystem:
+    name = "sum"
+    reads = tuple(LANES)
+    writes = ()
+
+    def update(self, world, dt):
+        self.total = sum(float(world.store(c).column("value").sum()) for c in LANES)
+
+
+def build_world(count):
+    world = World()
+    eids = world.create_entities(count)
+    rng = np.random.default_rng(0)
+    for ctype in LANES:
+        world.register(ctype)
+        world.add_components(ctype, eids, value=rng.random(count, dtype=np.float32))
+    return world
+
+
+def bench(count, workers, frames=30):
+    world = build_world(count)
+    scheduler = Scheduler([LaneSystem(c) for c in LANES] + [SumSystem()], workers=workers)
+    scheduler.run(world, 1 / 60)
+    timings, parallel, speedup = [], [], []
+    for _ in range(frames):
+        start = time.perf_counter()
+        scheduler.run(world, 1 / 60)
+        timings.append(time.perf_counter() - start)
+        parallel.append(scheduler.parallel)
+        speedup.append(scheduler.speedup)
+    scheduler.shutdown()
+    ms = np.median(timings) * 1000
+    print(f"  workers={workers}: {ms:7.2f} ms/update, "
+          f"{np.mean(parallel):.0%} of update parallel, "
+          f"{np.mean(speedup):.2f}x busy/wall")
+    return ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the system scheduler")
+    parser.add_argument("--count", type=int, default=200_000)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+    print(f"{args.count} entities, 5 systems")
+    serial = bench(args.count, 1)
+    parallel = bench(args.count, args.workers)
+    print(f"  speedup {serial / parallel:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
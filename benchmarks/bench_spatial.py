@@ -0,0 +1,69 @@
+"""Spatial index benchmark against linear scans.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_spatial --count 100000
+"""
+import argparse
+import time
+
+import numpy as np
+
+from components.core.engine.ecs import World, Transform
+from components.core.engine.spatial import SpatialIndex
+
+
+def timed(fn, repeat=20):
+    """Mean milliseconds per call"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    return (time.perf_counter() - start) / repeat * 1000, result
+
+
+def bench(count, moving=0.01, seed=0):
+    rng = np.random.default_rng(seed)
+    extent = np.sqrt(count) * 64
+    world = World()
+    eids = world.create_entities(count)
+    world.add_components(Transform, eids, position=rng.uniform(0, extent, (count, 2)))
+    position = world.store(Transform).columns["position"]
+
+    index = SpatialIndex()
+    build_ms, _ = timed(lambda: SpatialIndex().sync(world), repeat=1)
+    index.sync(world)
+
+    def move():
+        movers = rng.choice(count, int(count * moving), replace=False)
+        position[movers] += rng.uniform(-64, 64, (len(movers), 2))
+        return index.sync(world)
+
+    sync_ms, moved = timed(move)
+    idle_ms, _ = timed(lambda: index.sync(world))
+
+    lo = np.array([extent / 2, extent / 2])
+    hi = lo + (1280, 720)
+    view_ms, visible = timed(lambda: index.query_aabb(lo, hi))
+    scan_ms, _ = timed(lambda: np.flatnonzero(np.all(
+        (position[:count] >= lo) & (position[:count] <= hi), axis=1)))
+    radius_ms, near = timed(lambda: index.query_radius(lo, 200.0))
+
+    print(f"{count} entities in {extent:.0f}x{extent:.0f} world")
+    print(f"  build          {build_ms:8.2f} ms")
+    print(f"  sync {moving:.0%} moved  {sync_ms:8.2f} ms ({moved} changed cell)")
+    print(f"  sync idle      {idle_ms:8.2f} ms")
+    print(f"  viewport query {view_ms:8.3f} ms ({len(visible)} visible, linear scan {scan_ms:.3f} ms)")
+    print(f"  radius query   {radius_ms:8.3f} ms ({len(near)} within 200)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the spatial index")
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--moving", type=float, default=0.01,
+                        help="fraction of entities moved per sync")
+    args = parser.parse_args()
+    bench(args.count, args.moving)
+
+
+if __name__ == "__main__":
+    main()
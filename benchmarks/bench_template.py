@@ -0,0 +1,91 @@
+"""Project creation benchmark: copytree + JSON patch vs manifest-driven creation.
+
+Builds a synthetic starter template (the editor template plus many
+asset files) and times creating projects from it both ways. Run from
+the repository root:
+
+    python -m benchmarks.bench_template --assets 500 --asset-kb 256
+"""
+import argparse
+import json
+import os
+import shutil
+import tempfile
+import time
+
+import numpy as np
+
+from components.core.engine.engine import TEMPLATE_PATH
+from components.manager.templates import create_project, save_manifest, MANIFEST_NAME
+
+
+def build_template(directory, assets, asset_kb, seed=0):
+    rng = np.random.default_rng(seed)
+    shutil.copytree(TEMPLATE_PATH, directory, ignore=shutil.ignore_patterns(MANIFEST_NAME))
+    for i in range(assets):
+        folder = os.path.join(directory, "assets", f"pack{i % 10}")
+        os.makedirs(folder, exist_ok=True)
+        with open(os.path.join(folder, f"asset_{i}.bin"), "wb") as f:
+            f.write(rng.bytes(asset_kb * 1024))
+    save_manifest(directory)
+
+
+def copytree_create(template, project, name):
+    """What project creation did before: copy everything, then patch JSON"""
+    shutil.copytree(template, project, dirs_exist_ok=True)
+    axie_path = os.path.join(project, "project.axie")
+    with open(axie_path, "r") as f:
+        data = json.load(f)
+    data["name"] = name
+    with open(axie_path, "w") as f:
+        json.dump(data, f, indent=2)
+
+
+def timed(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def bench(assets, asset_kb, repeat=3):
+    values = {"PROJECT_NAME": "Bench", "VERSION": "0.1dev1",
+              "CREATED_DATE": "2026-01-01 00:00", "MODIFIED_DATE": "2026-01-01 00:00"}
+    with tempfile.TemporaryDirectory() as directory:
+        template = os.path.join(directory, "template")
+        build_template(template, assets, asset_kb)
+        counter = iter(range(1_000_000))
+
+        def target():
+            return os.path.join(directory, f"project_{next(counter)}")
+
+        old_ms = timed(lambda: copytree_create(template, target(), "Bench"), repeat)
+        methods = {}
+
+        def manifest_create(hardlink=False):
+            methods.update(create_project(template, target(), values, hardlink=hardlink))
+
+        new_ms = timed(manifest_create, repeat)
+        copy_methods = dict(methods)
+        methods.clear()
+        link_ms = timed(lambda: manifest_create(hardlink=True), repeat)
+
+    total_mb = assets * asset_kb / 1024
+    print(f"Template with {assets} assets ({total_mb:.0f} MB)")
+    print(f"  copytree + patch      {old_ms:8.1f} ms")
+    print(f"  manifest, parallel    {new_ms:8.1f} ms  {copy_methods}")
+    print(f"  manifest, hardlinks   {link_ms:8.1f} ms  {methods}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark project creation from a template")
+    parser.add_argument("--assets", type=int, default=500)
+    parser.add_argument("--asset-kb", type=int, default=256)
+    args = parser.parse_args()
+    bench(args.assets, args.asset_kb)
+
+
+if __name__ == "__main__":
+    main()
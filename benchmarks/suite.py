@@ -0,0 +1,312 @@
+"""Benchmark suite for the engine and Project Manager hot paths.
+
+Runs every benchmark on synthetic data, compares the results with the
+stored baseline and exits non-zero if any timing regressed by more than
+the threshold. Run from the repository root:
+
+    python -m benchmarks.suite                     # compare with the baseline
+    python -m benchmarks.suite --save-baseline     # record a new baseline
+    python -m benchmarks.suite --scale 10 --only physics_step scene_load
+
+``--scale`` multiplies the synthetic sizes (10k entities and 1k projects
+at scale 1). Baselines are stored per scale in benchmarks/baseline.json
+together with a description of the machine they were recorded on;
+timings only compare meaningfully on the same machine, so record a
+baseline locally before using the suite as a gate.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import numpy as np
+
+from benchmarks import bench_physics, bench_render, bench_scene_load
+from components.core.engine.cooked import cook_scene, load_cooked
+from components.core.engine.ecs import Transform, Sprite
+from components.core.engine.physics import PhysicsSystem
+from components.core.engine.scene import load_scene
+from components.manager.registry import ProjectRegistry
+from components.manager.templates import create_project
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE_PATH = os.path.join(ROOT, "benchmarks", "baseline.json")
+TEMPLATE_DIR = os.path.join(ROOT, "components", "core", "editor", "template")
+ENTITIES = 10_000
+PROJECTS = 1_000
+
+
+def best_ms(fn, repeat=5):
+    """Fastest of repeat calls, in milliseconds"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def make_projects(directory, count):
+    """count projects created from the editor template, registered in a fresh registry"""
+    registry = ProjectRegistry(os.path.join(directory, "projects.db"), legacy_json=None)
+    stamp = datetime.now().strftime("%Y-%m-%d %H:%M")
+    projects = []
+    for i in range(count):
+        path = os.path.join(directory, "projects", f"project_{i:05d}")
+        create_project(TEMPLATE_DIR, path, {
+            "PROJECT_NAME": f"Project {i}",
+            "VERSION": "0.1dev1",
+            "CREATED_DATE": stamp,
+            "MODIFIED_DATE": stamp,
+        }, workers=1)
+        projects.append({"path": path, "name": f"Project {i}", "version": "0.1dev1",
+                         "created": stamp, "modified": stamp})
+    with registry.conn:
+        for project in projects:
+            registry._insert(project)
+    return registry
+
+
+def bench_scene_loading(scale, directory):
+    count = int(ENTITIES * scale)
+    path = os.path.join(directory, "suite.scene")
+    bench_scene_load.write_scene(path, count)
+    cooked = cook_scene(path)
+    return {
+        "json_ms": best_ms(lambda: load_scene(path), 3),
+        "cooked_ms": best_ms(lambda: load_cooked(cooked), 10),
+    }
+
+
+def bench_entity_iteration(scale, directory):
+    count = int(ENTITIES * scale)
+    world, _ = bench_render.build_scene(count)
+    transforms = world.store(Transform)
+    sprites = world.store(Sprite)
+
+    def view():
+        # The array path systems use: join, then gather whole columns
+        eids, (t, s) = world.view(Transform, Sprite)
+        return transforms.column("position")[t][:, 0].sum() + sprites.column("layer")[s].sum()
+
+    def per_entity():
+        total = 0.0
+        for eid in transforms.entity_ids():
+            total += transforms.get(eid)["position"][0]
+        return total
+
+    return {
+        "view_ms": best_ms(view),
+        "per_entity_ms": best_ms(per_entity, 3),
+    }
+
+
+def bench_physics_step(scale, directory):
+    world = bench_physics.build_world(int(ENTITIES * scale))
+    physics = PhysicsSystem()
+    for _ in range(5):
+        physics.step(world, physics.fixed_dt)
+    return {"step_ms": best_ms(lambda: physics.step(world, physics.fixed_dt), 20)}
+
+
+def bench_render_batches(scale, directory):
+    world, renderer = bench_render.build_scene(int(ENTITIES * scale))
+    renderer.render(world)
+    return {"batch_ms": best_ms(lambda: renderer.build_batches(world), 20)}
+
+
+def bench_scan_projects(scale, directory):
+    """Project scan: read every project.axie, write back changes.
+
+    Runs the Project Manager's read_project_file and apply_project_file
+    on a pool and saves the changed entries, as its background scan
+    does, minus the Tk polling. The first scan finds every project
+    changed; the second finds none and measures the mtime/size check
+    alone.
+    """
+    from components.manager.project_manager import read_project_file, apply_project_file
+
+    registry = make_projects(directory, int(PROJECTS * scale))
+    pool = ThreadPoolExecutor(max_workers=min(8, (os.cpu_count() or 1) + 4))
+
+    def scan():
+        projects = registry.all()
+        updated = []
+        for project, result in zip(projects, pool.map(read_project_file, projects)):
+            if result is not None:
+                apply_project_file(project, result)
+                updated.append(project)
+        if updated:
+            registry.update(updated)
+        return len(updated)
+
+    start = time.perf_counter()
+    changed = scan()
+    cold_ms = (time.perf_counter() - start) * 1000
+    unchanged_ms = best_ms(scan, 3)
+    pool.shutdown()
+    registry.close()
+    return {"projects": changed, "cold_ms": cold_ms, "unchanged_ms": unchanged_ms}
+
+
+def bench_refresh_project_list(scale, directory):
+    """Reload the sorted and filtered list, then re-bind the visible cards.
+
+    Binding the cards needs a display; without one only the registry
+    side is measured and refresh_ms is left out.
+    """
+    import tkinter
+    import customtkinter as ctk
+    from components.manager.project_list import VirtualProjectList
+
+    registry = make_projects(directory, int(PROJECTS * scale))
+    result = {
+        "search_all_ms": best_ms(lambda: registry.search("")),
+        "search_text_ms": best_ms(lambda: registry.search("ject 1")),
+    }
+    try:
+        app = ctk.CTk()
+    except tkinter.TclError:
+        registry.close()
+        return result
+    app.geometry("800x600")
+    project_list = VirtualProjectList(app, None, lambda project: None)
+    project_list.pack(fill="both", expand=True)
+    app.update()
+
+    def refresh():
+        project_list.set_projects(registry.search(""))
+        app.update_idletasks()
+
+    result["refresh_ms"] = best_ms(refresh)
+    app.destroy()
+    registry.close()
+    return result
+
+
+def bench_cold_startup(scale, directory):
+    """Fresh interpreter running Main.py headless for one frame"""
+    command = [sys.executable, os.path.join(ROOT, "Main.py"), "--headless", "--frames", "1"]
+
+    def start():
+        subprocess.run(command, cwd=ROOT, stdout=subprocess.DEVNULL,
+                       stderr=subprocess.DEVNULL, check=True)
+
+    return {"startup_ms": best_ms(start, 3)}
+
+
+BENCHMARKS = {
+    "scene_load": bench_scene_loading,
+    "entity_iteration": bench_entity_iteration,
+    "physics_step": bench_physics_step,
+    "render_batches": bench_render_batches,
+    "scan_projects": bench_scan_projects,
+    "refresh_project_list": bench_refresh_project_list,
+    "cold_startup": bench_cold_startup,
+}
+
+
+def machine():
+    return {
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpus": os.cpu_count(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+    }
+
+
+def load_baseline(path):
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {"machine": None, "scales": {}}
+
+
+def compare(results, baseline, threshold, noise_ms):
+    """Timings slower than baseline by more than threshold (and noise_ms)"""
+    regressions = []
+    for name, metrics in results.items():
+        for metric, value in metrics.items():
+            old = baseline.get(name, {}).get(metric)
+            if not metric.endswith("_ms") or old is None:
+                continue
+            if value > old * (1 + threshold) and value - old > noise_ms:
+                regressions.append((name, metric, old, value))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the benchmark suite and check for regressions")
+    parser.add_argument("--scale", type=float, default=1.0,
+                        help="multiplier for synthetic sizes (10k entities, 1k projects)")
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), help="benchmarks to run")
+    parser.add_argument("--rounds", type=int, default=3,
+                        help="run each benchmark this many times and keep the best")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="store these results as the baseline instead of comparing")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="allowed slowdown before failing (0.25 = 25%%)")
+    parser.add_argument("--noise-ms", type=float, default=1.0,
+                        help="ignore slowdowns smaller than this")
+    parser.add_argument("--report", help="write the results as JSON here")
+    args = parser.parse_args()
+
+    names = args.only or list(BENCHMARKS)
+    scale_key = f"{args.scale:g}"
+    baseline = load_baseline(args.baseline)
+    if not args.save_baseline and baseline.get("machine") not in (None, machine()):
+        print("Warning: baseline was recorded on a different machine")
+    stored = baseline["scales"].get(scale_key, {})
+
+    results = {}
+    for name in names:
+        # Keep each timing's best round, so a busy moment on the machine
+        # doesn't read as a regression
+        for _ in range(args.rounds):
+            with tempfile.TemporaryDirectory() as directory:
+                metrics = BENCHMARKS[name](args.scale, directory)
+            best = results.setdefault(name, metrics)
+            for metric, value in metrics.items():
+                if metric.endswith("_ms"):
+                    best[metric] = min(best[metric], value)
+        metrics = ", ".join(
+            f"{metric} {value:.2f}" if isinstance(value, float) else f"{metric} {value}"
+            for metric, value in results[name].items())
+        print(f"{name:>22}: {metrics}")
+
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump({"scale": args.scale, "results": results}, f, indent=2)
+
+    if args.save_baseline:
+        baseline["machine"] = machine()
+        baseline["scales"][scale_key] = {**stored, **results}
+        with open(args.baseline, "w") as f:
+            json.dump(baseline, f, indent=2)
+        print(f"Saved baseline for scale {scale_key} to {args.baseline}")
+        return 0
+
+    if not stored:
+        print(f"No baseline for scale {scale_key}; run with --save-baseline first")
+        return 0
+    regressions = compare(results, stored, args.threshold, args.noise_ms)
+    for name, metric, old, value in regressions:
+        print(f"REGRESSION {name}.{metric}: {old:.2f} -> {value:.2f} ms "
+              f"(+{(value / old - 1) * 100:.0f}%)")
+    if regressions:
+        return 1
+    print(f"No regressions over {args.threshold * 100:.0f}%")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,280 @@
+"""Incremental asset pipeline.
+
+Source assets are imported into ready-to-use buffers under
+``<project>/.axion/assets``. Every import is keyed on the content hash of
+the source plus its import settings, so only changed assets are
+re-imported and reverting a file hits the cache again until the next
+build prunes imports no source refers to. A manifest records each
+source's mtime/size so unchanged files aren't even re-hashed.
+
+Build a project's assets from the repository root with:
+
+    python -m components.core.engine.assets path/to/project
+"""
+import argparse
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from PIL import Image
+
+from components.core.engine.renderer import TextureAtlas
+
+CACHE_DIR = os.path.join(".axion", "assets")
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp", ".gif")
+# Bump when an importer's output changes so old cache entries are ignored
+IMPORTER_VERSION = 1
+
+
+def hash_file(path, chunk_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def cache_key(content_hash, settings):
+    """Key for an import result: source content plus how it was imported"""
+    recipe = json.dumps([IMPORTER_VERSION, content_hash, settings], sort_keys=True)
+    return hashlib.sha256(recipe.encode("utf-8")).hexdigest()
+
+
+def import_image(source, output, settings):
+    """Decode an image into an RGBA uint8 array saved as .npy"""
+    with Image.open(source) as img:
+        pixels = np.asarray(img.convert("RGBA"))
+    if settings.get("premultiply_alpha"):
+        alpha = pixels[:, :, 3:].astype(np.uint16)
+        rgb = (pixels[:, :, :3] * alpha + 127) // 255
+        pixels = np.concatenate((rgb.astype(np.uint8), pixels[:, :, 3:]), axis=2)
+    np.save(output, pixels)
+
+
+def _process_asset(source, settings, cache_dir):
+    """Worker job: hash one source and import it on a cache miss"""
+    content_hash = hash_file(source)
+    key = cache_key(content_hash, settings)
+    output = os.path.join(cache_dir, key + ".npy")
+    imported = False
+    if not os.path.exists(output):
+        # Write to a temporary name so a crash never leaves a bad entry
+        partial = output + f".{os.getpid()}.tmp.npy"
+        import_image(source, partial, settings)
+        os.replace(partial, output)
+        imported = True
+    return content_hash, key, imported
+
+
+class AssetPipeline:
+    """Builds and caches a project's imported assets"""
+
+    def __init__(self, project_path, workers=None):
+        self.project_path = project_path
+        self.cache_dir = os.path.join(project_path, CACHE_DIR)
+        self.manifest_path = os.path.join(self.cache_dir, "manifest.json")
+        self.workers = workers
+        self.manifest = self._load_manifest()
+
+    def _load_manifest(self):
+        try:
+            with open(self.manifest_path, "r") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {"assets": {}, "atlas": None}
+
+    def _save_manifest(self):
+        partial = self.manifest_path + ".tmp"
+        with open(partial, "w") as f:
+            json.dump(self.manifest, f, indent=2)
+        os.replace(partial, self.manifest_path)
+
+    def sources(self):
+        """Asset names and import settings declared by the project.
+
+        Entries in project.axie "assets" may be plain paths or
+        {"path": ..., "settings": {...}}. Images in the project's assets/
+        folder are picked up with default settings.
+        """
+        with open(os.path.join(self.project_path, "project.axie"), "r") as f:
+            declared = json.load(f).get("assets", [])
+
+        sources = {}
+        assets_dir = os.path.join(self.project_path, "assets")
+        if os.path.isdir(assets_dir):
+            for root, _, files in os.walk(assets_dir):
+                for name in files:
+                    if name.lower().endswith(IMAGE_EXTENSIONS):
+                        path = os.path.join(root, name)
+                        sources[os.path.relpath(path, assets_dir).replace(os.sep, "/")] = {}
+        for entry in declared:
+            if isinstance(entry, str):
+                sources.setdefault(entry, {})
+            else:
+                sources[entry["path"]] = entry.get("settings", {})
+        return sources
+
+    def source_path(self, name):
+        path = os.path.join(self.project_path, "assets", name)
+        if not os.path.exists(path):
+            path = os.path.join(self.project_path, name)
+        return path
+
+    def build(self):
+        """Bring the cache up to date and return a summary of the work done"""
+        start = time.perf_counter()
+        os.makedirs(self.cache_dir, exist_ok=True)
+        known = self.manifest["assets"]
+        sources = self.sources()
+
+        # Only sources whose stat or settings changed need hashing
+        pending = {}
+        for name, settings in sources.items():
+            path = self.source_path(name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                print(f"Missing asset: {name}")
+                continue
+            entry = known.get(name)
+            if (
+                entry
+                and entry["mtime"] == stat.st_mtime_ns
+                and entry["size"] == stat.st_size
+                and entry["settings"] == settings
+                and os.path.exists(self.output_path(name, entry))
+            ):
+                continue
+            pending[name] = (path, settings, stat)
+
+        imported = 0
+        if pending:
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                futures = {
+                    name: pool.submit(_process_asset, path, settings, self.cache_dir)
+                    for name, (path, settings, _) in pending.items()
+                }
+                for name, future in futures.items():
+                    _, settings, stat = pending[name]
+                    try:
+                        content_hash, key, was_imported = future.result()
+                    except Exception as e:
+                        print(f"Failed to import {name}: {str(e)}")
+                        continue
+                    known[name] = {
+                        "mtime": stat.st_mtime_ns,
+                        "size": stat.st_size,
+                        "settings": settings,
+                        "hash": content_hash,
+                        "key": key,
+                    }
+                    imported += was_imported
+
+        for name in list(known):
+            if name not in sources:
+                del known[name]
+
+        atlas_built = self._build_atlas()
+        self._save_manifest()
+        self._prune()
+        return {
+            "assets": len(sources),
+            "checked": len(pending),
+            "imported": imported,
+            "atlas_built": atlas_built,
+            "seconds": time.perf_counter() - start,
+        }
+
+    def output_path(self, name, entry=None):
+        entry = entry or self.manifest["assets"][name]
+        return os.path.join(self.cache_dir, entry["key"] + ".npy")
+
+    def load_image(self, name):
+        """Decoded RGBA buffer for an asset, or None if it isn't built"""
+        entry = self.manifest["assets"].get(name)
+        if entry is None:
+            return None
+        return np.load(self.output_path(name, entry), mmap_mode="r")
+
+    def _build_atlas(self):
+        """Pack every imported image into atlas pages, keyed like an import"""
+        assets = self.manifest["assets"]
+        key = cache_key(sorted((n, e["key"]) for n, e in assets.items()), {"atlas": True})
+        current = self.manifest.get("atlas")
+        if current and current["key"] == key and all(
+            os.path.exists(p) for p in self.atlas_page_paths(current)
+        ):
+            return False
+
+        atlas = TextureAtlas()
+        # Largest first packs shelves noticeably tighter
+        names = sorted(assets, key=lambda n: -self.load_image(n).shape[0])
+        for name in names:
+            pixels = self.load_image(name)
+            height, width = pixels.shape[:2]
+            if width > atlas.page_size or height > atlas.page_size:
+                # Still imported on its own, just not packed
+                print(f"Asset {name} ({width}x{height}) is larger than an atlas page, "
+                      f"leaving it out of the atlas")
+                continue
+            atlas.add(name, Image.fromarray(np.asarray(pixels), "RGBA"))
+        for page, pixels in enumerate(atlas.pages):
+            np.save(os.path.join(self.cache_dir, f"{key}.atlas{page}.npy"), pixels)
+        if current and current["key"] != key:
+            for path in self.atlas_page_paths(current):
+                if os.path.exists(path):
+                    os.remove(path)
+        self.manifest["atlas"] = {
+            "key": key,
+            "pages": len(atlas.pages),
+            "regions": atlas.regions,
+        }
+        return True
+
+    def _prune(self):
+        """Delete imports and atlas pages the manifest no longer refers to"""
+        keep = {os.path.basename(self.output_path(name)) for name in self.manifest["assets"]}
+        if self.manifest.get("atlas"):
+            keep.update(os.path.basename(p) for p in self.atlas_page_paths())
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(".npy") and not name.endswith(".tmp.npy") and name not in keep:
+                try:
+                    os.remove(os.path.join(self.cache_dir, name))
+                except OSError as e:
+                    print(f"Error removing stale asset {name}: {str(e)}")
+
+    def atlas_page_paths(self, atlas=None):
+        atlas = atlas or self.manifest["atlas"]
+        return [
+            os.path.join(self.cache_dir, f"{atlas['key']}.atlas{page}.npy")
+            for page in range(atlas["pages"])
+        ]
+
+    def load_atlas(self):
+        """Prebuilt atlas pages and their regions by asset name"""
+        atlas = self.manifest.get("atlas")
+        if not atlas:
+            return [], {}
+        pages = [np.load(path) for path in self.atlas_page_paths(atlas)]
+        regions = {name: tuple(region) for name, region in atlas["regions"].items()}
+        return pages, regions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build a project's assets")
+    parser.add_argument("project", help="project directory containing project.axie")
+    parser.add_argument("--workers", type=int, help="worker processes for imports")
+    args = parser.parse_args()
+    result = AssetPipeline(args.project, args.workers).build()
+    print(
+        f"{result['assets']} assets, {result['checked']} checked, "
+        f"{result['imported']} imported, atlas {'rebuilt' if result['atlas_built'] else 'cached'} "
+        f"in {result['seconds']:.2f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""Cooked (binary) scene format.
+
+A cooked scene is produced from a JSON ``.scene`` file and holds the same
+World in columnar form::
+
+    b"AXSCENE\\0" | u64 header size | JSON header | padding | data blocks
+
+The header lists every array (entity names, string table, and one block
+per component field) with its dtype, shape and offset into the data
+section. Blocks are 64-byte aligned so they can be mapped straight into
+NumPy arrays. Loading maps the file copy-on-write, so component columns
+are zero-copy views until a system writes to them.
+
+Cook a scene from the repository root with:
+
+    python -m components.core.engine.cooked path/to/main.scene
+"""
+import argparse
+import json
+import mmap
+import os
+import struct
+
+import numpy as np
+
+from components.core.engine.ecs import World, ComponentType, ComponentStore, Field
+from components.core.engine.scene import load_scene
+from components.core.engine.prefab import Prefab
+
+MAGIC = b"AXSCENE\0"
+VERSION = 1
+ALIGNMENT = 64
+EXTENSION = ".cscene"
+
+
+def _align(offset):
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+class _BlockWriter:
+    """Lays out arrays back to back and records where each one went"""
+
+    def __init__(self):
+        self.arrays = []
+        self.size = 0
+
+    def add(self, array):
+        array = np.ascontiguousarray(array)
+        offset = _align(self.size)
+        self.arrays.append((offset, array))
+        self.size = offset + array.nbytes
+        return {"offset": offset, "dtype": array.dtype.str, "shape": list(array.shape)}
+
+    def write(self, f):
+        start = f.tell()
+        for offset, array in self.arrays:
+            f.write(b"\0" * (start + offset - f.tell()))
+            f.write(array.tobytes())
+
+
+def save_cooked(world, path):
+    """Write a World to a cooked scene file"""
+    blocks = _BlockWriter()
+    count = world.entity_count
+
+    # Strings are stored NUL-separated so loading is one decode and split
+    strings = "\0".join(world.strings.strings).encode("utf-8")
+
+    header = {
+        "version": VERSION,
+        "entities": count,
+        "names": blocks.add(world.names[:count]),
+        "alive": blocks.add(world.alive[:count]),
+        "string_count": len(world.strings),
+        "strings": blocks.add(np.frombuffer(strings, dtype=np.uint8)),
+        "components": {},
+        "prefabs": {name: prefab.components for name, prefab in world.prefabs.items()},
+    }
+    for name, store in world.stores.items():
+        if not len(store):
+            continue
+        header["components"][name] = {
+            "entities": blocks.add(store.entity_ids()),
+            "sparse": blocks.add(store.sparse[:count]),
+            "fields": {
+                field_name: dict(
+                    blocks.add(store.column(field_name)),
+                    interned=field.interned,
+                )
+                for field_name, field in store.type.fields.items()
+            },
+        }
+
+    header_bytes = json.dumps(header, separators=(",", ":")).encode("utf-8")
+    data_start = _align(len(MAGIC) + 8 + len(header_bytes))
+    with open(path, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<Q", len(header_bytes)))
+        f.write(header_bytes)
+        f.write(b"\0" * (data_start - f.tell()))
+        blocks.write(f)
+
+
+def cook_scene(scene_path, out_path=None):
+    """Convert a JSON .scene file into a cooked scene next to it"""
+    if out_path is None:
+        out_path = os.path.splitext(scene_path)[0] + EXTENSION
+    save_cooked(load_scene(scene_path), out_path)
+    return out_path
+
+
+def load_cooked(path):
+    """Map a cooked scene file and build a World over it"""
+    with open(path, "rb") as f:
+        # Private mapping: arrays are writable but changes never reach disk
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+
+    if buffer[:len(MAGIC)] != MAGIC:
+        raise ValueError(f"Not a cooked scene: {path}")
+    (header_size,) = struct.unpack_from("<Q", buffer, len(MAGIC))
+    header_start = len(MAGIC) + 8
+    header = json.loads(bytes(buffer[header_start:header_start + header_size]))
+    if header["version"] != VERSION:
+        raise ValueError(f"Unsupported cooked scene version: {header['version']}")
+    data_start = _align(header_start + header_size)
+
+    def view(block):
+        dtype = np.dtype(block["dtype"])
+        shape = tuple(block["shape"])
+        count = int(np.prod(shape)) if shape else 1
+        array = np.frombuffer(buffer, dtype=dtype, count=count,
+                              offset=data_start + block["offset"])
+        return array.reshape(shape)
+
+    world = World(capacity=1)
+    world.mapping = buffer
+
+    if header["string_count"]:
+        strings = view(header["strings"]).tobytes().decode("utf-8").split("\0")
+        world.strings.strings = strings
+        world.strings.ids = dict(zip(strings, range(len(strings))))
+
+    for name, components in header.get("prefabs", {}).items():
+        world.prefabs[name] = Prefab(name, components)
+
+    count = header["entities"]
+    world.entity_count = count
+    world.names = view(header["names"])
+    world.alive = view(header["alive"])
+    world.rebuild_free_list()
+
+    for name, block in header["components"].items():
+        ctype = world.types.get(name)
+        if ctype is None:
+            # Types the engine doesn't know are rebuilt from the file layout
+            ctype = ComponentType(name, **{
+                field_name: Field(f["dtype"], f["shape"][1:], interned=f["interned"])
+                for field_name, f in block["fields"].items()
+            })
+            world.register(ctype)
+        store = world.stores[name] = ComponentStore(ctype, capacity=1)
+        store.entities = view(block["entities"])
+        store.sparse = view(block["sparse"])
+        store.count = len(store.entities)
+        for field_name in ctype.fields:
+            store.columns[field_name] = view(block["fields"][field_name])
+
+    return world
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cook .scene files into binary scenes")
+    parser.add_argument("scenes", nargs="+", help=".scene files to cook")
+    args = parser.parse_args()
+    for scene_path in args.scenes:
+        print(f"Cooked {scene_path} -> {cook_scene(scene_path)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,785 @@
+import threading
+
+import numpy as np
+
+
+class Field:
+    """A single column of a component type"""
+
+    def __init__(self, dtype, shape=(), default=0, interned=False):
+        self.dtype = np.dtype(dtype)
+        self.shape = tuple(shape)
+        self.default = default
+        # Interned fields hold strings in the scene and string-table ids in memory
+        self.interned = interned
+
+
+class ComponentType:
+    """Column layout for one kind of component"""
+
+    def __init__(self, name, **fields):
+        self.name = name
+        self.fields = fields
+
+    def __repr__(self):
+        return f"ComponentType({self.name!r})"
+
+
+Transform = ComponentType(
+    "Transform",
+    position=Field(np.float32, (2,)),
+    rotation=Field(np.float32),
+    scale=Field(np.float32, (2,), default=1.0),
+)
+
+Sprite = ComponentType(
+    "Sprite",
+    texture=Field(np.int32, default=-1, interned=True),
+    layer=Field(np.int32),
+)
+
+RigidBody = ComponentType(
+    "RigidBody",
+    velocity=Field(np.float32, (2,)),
+    size=Field(np.float32, (2,), default=32.0),
+    gravity_scale=Field(np.float32, default=1.0),
+)
+
+# Which prefab an entity was instanced from
+PrefabInstance = ComponentType(
+    "PrefabInstance",
+    prefab=Field(np.int32, default=-1, interned=True),
+)
+
+# Spawns particles at the entity's Transform; ranges are [min, max],
+# angles in degrees (0 points along +x, -90 straight up)
+ParticleEmitter = ComponentType(
+    "ParticleEmitter",
+    texture=Field(np.int32, default=-1, interned=True),
+    layer=Field(np.int32),
+    rate=Field(np.float32, default=100.0),
+    lifetime=Field(np.float32, (2,), default=1.0),
+    speed=Field(np.float32, (2,), default=100.0),
+    angle=Field(np.float32, default=-90.0),
+    spread=Field(np.float32, default=30.0),
+    radius=Field(np.float32),
+    gravity_scale=Field(np.float32, default=1.0),
+    max_particles=Field(np.int32, default=10000),
+)
+
+BUILTIN_COMPONENTS = [Transform, Sprite, RigidBody, PrefabInstance, ParticleEmitter]
+
+
+class StringTable:
+    """Interns strings (entity names, texture paths) to integer ids"""
+
+    def __init__(self):
+        self.strings = []
+        self.ids = {}
+
+    def intern(self, value):
+        index = self.ids.get(value)
+        if index is None:
+            index = len(self.strings)
+            self.strings.append(value)
+            self.ids[value] = index
+        return index
+
+    def lookup(self, index):
+        return self.strings[index] if index >= 0 else None
+
+    def __len__(self):
+        return len(self.strings)
+
+
+def _grow(array, capacity, fill=None):
+    """Return a copy of array resized along axis 0 to capacity"""
+    grown = np.empty((capacity,) + array.shape[1:], dtype=array.dtype)
+    grown[:len(array)] = array
+    if fill is not None:
+        grown[len(array):] = fill
+    return grown
+
+
+class ComponentStore:
+    """Sparse set holding every instance of one component type.
+
+    Component data lives in packed NumPy columns (one array per field) so
+    systems can work on ``column(name)`` as a contiguous block. ``entities``
+    maps dense slots back to entity ids and ``sparse`` maps entity ids to
+    dense slots (-1 when the entity has no such component). Queries
+    involving the type are told about every add and remove.
+    """
+
+    def __init__(self, ctype, capacity=64):
+        self.type = ctype
+        self.count = 0
+        self.queries = []
+        self.entities = np.empty(capacity, dtype=np.int64)
+        self.sparse = np.full(capacity, -1, dtype=np.int64)
+        self.columns = {
+            name: np.empty((capacity,) + field.shape, dtype=field.dtype)
+            for name, field in ctype.fields.items()
+        }
+
+    def __len__(self):
+        return self.count
+
+    def _reserve(self, count):
+        capacity = len(self.entities)
+        if count <= capacity:
+            return
+        capacity = max(capacity, 1)
+        while capacity < count:
+            capacity *= 2
+        self.entities = _grow(self.entities, capacity)
+        for name, column in self.columns.items():
+            self.columns[name] = _grow(column, capacity)
+
+    def _reserve_entity(self, eid):
+        capacity = len(self.sparse)
+        if eid < capacity:
+            return
+        capacity = max(capacity, 1)
+        while capacity <= eid:
+            capacity *= 2
+        self.sparse = _grow(self.sparse, capacity, fill=-1)
+
+    def contains(self, eid):
+        return eid < len(self.sparse) and self.sparse[eid] >= 0
+
+    def index(self, eid):
+        return int(self.sparse[eid]) if eid < len(self.sparse) else -1
+
+    def column(self, name):
+        """Packed view of a field for every live component"""
+        return self.columns[name][:self.count]
+
+    def entity_ids(self):
+        return self.entities[:self.count]
+
+    def add(self, eid, values):
+        """Add (or overwrite) the component on a single entity"""
+        self._reserve_entity(eid)
+        slot = self.sparse[eid]
+        if slot < 0:
+            self._reserve(self.count + 1)
+            slot = self.count
+            self.count += 1
+            self.entities[slot] = eid
+            self.sparse[eid] = slot
+            for query in self.queries:
+                query.added(np.array([eid], dtype=np.int64))
+        for name, field in self.type.fields.items():
+            self.columns[name][slot] = values.get(name, field.default)
+        return slot
+
+    def add_many(self, eids, values):
+        """Add the component to many entities at once.
+
+        ``values`` maps field names to arrays with one row per entity;
+        missing fields take their default. Entities that already have
+        the component are overwritten in place, as ``add`` does.
+        """
+        eids = np.asarray(eids, dtype=np.int64)
+        if not len(eids):
+            return
+        self._reserve_entity(int(eids.max()))
+        slots = self.sparse[eids]
+        existing = slots >= 0
+        if existing.any():
+            fresh = ~existing
+            rows = {}
+            for name, field in self.type.fields.items():
+                column = self.columns[name]
+                row = np.empty((len(eids),) + column.shape[1:], dtype=column.dtype)
+                row[:] = values.get(name, field.default)
+                column[slots[existing]] = row[existing]
+                rows[name] = row[fresh]
+            eids, values = eids[fresh], rows
+        n = len(eids)
+        if not n:
+            return
+        self._reserve(self.count + n)
+        start, end = self.count, self.count + n
+        self.entities[start:end] = eids
+        self.sparse[eids] = np.arange(start, end)
+        for name, field in self.type.fields.items():
+            self.columns[name][start:end] = values.get(name, field.default)
+        self.count = end
+        for query in self.queries:
+            query.added(eids)
+
+    def remove(self, eid):
+        """Remove the component, moving the last slot into the hole"""
+        slot = self.index(eid)
+        if slot < 0:
+            return False
+        last = self.count - 1
+        if slot != last:
+            moved = self.entities[last]
+            self.entities[slot] = moved
+            self.sparse[moved] = slot
+            for column in self.columns.values():
+                column[slot] = column[last]
+        self.sparse[eid] = -1
+        self.count = last
+        for query in self.queries:
+            query.removed(np.array([eid], dtype=np.int64))
+        return True
+
+    def remove_many(self, eids):
+        """Remove the component from many entities; returns how many had it.
+
+        Like ``remove`` but for a batch: the holes left inside the packed
+        range are filled from its tail, one array copy per column, so the
+        cost depends on how many are removed rather than how many remain.
+        """
+        eids = np.asarray(eids, dtype=np.int64)
+        eids = eids[eids < len(self.sparse)]
+        slots = self.sparse[eids]
+        slots = np.unique(slots[slots >= 0])
+        n = len(slots)
+        if not n:
+            return 0
+        count = self.count - n
+        removed = self.entities[slots]
+        self.sparse[removed] = -1
+        holes = slots[slots < count]
+        if len(holes):
+            # Tail slots that stay, moved down into the holes
+            keep = np.ones(n, dtype=bool)
+            keep[slots[slots >= count] - count] = False
+            tail = np.flatnonzero(keep) + count
+            moved = self.entities[tail]
+            self.entities[holes] = moved
+            self.sparse[moved] = holes
+            for column in self.columns.values():
+                column[holes] = column[tail]
+        self.count = count
+        for query in self.queries:
+            query.removed(removed)
+        return n
+
+    def restore(self, entities, columns):
+        """Replace every component with the given entity ids and column values"""
+        count = len(entities)
+        self._reserve(count)
+        if count:
+            self._reserve_entity(int(entities.max()))
+        self.sparse[:] = -1
+        self.entities[:count] = entities
+        if count:
+            self.sparse[entities] = np.arange(count)
+            for name, column in self.columns.items():
+                column[:count] = columns[name]
+        self.count = count
+        for query in self.queries:
+            query.rebuild()
+
+    def get(self, eid):
+        """Return the component on eid as a dict (for tools, not hot loops)"""
+        slot = self.index(eid)
+        if slot < 0:
+            return None
+        return {name: column[slot] for name, column in self.columns.items()}
+
+
+def _join(stores, entities=None):
+    """Entities (of the given ones, or all) present in every store"""
+    driver = None
+    if entities is None:
+        driver = min(stores, key=len)
+        entities = driver.entity_ids()
+    for store in stores:
+        if store is driver:
+            continue
+        in_range = entities < len(store.sparse)
+        entities = entities[in_range]
+        entities = entities[store.sparse[entities] >= 0]
+    return entities
+
+
+class Query:
+    """The entities carrying every one of some component types, kept current.
+
+    Built once by ``World.query``; after that the stores report each
+    add and remove, and only the entities involved are checked, so a
+    system reading ``view()`` every frame doesn't redo the join. Member
+    order is insertion order with removals filled from the end, which is
+    not the order ``World.view`` returns.
+    """
+
+    def __init__(self, stores):
+        self.stores = stores
+        self.members = np.empty(64, dtype=np.int64)
+        self.count = 0
+        # Position in members by entity id (-1 for non-members)
+        self.positions = np.full(64, -1, dtype=np.int64)
+        # Store slots of the members, recomputed after any change; systems
+        # running side by side may ask for them at the same time
+        self.slots = None
+        self.lock = threading.Lock()
+        for store in stores:
+            store.queries.append(self)
+        self.rebuild()
+
+    def __len__(self):
+        return self.count
+
+    def _reserve(self, count, eid):
+        capacity = len(self.members)
+        if count > capacity:
+            while capacity < count:
+                capacity *= 2
+            self.members = _grow(self.members, capacity)
+        capacity = len(self.positions)
+        if eid >= capacity:
+            while capacity <= eid:
+                capacity *= 2
+            self.positions = _grow(self.positions, capacity, fill=-1)
+
+    def rebuild(self):
+        """Redo the join from scratch (after a store was replaced wholesale)"""
+        self.positions[:] = -1
+        self.count = 0
+        self.slots = None
+        self.added(_join(self.stores))
+
+    def entities(self):
+        return self.members[:self.count]
+
+    def view(self):
+        """``(entities, slots)`` like ``World.view``, from the cache"""
+        with self.lock:
+            if self.slots is None:
+                members = self.members[:self.count]
+                self.slots = [store.sparse[members] for store in self.stores]
+            return self.members[:self.count], self.slots
+
+    def added(self, eids):
+        """Take in (unique) entities that now have every type; the others are ignored"""
+        if not len(eids):
+            return
+        eids = _join(self.stores, eids)
+        if not len(eids):
+            return
+        self._reserve(self.count + len(eids), int(eids.max()))
+        eids = eids[self.positions[eids] < 0]
+        start, end = self.count, self.count + len(eids)
+        self.members[start:end] = eids
+        self.positions[eids] = np.arange(start, end)
+        self.count = end
+        self.slots = None
+
+    def removed(self, eids):
+        """Drop (unique) entities that lost one of the types, filling holes from the end"""
+        # A store slot may have moved even if no member left
+        self.slots = None
+        eids = eids[eids < len(self.positions)]
+        positions = self.positions[eids]
+        positions = np.sort(positions[positions >= 0])
+        n = len(positions)
+        if not n:
+            return
+        count = self.count - n
+        self.positions[self.members[positions]] = -1
+        holes = positions[positions < count]
+        if len(holes):
+            keep = np.ones(n, dtype=bool)
+            keep[positions[positions >= count] - count] = False
+            tail = np.flatnonzero(keep) + count
+            moved = self.members[tail]
+            self.members[holes] = moved
+            self.positions[moved] = holes
+        self.count = count
+
+
+class World:
+    """Entity-component store backing a loaded scene.
+
+    Entity ids index the per-entity arrays directly. Destroyed ids go on
+    a free list and are handed out again by ``create_entity``, so a game
+    spawning and despawning all the time keeps its arrays (and every
+    store's sparse array) at a fixed size. Each id has a generation that
+    is bumped when it is destroyed: ``handle`` packs the two, and
+    ``resolve`` turns a handle back into an id only while that entity is
+    still alive. ``entity_count`` is the number of ids in use, live or
+    free.
+    """
+
+    def __init__(self, capacity=1024):
+        self.strings = StringTable()
+        self.stores = {}
+        self.types = {}
+        # Component type names interned to small ints, in registration order
+        self.type_ids = {}
+        # Cached queries by their types' ids
+        self.queries = {}
+        # Entity ids by name id, built on first lookup
+        self.name_index = None
+        self.names = np.full(capacity, -1, dtype=np.int32)
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.generations = np.zeros(capacity, dtype=np.uint32)
+        # Stack of destroyed ids; never longer than alive, so it never grows alone
+        self.free = np.empty(capacity, dtype=np.int64)
+        self.free_count = 0
+        # Entities despawned this frame, destroyed in one batch by flush_despawned
+        self.despawned = np.empty(64, dtype=np.int64)
+        self.despawned_count = 0
+        self.entity_count = 0
+        # Guards what systems on scheduler threads share: despawn and the query cache
+        self.lock = threading.Lock()
+        # Prefab definitions by name, for spawning at runtime
+        self.prefabs = {}
+        for ctype in BUILTIN_COMPONENTS:
+            self.register(ctype)
+
+    def register(self, ctype):
+        """Register a component type so entities can carry it"""
+        if ctype.name not in self.stores:
+            self.types[ctype.name] = ctype
+            self.type_ids[ctype.name] = len(self.type_ids)
+            self.stores[ctype.name] = ComponentStore(ctype)
+        return self.stores[ctype.name]
+
+    def store(self, ctype):
+        name = ctype if isinstance(ctype, str) else ctype.name
+        return self.stores[name]
+
+    def _reserve(self, count):
+        capacity = len(self.alive)
+        if count <= capacity:
+            return
+        capacity = max(capacity, 1)
+        while capacity < count:
+            capacity *= 2
+        self.names = _grow(self.names, capacity, fill=-1)
+        self.alive = _grow(self.alive, capacity, fill=False)
+        self.generations = _grow(self.generations, capacity, fill=0)
+        self.free = _grow(self.free, capacity)
+
+    def rebuild_free_list(self):
+        """Recompute the free ids after alive was replaced (e.g. a cooked load)"""
+        if len(self.generations) < len(self.alive):
+            self.generations = _grow(self.generations, len(self.alive), fill=0)
+            self.free = _grow(self.free, len(self.alive))
+        dead = np.flatnonzero(~self.alive[:self.entity_count])
+        self.free[:len(dead)] = dead[::-1]
+        self.free_count = len(dead)
+
+    def create_entity(self, name=None):
+        if self.free_count:
+            self.free_count -= 1
+            eid = int(self.free[self.free_count])
+        else:
+            eid = self.entity_count
+            self._reserve(eid + 1)
+            self.entity_count += 1
+        self.alive[eid] = True
+        if name is not None:
+            self.names[eid] = self.strings.intern(name)
+            self._index_names([eid])
+        return eid
+
+    def create_entities(self, count, names=None):
+        """Create count entities in one go and return their ids.
+
+        Free ids are used first, most recently destroyed first; the rest
+        are new ids in ascending order.
+        """
+        reused = min(count, self.free_count)
+        start = self.entity_count
+        fresh = count - reused
+        self._reserve(start + fresh)
+        self.entity_count += fresh
+        eids = np.empty(count, dtype=np.int64)
+        eids[:reused] = self.free[self.free_count - reused:self.free_count][::-1]
+        self.free_count -= reused
+        eids[reused:] = np.arange(start, start + fresh)
+        self.alive[eids] = True
+        if names is not None:
+            self.names[eids] = [
+                self.strings.intern(n) if n is not None else -1 for n in names
+            ]
+            self._index_names(eids)
+        return eids
+
+    def destroy_entity(self, eid):
+        if not self.is_alive(eid):
+            return
+        for store in self.stores.values():
+            store.remove(eid)
+        self._unindex_names([eid])
+        self.alive[eid] = False
+        self.names[eid] = -1
+        self.generations[eid] += 1
+        self.free[self.free_count] = eid
+        self.free_count += 1
+
+    def destroy_entities(self, eids):
+        """Destroy many entities, removing their components in bulk.
+
+        Returns how many were alive.
+        """
+        eids = np.asarray(eids, dtype=np.int64)
+        eids = eids[(eids >= 0) & (eids < self.entity_count)]
+        eids = np.unique(eids[self.alive[eids]])
+        n = len(eids)
+        if not n:
+            return 0
+        for store in self.stores.values():
+            store.remove_many(eids)
+        self._unindex_names(eids)
+        self.alive[eids] = False
+        self.names[eids] = -1
+        self.generations[eids] += 1
+        self.free[self.free_count:self.free_count + n] = eids
+        self.free_count += n
+        return n
+
+    def despawn(self, eids):
+        """Destroy an entity or array of entities at the end of the frame.
+
+        Systems can despawn while others still work on this frame's
+        views, including from scheduler threads; the engine calls
+        ``flush_despawned`` once every system has run, which destroys
+        the whole batch with one compaction per store.
+        """
+        with self.lock:
+            end = self.despawned_count + np.size(eids)
+            if end > len(self.despawned):
+                self.despawned = _grow(self.despawned, max(end, len(self.despawned) * 2))
+            self.despawned[self.despawned_count:end] = eids
+            self.despawned_count = end
+
+    def flush_despawned(self):
+        """Destroy everything despawned since the last flush; returns how many"""
+        if not self.despawned_count:
+            return 0
+        count, self.despawned_count = self.despawned_count, 0
+        return self.destroy_entities(self.despawned[:count])
+
+    def is_alive(self, eid):
+        return 0 <= eid < self.entity_count and bool(self.alive[eid])
+
+    def index_names(self):
+        """Build the name index used by ``find`` (done on first use otherwise)"""
+        eids = np.flatnonzero(self.alive[:self.entity_count] & (self.names[:self.entity_count] >= 0))
+        ids = self.names[eids]
+        order = np.argsort(ids, kind="stable")
+        eids, ids = eids[order], ids[order]
+        starts = np.flatnonzero(np.r_[True, ids[1:] != ids[:-1]]) if len(ids) else []
+        self.name_index = {
+            int(ids[start]): group.tolist()
+            for start, group in zip(starts, np.split(eids, starts[1:]))
+        }
+        return self.name_index
+
+    def _index_names(self, eids):
+        if self.name_index is None:
+            return
+        for eid, name in zip(np.asarray(eids).tolist(), self.names[eids].tolist()):
+            if name >= 0:
+                self.name_index.setdefault(name, []).append(eid)
+
+    def _unindex_names(self, eids):
+        if self.name_index is None:
+            return
+        named = self.names[eids] >= 0
+        if not named.any():
+            return
+        for eid, name in zip(np.asarray(eids)[named].tolist(), self.names[eids][named].tolist()):
+            group = self.name_index[name]
+            group.remove(eid)
+            if not group:
+                del self.name_index[name]
+
+    def find_all(self, name):
+        """Ids of every live entity with this name"""
+        index = self.name_index if self.name_index is not None else self.index_names()
+        name_id = self.strings.ids.get(name)
+        return list(index.get(name_id, ()))
+
+    def find(self, name):
+        """Id of the first entity with this name, or -1"""
+        eids = self.find_all(name)
+        return eids[0] if eids else -1
+
+    def snapshot(self):
+        """Copies of every entity and component array, by name.
+
+        Together with the string table this is the whole world state;
+        ``restore`` puts it back. Sparse arrays are rebuilt from the
+        dense ones, so they aren't included.
+        """
+        n = self.entity_count
+        arrays = {
+            "names": self.names[:n].copy(),
+            "alive": self.alive[:n].copy(),
+            "generations": self.generations[:n].copy(),
+            "free": self.free[:self.free_count].copy(),
+        }
+        for name, store in self.stores.items():
+            arrays[name + ".entities"] = store.entity_ids().copy()
+            for field in store.columns:
+                arrays[f"{name}.{field}"] = store.column(field).copy()
+        return arrays
+
+    def restore(self, arrays, strings=None):
+        """Go back to a snapshot taken from this world (or one with the same types)"""
+        n = len(arrays["alive"])
+        self._reserve(n)
+        self.names[:n] = arrays["names"]
+        self.names[n:] = -1
+        self.alive[:n] = arrays["alive"]
+        self.alive[n:] = False
+        self.generations[:n] = arrays["generations"]
+        free = arrays["free"]
+        self.free[:len(free)] = free
+        self.free_count = len(free)
+        self.entity_count = n
+        self.despawned_count = 0
+        self.name_index = None
+        for name, store in self.stores.items():
+            entities = arrays.get(name + ".entities")
+            if entities is None:
+                store.restore(np.empty(0, dtype=np.int64), {})
+            else:
+                store.restore(entities, {field: arrays[f"{name}.{field}"] for field in store.columns})
+        if strings is not None and strings != self.strings.strings:
+            self.strings.strings = list(strings)
+            self.strings.ids = dict(zip(self.strings.strings, range(len(self.strings.strings))))
+
+    def handle(self, eid):
+        """eid with its generation, for references kept across frames"""
+        return (int(self.generations[eid]) << 32) | int(eid)
+
+    def handles(self, eids):
+        eids = np.asarray(eids, dtype=np.int64)
+        return (self.generations[eids].astype(np.int64) << 32) | eids
+
+    def resolve(self, handle):
+        """The entity a handle refers to, or -1 if it has been destroyed"""
+        eid = handle & 0xFFFFFFFF
+        if self.is_alive(eid) and int(self.generations[eid]) == (handle >> 32) & 0xFFFFFFFF:
+            return eid
+        return -1
+
+    def resolve_many(self, handles):
+        handles = np.asarray(handles, dtype=np.int64)
+        eids = handles & 0xFFFFFFFF
+        valid = eids < self.entity_count
+        valid[valid] = self.alive[eids[valid]] & (
+            self.generations[eids[valid]] == ((handles[valid] >> 32) & 0xFFFFFFFF))
+        return np.where(valid, eids, -1)
+
+    def entity_name(self, eid):
+        return self.strings.lookup(int(self.names[eid]))
+
+    def _import_strings(self, other, ids):
+        """Map string ids from other's table to ids in this one"""
+        ids = np.asarray(ids)
+        mapped = np.full(ids.shape, -1, dtype=np.int32)
+        valid = ids >= 0
+        if valid.any():
+            unique, inverse = np.unique(ids[valid], return_inverse=True)
+            table = np.array(
+                [self.strings.intern(other.strings.strings[i]) for i in unique],
+                dtype=np.int32,
+            )
+            mapped[valid] = table[inverse]
+        return mapped
+
+    def merge(self, other, eids=None):
+        """Copy entities of another World into this one.
+
+        Copies every live entity of other, or just eids, with all their
+        components, re-interning names and interned fields. Returns the
+        new entity ids in the same order.
+        """
+        if eids is None:
+            eids = np.flatnonzero(other.alive[:other.entity_count])
+        eids = np.asarray(eids, dtype=np.int64)
+        for name, prefab in other.prefabs.items():
+            self.prefabs.setdefault(name, prefab)
+        new = self.create_entities(len(eids))
+        self.names[new] = self._import_strings(other, other.names[eids])
+        self._index_names(new)
+
+        lookup = np.full(other.entity_count, -1, dtype=np.int64)
+        lookup[eids] = new
+        for store in other.stores.values():
+            if not store.count:
+                continue
+            dest = lookup[store.entity_ids()]
+            rows = dest >= 0
+            if not rows.any():
+                continue
+            columns = {}
+            for name, field in store.type.fields.items():
+                column = store.column(name)[rows]
+                if field.interned:
+                    column = self._import_strings(other, column)
+                columns[name] = column
+            self.register(store.type).add_many(dest[rows], columns)
+        return new
+
+    def add_component(self, eid, ctype, **values):
+        store = self.store(ctype)
+        for name, field in store.type.fields.items():
+            if field.interned and isinstance(values.get(name), str):
+                values[name] = self.strings.intern(values[name])
+        return store.add(eid, values)
+
+    def add_components(self, ctype, eids, **columns):
+        """Attach ctype to every entity in eids, with one row per entity"""
+        store = self.store(ctype)
+        for name, field in store.type.fields.items():
+            if field.interned and name in columns:
+                values = columns[name]
+                # Arrays of ids are already interned
+                if isinstance(values, np.ndarray) and values.dtype.kind in "iu":
+                    continue
+                columns[name] = [
+                    self.strings.intern(v) if isinstance(v, str) else v
+                    for v in values
+                ]
+        store.add_many(eids, columns)
+
+    def remove_component(self, eid, ctype):
+        return self.store(ctype).remove(eid)
+
+    def has_component(self, eid, ctype):
+        return self.store(ctype).contains(eid)
+
+    def view(self, *ctypes, entities=None):
+        """Entities carrying every given component type.
+
+        Returns ``(entities, slots)`` where ``slots[i]`` indexes the columns
+        of the i-th store, so ``store.column(name)[slots[i]]`` lines up with
+        ``entities``. The join walks the smallest store and filters it
+        against the others' sparse arrays, all as array operations. Pass
+        ``entities`` to restrict the join to a candidate set (e.g. the
+        result of a spatial query).
+        """
+        stores = [self.store(c) for c in ctypes]
+        entities = _join(stores, entities)
+        slots = [store.sparse[entities] for store in stores]
+        return entities, slots
+
+    def query(self, *ctypes):
+        """The cached Query for these component types, made on first use.
+
+        ``world.query(Transform, Sprite).view()`` gives the same entities
+        as ``world.view(Transform, Sprite)`` without joining the stores
+        again each call.
+        """
+        stores = [self.store(c) for c in ctypes]
+        key = tuple(self.type_ids[store.type.name] for store in stores)
+        with self.lock:
+            query = self.queries.get(key)
+            # Stores replaced wholesale (a cooked load) need a fresh query
+            if query is None or query.stores != stores:
+                query = self.queries[key] = Query(stores)
+            return query
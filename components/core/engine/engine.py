@@ -1,19 +1,281 @@
-import customtkinter as ctk
+import os
+import json
+import time
+
+from components.core.engine.scene import load_scene
+from components.core.engine.cooked import load_cooked, EXTENSION as COOKED_EXTENSION
+from components.core.engine.physics import PhysicsSystem
+from components.core.engine.particles import ParticleSystem
+from components.core.engine.renderer import SpriteRenderer
+from components.core.engine.profiler import FrameStats, FrameProfiler
+from components.core.engine.spatial import SpatialIndex
+from components.core.engine.scheduler import Scheduler
+from components.core.engine.hot_reload import HotReloader
+from components.core.engine.input import InputState
+from components.core.engine.streaming import ChunkStreamer, chunk_directory, INDEX_NAME as CHUNK_INDEX
+from components.startup import lazy_import
+
+# Only needed for real projects; it pulls in multiprocessing
+assets = lazy_import("components.core.engine.assets")
+replay = lazy_import("components.core.engine.replay")
+
+# Used when the engine is started without a project
+TEMPLATE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "..", "editor", "template"
+)
+
+
+def load_project(project_path=None):
+    """Read a project's project.axie settings"""
+    project_path = project_path or TEMPLATE_PATH
+    with open(os.path.join(project_path, "project.axie"), "r") as f:
+        return json.load(f)
+
+
+def load_default_scene(project_path=None):
+    """Load the project's default scene into a new World"""
+    project_path = project_path or TEMPLATE_PATH
+    project = load_project(project_path)
+    scene_name = project.get("settings", {}).get("default_scene", "main")
+    scene_path = os.path.join(project_path, "scene", f"{scene_name}.scene")
+
+    # Prefer the cooked scene unless the JSON source has been edited since
+    cooked_path = os.path.join(project_path, "scene", scene_name + COOKED_EXTENSION)
+    if os.path.exists(cooked_path) and (
+        not os.path.exists(scene_path)
+        or os.path.getmtime(cooked_path) >= os.path.getmtime(scene_path)
+    ):
+        return load_cooked(cooked_path)
+    return load_scene(scene_path)
+
+
+class Engine:
+    """A loaded project: its world plus the systems that update it"""
+
+    def __init__(self, project_path=None):
+        self.project_path = project_path or TEMPLATE_PATH
+        # Real projects get their assets built incrementally before loading
+        self.assets = None
+        if project_path:
+            self.assets = assets.AssetPipeline(project_path)
+            self.assets.build()
+        self.project = load_project(self.project_path)
+        self.settings = self.project.get("settings", {})
+        # Scenes split into chunks stream around the camera instead
+        self.streamer = None
+        chunks = chunk_directory(self.project_path, self.settings.get("default_scene", "main"))
+        if os.path.exists(os.path.join(chunks, CHUNK_INDEX)):
+            self.streamer = ChunkStreamer.from_settings(chunks, self.settings)
+            self.world = self.streamer.load_resident()
+        else:
+            self.world = load_default_scene(self.project_path)
+        self.physics = PhysicsSystem.from_settings(self.settings)
+        self.spatial = SpatialIndex()
+        self.particles = ParticleSystem.from_settings(self.settings)
+        self.systems = [self.physics, self.spatial, self.particles]
+        if self.streamer:
+            self.systems.insert(0, self.streamer)
+        self.scheduler = Scheduler(self.systems)
+        width, height = self.settings.get("resolution", [1280, 720])
+        self.renderer = SpriteRenderer(
+            width, height, texture_root=self.project_path, assets=self.assets
+        )
+        self.renderer.spatial = self.spatial
+        self.renderer.particles = self.particles
+        if self.streamer:
+            self.streamer.view = self.renderer
+        self.stats = FrameStats()
+        # Off unless asked for; costs one check per frame while disabled
+        self.profiler = FrameProfiler()
+        self.input = InputState()
+        # Frames simulated so far; replays address frames by this number
+        self.frame_index = 0
+        self.recorder = None
+
+    def enable_hot_reload(self, watcher=None):
+        """Watch the project and apply scene, script and image edits live"""
+        self.reloader = HotReloader(self, watcher)
+        self.systems.insert(0, self.reloader)
+        return self.reloader
+
+    def update(self, dt):
+        # Pick up systems added to or removed from self.systems
+        if self.scheduler.systems != self.systems:
+            self.scheduler.set_systems(self.systems)
+        self.scheduler.run(self.world, dt)
+        # Entities despawned by any system go together, once none is running
+        despawned = self.world.flush_despawned()
+        for name, seconds in self.scheduler.timings.items():
+            self.stats.record(name, seconds)
+        self.stats.record_parallel(self.scheduler.parallel)
+        if self.profiler.enabled:
+            for system, (start, end, thread) in zip(self.scheduler.systems, self.scheduler.intervals):
+                self.profiler.add_event(system.name, start, end, thread)
+            self.profiler.count("despawned", despawned)
+
+    def step(self, dt, events=None):
+        """Simulate one frame with the queued input, or the given events.
+
+        This is all a replay re-runs, so anything that changes the world
+        belongs in a system or in the frame's input events.
+        """
+        self.input.begin_frame(events)
+        self.update(dt)
+        self.frame_index += 1
+        if self.recorder is not None:
+            start = time.perf_counter()
+            self.recorder.record(self, dt)
+            self.stats.record("record", time.perf_counter() - start)
+
+    def record(self, path, **options):
+        """Start recording a replay to path; see ReplayRecorder for options"""
+        self.stop_recording()
+        self.recorder = replay.ReplayRecorder(self, path, **options)
+        return self.recorder
+
+    def stop_recording(self):
+        if self.recorder is not None:
+            self.recorder.close(self)
+            self.recorder = None
+
+    def render(self):
+        start = time.perf_counter()
+        frame = self.renderer.render(self.world)
+        end = time.perf_counter()
+        self.stats.record("render", end - start)
+        if self.profiler.enabled:
+            self.profiler.add_event("render", start, end)
+            self.profiler.count("draw_calls", self.renderer.draw_calls)
+            self.profiler.count("sprites", self.renderer.sprites_drawn)
+        return frame
+
+    def frame(self, dt):
+        """Update and render one frame, recording its duration"""
+        start = time.perf_counter()
+        self.profiler.begin_frame()
+        self.step(dt)
+        image = self.render()
+        self.stats.end_frame(time.perf_counter() - start)
+        if self.profiler.enabled:
+            world = self.world
+            self.profiler.count("entities", int(world.alive[:world.entity_count].sum()))
+            self.profiler.count("particles", len(self.particles))
+            self.profiler.end_frame()
+        return image
+
+
+def run_headless(project_path=None, frames=None, seconds=None, report=None, dt=1 / 60,
+                 on_ready=None, trace=None, record=None):
+    """Run the frame loop without a window and report frame timings.
+
+    Every frame advances the simulation by the same dt, so a run is
+    deterministic regardless of how fast the machine is. The loop stops
+    after the given number of frames or wall-clock seconds (300 frames
+    if neither is set). The timing summary is written as JSON to report,
+    or printed when report is None. on_ready(None) is called after the
+    first frame. With trace, the frame profiler runs and its last frames
+    are written there as a Chrome trace. With record, the run is saved
+    there as a replay.
+    """
+    if frames is None and seconds is None:
+        frames = 300
+    engine = Engine(project_path)
+    print(f"Loaded scene with {engine.world.entity_count} entities")
+    engine.profiler.enabled = trace is not None
+    if record:
+        engine.record(record)
+
+    start = time.perf_counter()
+    frame = 0
+    while True:
+        if frames is not None and frame >= frames:
+            break
+        if seconds is not None and time.perf_counter() - start >= seconds:
+            break
+        engine.frame(dt)
+        frame += 1
+        if frame == 1 and on_ready:
+            on_ready(None)
+
+    if record:
+        engine.stop_recording()
+        print(f"Wrote replay of {engine.frame_index} frames to {record}")
+    engine.stats.write_json(report)
+    if trace:
+        engine.profiler.write_trace(trace)
+        print(f"Wrote trace of {len(engine.profiler.frames)} frames to {trace}")
+    return engine.stats.summary()
+
+
+def draw_overlay(image, text):
+    """Draw profiler text in the top-left corner of a frame"""
+    from PIL import ImageDraw
+    draw = ImageDraw.Draw(image)
+    left, top, right, bottom = draw.multiline_textbbox((8, 8), text)
+    draw.rectangle((left - 4, top - 4, right + 4, bottom + 4), fill=(0, 0, 0))
+    draw.multiline_text((8, 8), text, fill=(255, 255, 255))
+
+
+def run(project_path=None, on_ready=None):
+    """Run the game engine directly.
+
+    F3 toggles the frame profiler and its on-screen overlay.
+    """
+    import customtkinter as ctk
+
+    engine = Engine(project_path)
+    print(f"Loaded scene with {engine.world.entity_count} entities")
+    engine.enable_hot_reload()
 
-def run():
-    """Run the game engine directly"""
     app = ctk.CTk()
     app.title("Game Engine")
-    
+
     # 16:9 aspect ratio (smaller size)
     window_width = 800
     window_height = 450
-    
+
     # Center the window
     screen_width = app.winfo_screenwidth()
     screen_height = app.winfo_screenheight()
     x_position = (screen_width - window_width) // 2
     y_position = (screen_height - window_height) // 2
-    
+
     app.geometry(f"{window_width}x{window_height}+{x_position}+{y_position}")
-    app.mainloop()
\ No newline at end of file
+
+    # The renderer composites offscreen; the window just shows the result
+    view = ctk.CTkLabel(app, text="")
+    view.pack(fill="both", expand=True)
+
+    def toggle_profiler(event=None):
+        engine.profiler.enabled = not engine.profiler.enabled
+        engine.profiler.clear()
+
+    app.bind("<F3>", toggle_profiler)
+
+    # Queued for the next frame, so the simulation (and replays) see them in step
+    app.bind("<KeyPress>", lambda event: engine.input.press(event.keysym))
+    app.bind("<KeyRelease>", lambda event: engine.input.release(event.keysym))
+    view.bind("<Motion>", lambda event: engine.input.move(event.x, event.y))
+    view.bind("<Button>", lambda event: engine.input.click(event.num, event.x, event.y))
+
+    # Simulation runs at its own fixed rate; this only feeds it wall time
+    last_time = time.perf_counter()
+
+    def tick():
+        nonlocal last_time, on_ready
+        now = time.perf_counter()
+        frame = engine.frame(now - last_time)
+        last_time = now
+        if engine.profiler.enabled:
+            draw_overlay(frame, engine.profiler.overlay_text())
+        view.configure(image=ctk.CTkImage(frame, size=(app.winfo_width(), app.winfo_height())))
+        app.after(16, tick)
+
+        # Called once, when the first frame has been handed to Tk
+        if on_ready:
+            app.after_idle(on_ready, app)
+            on_ready = None
+
+    app.after(16, tick)
+    app.mainloop()
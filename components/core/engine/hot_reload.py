@@ -0,0 +1,266 @@
+import gc
+import os
+import sys
+import json
+import time
+import importlib
+
+import numpy as np
+
+from components.core.engine.ecs import PrefabInstance
+from components.core.engine.scene import load_prefabs
+from components.image_cache import images
+from components.watcher import create_watcher
+from components import startup
+
+IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".bmp", ".gif", ".tga"}
+
+
+def entity_keys(entities):
+    """Stable key per scene entity: its name, numbered when repeated"""
+    seen = {}
+    keys = []
+    for i, entity in enumerate(entities):
+        name = entity.get("name")
+        if name is None:
+            keys.append(("#", i))
+            continue
+        n = seen.get(name, 0)
+        seen[name] = n + 1
+        keys.append((name, n))
+    return keys
+
+
+def resolve_components(entity, prefabs):
+    """Component values by type name, with the entity's prefab applied"""
+    components = {}
+    prefab = prefabs.get(entity.get("prefab"))
+    if prefab is not None:
+        components = {t: dict(values) for t, values in prefab.components.items()}
+    for component in entity.get("components", []):
+        values = dict(component)
+        type_name = values.pop("type", None)
+        components.setdefault(type_name, {}).update(values)
+    return components
+
+
+class SceneState:
+    """The parsed scene a world was loaded from, kept for diffing.
+
+    Entities are remembered by handle (``World.handles``): an entity
+    destroyed during play may have its id reused by another, which an
+    edit must not touch.
+    """
+
+    def __init__(self, data, handles, base_path=None):
+        self.prefabs = load_prefabs(data.get("prefabs", {}), base_path)
+        entities = data.get("entities", [])
+        self.entities = {
+            key: (int(handle), entity)
+            for key, handle, entity in zip(entity_keys(entities), handles, entities)
+        }
+
+    def apply(self, world, data, base_path=None):
+        """Bring world in line with new scene data, touching only what changed.
+
+        Entities are matched by name. Removed ones are destroyed, new ones
+        created, and on the others only component types whose scene values
+        changed are written; everything else, including runtime state
+        such as positions moved by physics, is left alone. Entities whose
+        JSON and prefab are unchanged are skipped without being resolved.
+        An entity whose new values can't be applied is reported and keeps
+        its last good state, to be tried again on the next edit.
+        Returns (added, removed, changed) entity counts.
+        """
+        prefabs = load_prefabs(data.get("prefabs", {}), base_path)
+        world.prefabs.update(prefabs)
+        edited_prefabs = {
+            name for name in prefabs.keys() | self.prefabs.keys()
+            if name not in prefabs or name not in self.prefabs
+            or prefabs[name].components != self.prefabs[name].components
+        }
+        entities = data.get("entities", [])
+        keys = entity_keys(entities)
+
+        new_entities = {}
+        current = set(keys)
+        removed = [handle for key, (handle, _) in self.entities.items() if key not in current]
+        removed = world.resolve_many(np.array(removed, dtype=np.int64))
+        removed = world.destroy_entities(removed[removed >= 0])
+        added = changed = 0
+        for key, entity in zip(keys, entities):
+            old = self.entities.get(key)
+            if old is not None and old[1] == entity and entity.get("prefab") not in edited_prefabs:
+                new_entities[key] = old
+                continue
+            eid = world.resolve(old[0]) if old is not None else -1
+            if eid < 0:
+                # New, or destroyed during play: created again
+                eid = world.create_entity(entity.get("name"))
+                # Until its components apply, it is an entity without any
+                old = (world.handle(eid), {"name": entity.get("name")})
+                added += 1
+            else:
+                changed += 1
+            try:
+                self._apply_entity(world, eid, old[1], entity, prefabs)
+            except Exception as e:
+                print(f"Failed to apply entity {key[0]}: {str(e)}")
+                new_entities[key] = old
+                continue
+            new_entities[key] = (old[0], entity)
+
+        self.prefabs = prefabs
+        self.entities = new_entities
+        return added, removed, changed
+
+    def _apply_entity(self, world, eid, old, entity, prefabs):
+        """Write the component types of eid that differ from its old scene entry"""
+        prefab = entity.get("prefab")
+        components = resolve_components(entity, prefabs)
+        old_components = resolve_components(old, self.prefabs)
+        for type_name in old_components.keys() - components.keys():
+            if type_name in world.types:
+                world.remove_component(eid, world.types[type_name])
+        for type_name, values in components.items():
+            if old_components.get(type_name) == values:
+                continue
+            ctype = world.types.get(type_name)
+            if ctype is None:
+                print(f"Unknown component type: {type_name}")
+                continue
+            world.add_component(eid, ctype, **values)
+        if prefab in prefabs:
+            world.add_component(eid, PrefabInstance, prefab=prefab)
+        elif world.has_component(eid, PrefabInstance):
+            world.remove_component(eid, PrefabInstance)
+
+
+class HotReloader:
+    """Applies edits to a running engine's project as files change.
+
+    Runs as the first engine system. Each update it asks the watcher for
+    changed files under the project and:
+
+    - default scene: re-parses the JSON and applies the diff to the world
+    - .py files: reloads the module loaded from that file and moves live
+      engine systems onto the reloaded classes, keeping their state
+    - images: drops them from the image cache and the renderer atlas so
+      the next frame reads the new pixels
+
+    Other assets stay cached. For each reload the time spent applying it
+    is kept in ``durations`` and the latency from the file's modification
+    time to the change being live in ``latencies`` (seconds); both are
+    printed.
+    """
+
+    name = "reload"
+
+    def __init__(self, engine, watcher=None):
+        self.engine = engine
+        self.project_path = os.path.abspath(engine.project_path)
+        self.watcher = watcher or create_watcher([self.project_path])
+        self.durations = []
+        self.latencies = []
+        self.scene_path = self._scene_path()
+        self.scene = None
+        if self.scene_path and os.path.exists(self.scene_path):
+            with open(self.scene_path, "r") as f:
+                data = json.load(f)
+            count = len(data.get("entities", []))
+            # Scenes are loaded in file order into a fresh world
+            if engine.world.entity_count >= count:
+                self.scene = SceneState(data, engine.world.handles(np.arange(count)),
+                                        os.path.dirname(self.scene_path))
+
+    def _scene_path(self):
+        name = self.engine.settings.get("default_scene", "main")
+        return os.path.join(self.project_path, "scene", f"{name}.scene")
+
+    def update(self, world, dt):
+        for path in sorted(self.watcher.changes()):
+            start = time.perf_counter()
+            # Parsing a large scene allocates enough objects to set off
+            # full collections over the whole heap, which would roughly
+            # double the reload time
+            collecting = gc.isenabled()
+            gc.disable()
+            try:
+                what = self.reload(world, path)
+            except Exception as e:
+                # A bad edit is reported and skipped; the game keeps running
+                print(f"Failed to reload {path}: {str(e)}")
+                continue
+            finally:
+                if collecting:
+                    gc.enable()
+            if what is None:
+                continue
+            duration = time.perf_counter() - start
+            try:
+                latency = time.time() - os.stat(path).st_mtime
+            except OSError:
+                latency = duration
+            self.durations.append(duration)
+            self.latencies.append(latency)
+            print(f"Reloaded {os.path.relpath(path, self.project_path)} ({what}) "
+                  f"in {duration * 1000:.1f} ms, "
+                  f"{latency * 1000:.1f} ms after save")
+
+    def reload(self, world, path):
+        """Apply one changed file; returns a description, or None if ignored"""
+        extension = os.path.splitext(path)[1].lower()
+        if path == self.scene_path and self.scene is not None:
+            with open(path, "r") as f:
+                data = json.load(f)
+            added, removed, changed = self.scene.apply(world, data, os.path.dirname(path))
+            return f"+{added} -{removed} ~{changed} entities"
+        if extension == ".py":
+            return self.reload_module(path)
+        if extension in IMAGE_EXTENSIONS:
+            return self.reload_image(world, path)
+        return None
+
+    def reload_module(self, path):
+        path = os.path.abspath(path)
+        module = startup._components.get(path)
+        if module is not None:
+            startup._components.pop(path)
+            module = startup.load_component(path)
+        else:
+            for candidate in list(sys.modules.values()):
+                if os.path.abspath(getattr(candidate, "__file__", None) or "") == path:
+                    module = importlib.reload(candidate)
+                    break
+        if module is None:
+            return None
+        # Live systems keep their state but pick up the new methods
+        swapped = 0
+        for system in self.engine.systems:
+            cls = type(system)
+            new_cls = getattr(module, cls.__name__, None)
+            if cls.__module__ == module.__name__ and isinstance(new_cls, type) and new_cls is not cls:
+                system.__class__ = new_cls
+                swapped += 1
+        return f"module, {swapped} systems updated"
+
+    def reload_image(self, world, path):
+        images.invalidate(path)
+        renderer = self.engine.renderer
+        name = os.path.relpath(path, os.path.join(self.project_path, "assets"))
+        if name.startswith(".."):
+            name = os.path.relpath(path, self.project_path)
+        texture_id = world.strings.ids.get(name.replace(os.sep, "/"), world.strings.ids.get(name))
+        if texture_id is None:
+            return None
+        if self.engine.assets is not None:
+            # Re-imports just the changed file
+            self.engine.assets.build()
+        # The old atlas space is abandoned; the texture is packed again
+        renderer.atlas.named.pop(name, None)
+        renderer.atlas.regions.pop(texture_id, None)
+        renderer.tiles.pop(texture_id, None)
+        return "texture"
+
+    def close(self):
+        self.watcher.close()
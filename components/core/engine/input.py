@@ -0,0 +1,64 @@
+class InputState:
+    """Keyboard and mouse input as the simulation sees it.
+
+    Window callbacks queue events as they arrive; ``begin_frame`` turns
+    the queue into the frame's ``events`` and applies them to ``pressed``
+    and ``mouse``, so every system sees the same input for a whole frame.
+    A replay passes recorded events to ``begin_frame`` instead. Events
+    are short JSON-friendly lists:
+
+    - ["press", key] / ["release", key]
+    - ["move", x, y]
+    - ["click", button, x, y]
+    """
+
+    def __init__(self):
+        self.queued = []
+        self.events = ()
+        self.pressed = set()
+        self.mouse = (0, 0)
+
+    def push(self, *event):
+        self.queued.append(list(event))
+
+    def press(self, key):
+        self.push("press", key)
+
+    def release(self, key):
+        self.push("release", key)
+
+    def move(self, x, y):
+        self.push("move", x, y)
+
+    def click(self, button, x, y):
+        self.push("click", button, x, y)
+
+    def begin_frame(self, events=None):
+        """Take this frame's events (the queue, or the given ones) and apply them"""
+        if events is None:
+            if not self.queued:
+                self.events = ()
+                return self.events
+            events, self.queued = self.queued, []
+        self.events = events
+        for event in events:
+            kind = event[0]
+            if kind == "press":
+                self.pressed.add(event[1])
+            elif kind == "release":
+                self.pressed.discard(event[1])
+            elif kind in ("move", "click"):
+                self.mouse = (event[-2], event[-1])
+        return events
+
+    def is_pressed(self, key):
+        return key in self.pressed
+
+    def snapshot(self):
+        return {"pressed": sorted(self.pressed), "mouse": list(self.mouse)}
+
+    def restore(self, state):
+        self.queued = []
+        self.events = ()
+        self.pressed = set(state["pressed"])
+        self.mouse = tuple(state["mouse"])
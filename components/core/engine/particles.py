@@ -0,0 +1,219 @@
+import numpy as np
+
+from components.core.engine.ecs import Transform, ParticleEmitter
+
+
+class ParticleSystem:
+    """Simulates the particles of every ParticleEmitter entity.
+
+    Particles aren't entities: they live in structure-of-arrays buffers
+    owned by the system, and spawning, aging, integration and killing
+    are each a handful of whole-array operations. Dead particles are
+    replaced by ones from the end of the live range, so killing costs
+    per particle killed rather than per particle alive. Particles move
+    under ``gravity`` (the project's physics gravity) scaled by their
+    emitter's gravity_scale and don't collide. The renderer draws them
+    with the sprites when given the system as ``renderer.particles``.
+    """
+
+    name = "particles"
+    reads = (Transform, ParticleEmitter)
+    # The renderer reads the buffers after the frame's systems have run
+    writes = ("particles",)
+
+    def __init__(self, gravity=980.0, capacity=1024, seed=0):
+        self.gravity = np.array([0.0, gravity], dtype=np.float32)
+        self.rng = np.random.default_rng(seed)
+        self.count = 0
+        self.position = np.empty((capacity, 2), dtype=np.float32)
+        self.velocity = np.empty((capacity, 2), dtype=np.float32)
+        self.age = np.empty(capacity, dtype=np.float32)
+        self.lifetime = np.empty(capacity, dtype=np.float32)
+        self.gravity_scale = np.empty(capacity, dtype=np.float32)
+        self.texture = np.empty(capacity, dtype=np.int32)
+        self.layer = np.empty(capacity, dtype=np.int32)
+        self.emitter = np.empty(capacity, dtype=np.int64)
+        # Fraction of a particle owed to each emitter, by entity id, and
+        # the generation of the entity it was owed to (ids get reused)
+        self.carry = np.zeros(0, dtype=np.float32)
+        self.generation = np.zeros(0, dtype=np.uint32)
+        # (layer, texture) pairs particles have been spawned with
+        self.groups = set()
+
+    @classmethod
+    def from_settings(cls, settings):
+        """Build from the "settings" block of project.axie"""
+        physics = settings.get("physics", {})
+        return cls(gravity=physics.get("gravity", 980.0))
+
+    def __len__(self):
+        return self.count
+
+    def _buffers(self):
+        return (self.position, self.velocity, self.age, self.lifetime,
+                self.gravity_scale, self.texture, self.layer, self.emitter)
+
+    def _reserve(self, count):
+        capacity = len(self.age)
+        if count <= capacity:
+            return
+        capacity = max(capacity, 1)
+        while capacity < count:
+            capacity *= 2
+        grown = []
+        for buffer in self._buffers():
+            new = np.empty((capacity,) + buffer.shape[1:], dtype=buffer.dtype)
+            new[:self.count] = buffer[:self.count]
+            grown.append(new)
+        (self.position, self.velocity, self.age, self.lifetime, self.gravity_scale,
+         self.texture, self.layer, self.emitter) = grown
+
+    def update(self, world, dt):
+        self.kill(self.age_particles(dt))
+        self.integrate(dt)
+        self.spawn(world, dt)
+
+    def age_particles(self, dt):
+        """Advance every particle's age; returns the indexes that expired"""
+        age = self.age[:self.count]
+        age += dt
+        return np.flatnonzero(age >= self.lifetime[:self.count])
+
+    def kill(self, dead):
+        """Remove the particles at the given (sorted, unique) indexes"""
+        n = len(dead)
+        if not n:
+            return
+        count = self.count - n
+        holes = dead[dead < count]
+        if len(holes):
+            keep = np.ones(n, dtype=bool)
+            keep[dead[dead >= count] - count] = False
+            tail = np.flatnonzero(keep) + count
+            for buffer in self._buffers():
+                buffer[holes] = buffer[tail]
+        self.count = count
+        if not count:
+            self.groups.clear()
+
+    def integrate(self, dt):
+        n = self.count
+        velocity = self.velocity[:n]
+        velocity += np.multiply.outer(self.gravity_scale[:n] * dt, self.gravity)
+        self.position[:n] += velocity * dt
+
+    def spawn(self, world, dt):
+        """Emit each emitter's share of particles for dt; returns how many"""
+        emitters = world.store(ParticleEmitter)
+        eids, (t_slots, e_slots) = world.query(Transform, ParticleEmitter).view()
+        if not len(eids):
+            return 0
+        if len(self.carry) <= eids.max():
+            size = max(int(eids.max()) + 1, len(self.carry) * 2, 64)
+            carry = np.zeros(size, dtype=np.float32)
+            carry[:len(self.carry)] = self.carry
+            generation = np.zeros(size, dtype=np.uint32)
+            generation[:len(self.generation)] = self.generation
+            self.carry, self.generation = carry, generation
+        self._forget_reused(world, eids)
+
+        owed = self.carry[eids] + emitters.columns["rate"][e_slots] * dt
+        counts = np.floor(owed)
+        self.carry[eids] = owed - counts
+        counts = counts.astype(np.int64)
+        # Emitters at their cap spawn nothing and don't save up
+        emitted = self.emitter[:self.count]
+        live = np.bincount(emitted[emitted >= 0], minlength=int(eids.max()) + 1)[eids]
+        room = np.maximum(emitters.columns["max_particles"][e_slots] - live, 0)
+        counts = np.minimum(counts, room)
+        total = int(counts.sum())
+        if not total:
+            return 0
+
+        # One row per new particle pointing back at its emitter
+        source = np.repeat(np.arange(len(eids)), counts)
+        e_rows = e_slots[source]
+        column = emitters.columns
+        start, end = self.count, self.count + total
+        self._reserve(end)
+        random = self.rng.random((total, 4), dtype=np.float32)
+
+        lifetime = column["lifetime"][e_rows]
+        speed = column["speed"][e_rows]
+        angle = np.radians(column["angle"][e_rows] + (random[:, 0] - 0.5) * column["spread"][e_rows])
+        speed = speed[:, 0] + (speed[:, 1] - speed[:, 0]) * random[:, 1]
+        self.velocity[start:end, 0] = np.cos(angle) * speed
+        self.velocity[start:end, 1] = np.sin(angle) * speed
+        self.lifetime[start:end] = lifetime[:, 0] + (lifetime[:, 1] - lifetime[:, 0]) * random[:, 2]
+
+        position = world.store(Transform).columns["position"][t_slots[source]]
+        radius = column["radius"][e_rows]
+        if radius.any():
+            # Uniform over a disc around the emitter
+            theta = random[:, 3] * (2 * np.pi)
+            r = radius * np.sqrt(self.rng.random(total, dtype=np.float32))
+            position[:, 0] += np.cos(theta) * r
+            position[:, 1] += np.sin(theta) * r
+        self.position[start:end] = position
+        self.age[start:end] = 0
+        self.gravity_scale[start:end] = column["gravity_scale"][e_rows]
+        self.texture[start:end] = column["texture"][e_rows]
+        self.layer[start:end] = column["layer"][e_rows]
+        self.emitter[start:end] = eids[source]
+        self.count = end
+
+        spawning = counts > 0
+        self.groups.update(zip(column["layer"][e_slots[spawning]].tolist(),
+                               column["texture"][e_slots[spawning]].tolist()))
+        return total
+
+    def _forget_reused(self, world, eids):
+        """Reset the carry of emitters whose id now belongs to a new entity.
+
+        Their old particles live on, no longer counted against any
+        emitter's cap.
+        """
+        generations = world.generations[eids]
+        reused = self.generation[eids] != generations
+        if not reused.any():
+            return
+        old = eids[reused]
+        self.carry[old] = 0
+        self.generation[old] = generations[reused]
+        emitter = self.emitter[:self.count]
+        emitter[np.isin(emitter, old)] = -1
+
+    def clear(self):
+        self.count = 0
+        self.groups.clear()
+
+    def snapshot(self):
+        """Live particles, emitter carry and random state, for replays"""
+        n = self.count
+        return {
+            "position": self.position[:n].copy(),
+            "velocity": self.velocity[:n].copy(),
+            "age": self.age[:n].copy(),
+            "lifetime": self.lifetime[:n].copy(),
+            "gravity_scale": self.gravity_scale[:n].copy(),
+            "texture": self.texture[:n].copy(),
+            "layer": self.layer[:n].copy(),
+            "emitter": self.emitter[:n].copy(),
+            "carry": self.carry.copy(),
+            "generation": self.generation.copy(),
+            "rng": self.rng.bit_generator.state,
+            "groups": [list(group) for group in sorted(self.groups)],
+        }
+
+    def restore(self, state):
+        n = len(state["age"])
+        self.count = 0
+        self._reserve(n)
+        for name in ("position", "velocity", "age", "lifetime", "gravity_scale",
+                     "texture", "layer", "emitter"):
+            getattr(self, name)[:n] = state[name]
+        self.count = n
+        self.carry = state["carry"].copy()
+        self.generation = state["generation"].copy()
+        self.rng.bit_generator.state = state["rng"]
+        self.groups = {tuple(group) for group in state["groups"]}
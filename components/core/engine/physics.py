@@ -0,0 +1,141 @@
+import numpy as np
+
+from components.core.engine.ecs import Transform, RigidBody
+
+
+def grid_pairs(mins, maxs, cell_size):
+    """Broadphase over a uniform grid.
+
+    Every AABB is binned into the grid cells it touches; bodies sharing a
+    cell become candidate pairs. ``cell_size`` must be at least as large as
+    the biggest AABB so a body touches at most 2x2 cells. Returns an (k, 2)
+    array of index pairs (a < b) whose AABBs overlap.
+    """
+    n = len(mins)
+    if n < 2:
+        return np.empty((0, 2), dtype=np.int64)
+
+    cell_min = np.floor(mins / cell_size).astype(np.int64)
+    cell_max = np.floor(maxs / cell_size).astype(np.int64)
+    ids = np.arange(n, dtype=np.int64)
+
+    keys, bodies = [], []
+    for dx in (0, 1):
+        for dy in (0, 1):
+            cx = cell_min[:, 0] + dx
+            cy = cell_min[:, 1] + dy
+            touched = (cx <= cell_max[:, 0]) & (cy <= cell_max[:, 1])
+            keys.append((cx[touched] << 32) + (cy[touched] & 0xFFFFFFFF))
+            bodies.append(ids[touched])
+    keys = np.concatenate(keys)
+    bodies = np.concatenate(bodies)
+
+    order = np.argsort(keys)
+    keys = keys[order]
+    bodies = bodies[order]
+
+    # Within a sorted run of equal keys, pair each entry with the ones
+    # d places after it until no run is longer than d
+    first, second, cells = [], [], []
+    d = 1
+    while d < len(keys):
+        same = keys[d:] == keys[:-d]
+        if not same.any():
+            break
+        first.append(bodies[:-d][same])
+        second.append(bodies[d:][same])
+        cells.append(keys[d:][same])
+        d += 1
+    if not first:
+        return np.empty((0, 2), dtype=np.int64)
+
+    a = np.concatenate(first)
+    b = np.concatenate(second)
+    cell = np.concatenate(cells)
+
+    # Narrowphase: exact AABB overlap, one contiguous axis at a time
+    overlap = np.ones(len(a), dtype=bool)
+    for axis in (0, 1):
+        lo = np.ascontiguousarray(mins[:, axis])
+        hi = np.ascontiguousarray(maxs[:, axis])
+        overlap &= (lo[a] < hi[b]) & (lo[b] < hi[a])
+    a, b, cell = a[overlap], b[overlap], cell[overlap]
+
+    # Bodies sharing several cells show up more than once; keep the pair
+    # only in the cell holding the corner of their overlap region
+    corner = np.floor(np.maximum(mins[a], mins[b]) / cell_size).astype(np.int64)
+    owner = (corner[:, 0] << 32) + (corner[:, 1] & 0xFFFFFFFF) == cell
+    a, b = a[owner], b[owner]
+    return np.stack((np.minimum(a, b), np.maximum(a, b)), axis=1)
+
+
+class PhysicsSystem:
+    """Fixed-timestep integration and broadphase for RigidBody entities"""
+
+    name = "physics"
+    reads = (Transform, RigidBody)
+    writes = (Transform, RigidBody)
+
+    def __init__(self, gravity=980.0, fixed_dt=1 / 60, max_steps=5, cell_size=64.0):
+        # Screen space: +y points down, so positive gravity pulls downwards
+        self.gravity = np.array([0.0, gravity], dtype=np.float32)
+        self.fixed_dt = fixed_dt
+        self.max_steps = max_steps
+        self.cell_size = cell_size
+        self.accumulator = 0.0
+        # Entity id pairs whose AABBs overlapped on the last step
+        self.contacts = np.empty((0, 2), dtype=np.int64)
+
+    @classmethod
+    def from_settings(cls, settings):
+        """Build from the "settings" block of project.axie"""
+        physics = settings.get("physics", {})
+        return cls(gravity=physics.get("gravity", 980.0))
+
+    def snapshot(self):
+        """State carried between frames, for replays"""
+        return {"accumulator": self.accumulator, "contacts": self.contacts.copy()}
+
+    def restore(self, state):
+        self.accumulator = state["accumulator"]
+        self.contacts = state["contacts"].copy()
+
+    def update(self, world, dt):
+        """Advance by dt of wall-clock time using whole fixed steps.
+
+        Leftover time stays in the accumulator for the next frame. At most
+        ``max_steps`` steps run per call so a long frame can't snowball.
+        Returns the interpolation factor between the last two steps.
+        """
+        self.accumulator += dt
+        steps = 0
+        while self.accumulator >= self.fixed_dt and steps < self.max_steps:
+            self.step(world, self.fixed_dt)
+            self.accumulator -= self.fixed_dt
+            steps += 1
+        if steps == self.max_steps:
+            self.accumulator = min(self.accumulator, self.fixed_dt)
+        return self.accumulator / self.fixed_dt
+
+    def step(self, world, dt):
+        """Integrate every body once (semi-implicit Euler)"""
+        transforms = world.store(Transform)
+        bodies = world.store(RigidBody)
+        entities, (t_slots, b_slots) = world.query(Transform, RigidBody).view()
+        if not len(entities):
+            self.contacts = np.empty((0, 2), dtype=np.int64)
+            return
+
+        velocity = bodies.columns["velocity"]
+        position = transforms.columns["position"]
+        scale = bodies.columns["gravity_scale"][b_slots, None]
+
+        v = velocity[b_slots] + self.gravity * (scale * dt)
+        p = position[t_slots] + v * dt
+        velocity[b_slots] = v
+        position[t_slots] = p
+
+        half = bodies.columns["size"][b_slots] * 0.5
+        cell_size = max(self.cell_size, float(half.max()) * 2)
+        pairs = grid_pairs(p - half, p + half, cell_size)
+        self.contacts = entities[pairs]
@@ -0,0 +1,79 @@
+import json
+
+import numpy as np
+
+from components.core.engine.ecs import PrefabInstance
+
+
+class Prefab:
+    """Component values shared by every instance of a kind of entity.
+
+    ``components`` maps component type names to the field values the
+    prefab sets, as they appear in a scene file. The definition is never
+    written to; instances get their own rows filled from it in one
+    broadcast per field, and overrides only touch the instance rows.
+    """
+
+    def __init__(self, name, components):
+        self.name = name
+        self.components = components
+
+    @classmethod
+    def from_data(cls, name, data):
+        """Build from scene-style JSON: {"components": [{"type": ...}, ...]}"""
+        components = {}
+        for component in data.get("components", []):
+            values = dict(component)
+            components[values.pop("type")] = values
+        return cls(name, components)
+
+    @classmethod
+    def load(cls, name, path):
+        with open(path, "r") as f:
+            return cls.from_data(name, json.load(f))
+
+    def to_data(self):
+        return {"components": [
+            dict(values, type=type_name) for type_name, values in self.components.items()
+        ]}
+
+    def columns(self, world, ctype, count, overrides=None):
+        """Per-field column values for count instances of one component type.
+
+        Prefab values become read-only broadcasts (no per-instance copy
+        until the store copies them in); overrides are used as given.
+        """
+        values = self.components.get(ctype.name, {})
+        overrides = overrides or {}
+        columns = {}
+        for name, field in ctype.fields.items():
+            if name in overrides:
+                columns[name] = overrides[name]
+            elif name in values:
+                value = values[name]
+                if field.interned and isinstance(value, str):
+                    value = world.strings.intern(value)
+                columns[name] = np.broadcast_to(
+                    np.asarray(value, dtype=field.dtype), (count,) + field.shape)
+        return columns
+
+    def spawn(self, world, count, names=None, **overrides):
+        """Create count instances in one batch and return their ids.
+
+        Keyword arguments override fields per component type, with one
+        row per instance, and may add types the prefab doesn't have::
+
+            enemy.spawn(world, 1000, Transform={"position": positions})
+        """
+        eids = world.create_entities(count, names)
+        for type_name in list(self.components) + [t for t in overrides if t not in self.components]:
+            ctype = world.types.get(type_name)
+            if ctype is None:
+                print(f"Unknown component type: {type_name}")
+                continue
+            world.add_components(ctype, eids, **self.columns(
+                world, ctype, count, overrides.get(type_name)))
+        world.prefabs.setdefault(self.name, self)
+        world.add_components(PrefabInstance, eids, prefab=np.full(
+            count, world.strings.intern(self.name), dtype=np.int32))
+        return eids
@@ -0,0 +1,202 @@
+import os
+import sys
+import json
+import time
+import threading
+from collections import deque
+
+import numpy as np
+
+
+def summarize(samples):
+    """Millisecond percentiles for a list of durations in seconds"""
+    if not samples:
+        return {"count": 0}
+    ms = np.asarray(samples) * 1000
+    p50, p95, p99 = np.percentile(ms, [50, 95, 99])
+    return {
+        "count": len(ms),
+        "mean": round(float(ms.mean()), 4),
+        "p50": round(float(p50), 4),
+        "p95": round(float(p95), 4),
+        "p99": round(float(p99), 4),
+        "max": round(float(ms.max()), 4),
+    }
+
+
+class FrameStats:
+    """Collects per-system and per-frame durations"""
+
+    def __init__(self):
+        self.frames = []
+        self.systems = {}
+        # Fraction of each update with two or more systems running
+        self.parallel = []
+
+    def record(self, name, seconds):
+        self.systems.setdefault(name, []).append(seconds)
+
+    def record_parallel(self, fraction):
+        self.parallel.append(fraction)
+
+    def end_frame(self, seconds):
+        self.frames.append(seconds)
+
+    def summary(self):
+        summary = {
+            "frames": len(self.frames),
+            "frame_ms": summarize(self.frames),
+            "systems_ms": {name: summarize(s) for name, s in self.systems.items()},
+        }
+        if self.parallel:
+            summary["parallel_fraction"] = round(float(np.mean(self.parallel)), 4)
+        return summary
+
+    def write_json(self, path=None):
+        """Write the summary to path, or print it when path is None"""
+        text = json.dumps(self.summary(), indent=2)
+        if path is None:
+            print(text)
+        else:
+            with open(path, "w") as f:
+                f.write(text)
+
+
+class _NullScope:
+    """What FrameProfiler.scope returns while disabled"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SCOPE = _NullScope()
+
+
+class _Scope:
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.add_event(self.name, self.start, time.perf_counter())
+        return False
+
+
+class FrameProfiler:
+    """Per-frame timeline of scoped timers and counters.
+
+    Keeps the last ``capacity`` frames in a ring buffer. Each frame holds
+    (name, start, end, thread id) events and a dict of counters, and
+    can be exported as a Chrome trace (chrome://tracing or Perfetto).
+    While ``enabled`` is False ``scope`` returns a shared no-op context
+    and nothing else records, so instrumented code costs one attribute
+    check. Allocation counters come from ``sys.getallocatedblocks``,
+    which is cheap enough to read every frame.
+    """
+
+    def __init__(self, capacity=300, enabled=False):
+        self.enabled = enabled
+        self.frames = deque(maxlen=capacity)
+        self.current = None
+        self.origin = time.perf_counter()
+        self.pid = os.getpid()
+        self._blocks = sys.getallocatedblocks()
+
+    def scope(self, name):
+        """Context manager timing a block as an event of the current frame"""
+        if not self.enabled or self.current is None:
+            return _NULL_SCOPE
+        return _Scope(self, name)
+
+    def add_event(self, name, start, end, thread=None):
+        if self.current is not None:
+            self.current["events"].append(
+                (name, start, end, thread if thread is not None else threading.get_ident()))
+
+    def count(self, name, value):
+        if self.current is not None:
+            self.current["counters"][name] = value
+
+    def begin_frame(self):
+        if not self.enabled:
+            self.current = None
+            return
+        self.current = {"start": time.perf_counter(), "end": None,
+                        "events": [], "counters": {}}
+
+    def end_frame(self):
+        frame = self.current
+        if frame is None:
+            return
+        frame["end"] = time.perf_counter()
+        blocks = sys.getallocatedblocks()
+        frame["counters"]["allocated_blocks"] = blocks
+        frame["counters"]["allocations"] = blocks - self._blocks
+        self._blocks = blocks
+        self.frames.append(frame)
+        self.current = None
+
+    def clear(self):
+        self.frames.clear()
+
+    def averages(self):
+        """Mean frame and per-event milliseconds over the buffered frames"""
+        if not self.frames:
+            return 0.0, {}
+        totals = {}
+        for frame in self.frames:
+            for name, start, end, _ in frame["events"]:
+                totals[name] = totals.get(name, 0.0) + (end - start)
+        n = len(self.frames)
+        frame_ms = sum(f["end"] - f["start"] for f in self.frames) / n * 1000
+        return frame_ms, {name: t / n * 1000 for name, t in totals.items()}
+
+    def overlay_text(self):
+        """A few lines summarizing recent frames, for drawing on screen"""
+        frame_ms, events = self.averages()
+        if not frame_ms:
+            return "profiler: no frames yet"
+        lines = [f"{1000 / frame_ms:5.1f} fps  {frame_ms:6.2f} ms"]
+        for name, ms in sorted(events.items(), key=lambda item: -item[1]):
+            lines.append(f"{name:<16} {ms:6.2f} ms")
+        for name, value in self.frames[-1]["counters"].items():
+            lines.append(f"{name:<16} {value}")
+        return "\n".join(lines)
+
+    def _us(self, t):
+        return round((t - self.origin) * 1e6, 3)
+
+    def chrome_trace(self):
+        """The buffered frames as a Chrome trace event dict"""
+        events = []
+        main = threading.main_thread().ident
+        for i, frame in enumerate(self.frames):
+            events.append({
+                "name": "frame", "ph": "X", "pid": self.pid, "tid": main,
+                "ts": self._us(frame["start"]),
+                "dur": round((frame["end"] - frame["start"]) * 1e6, 3),
+                "args": {"index": i},
+            })
+            for name, start, end, thread in frame["events"]:
+                events.append({
+                    "name": name, "ph": "X", "pid": self.pid, "tid": thread,
+                    "ts": self._us(start), "dur": round((end - start) * 1e6, 3),
+                })
+            for name, value in frame["counters"].items():
+                events.append({
+                    "name": name, "ph": "C", "pid": self.pid,
+                    "ts": self._us(frame["start"]), "args": {name: value},
+                })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_trace(self, path):
+        """Write a Chrome trace JSON file that Perfetto also opens"""
+        with open(path, "w") as f:
+            json.dump(self.chrome_trace(), f)
@@ -0,0 +1,367 @@
+import os
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+from components.core.engine.ecs import Transform, Sprite
+from components.image_cache import images
+
+# Runs of at least this many copies of one texture of at most this many
+# pixels are drawn with array operations rather than pasted one by one
+SPLAT_MIN = 1024
+SPLAT_MAX_PIXELS = 64
+
+
+def create_placeholder_texture(size=(32, 32)):
+    """Stand-in for textures that can't be found on disk (shared, don't modify)"""
+    def draw_placeholder():
+        img = Image.new("RGBA", size, (0, 0, 0, 0))
+        draw = ImageDraw.Draw(img)
+        draw.rectangle([0, 0, size[0]-1, size[1]-1], outline="gray")
+        return img
+    return images.get("generated:placeholder_texture", size, create=draw_placeholder)
+
+
+class TextureAtlas:
+    """Packs sprite textures into a few large RGBA pages.
+
+    Textures are placed with a simple shelf packer: images go left to right
+    along the current shelf and a new shelf starts when a row is full. Each
+    texture id maps to (page, x, y, width, height).
+    """
+
+    def __init__(self, page_size=2048):
+        self.page_size = page_size
+        self.pages = []
+        self.regions = {}
+        # Regions of prebuilt pages by asset name (see load_pages)
+        self.named = {}
+        self._cursor = None
+
+    def _new_page(self):
+        self.pages.append(np.zeros((self.page_size, self.page_size, 4), dtype=np.uint8))
+        # x, y of the next free spot and height of the current shelf
+        self._cursor = [0, 0, 0]
+
+    def add(self, texture_id, image):
+        """Pack a PIL image under texture_id and return its region"""
+        if texture_id in self.regions:
+            return self.regions[texture_id]
+        image = image.convert("RGBA")
+        width, height = image.size
+        if width > self.page_size or height > self.page_size:
+            raise ValueError(f"Texture larger than atlas page: {image.size}")
+
+        if not self.pages:
+            self._new_page()
+        x, y, shelf = self._cursor
+        if x + width > self.page_size:
+            x, y, shelf = 0, y + shelf, 0
+        if y + height > self.page_size:
+            self._new_page()
+            x, y, shelf = self._cursor
+
+        page = len(self.pages) - 1
+        self.pages[page][y:y+height, x:x+width] = np.asarray(image)
+        self._cursor = [x + width, y, max(shelf, height)]
+        region = (page, x, y, width, height)
+        self.regions[texture_id] = region
+        return region
+
+    def load_pages(self, pages, regions):
+        """Adopt pages packed ahead of time by the asset pipeline"""
+        self.pages.extend(pages)
+        offset = len(self.pages) - len(pages)
+        for name, (page, x, y, width, height) in regions.items():
+            self.named[name] = (page + offset, x, y, width, height)
+        # Prebuilt pages are treated as full; new textures start a new page
+        self._cursor = [0, self.page_size, 0]
+
+    def add_named(self, texture_id, name):
+        """Point texture_id at a prebuilt region, if there is one"""
+        region = self.named.get(name)
+        if region is not None:
+            self.regions[texture_id] = region
+        return region
+
+    def pixels(self, texture_id):
+        """View of a packed texture's RGBA pixels inside its page"""
+        page, x, y, width, height = self.regions[texture_id]
+        return self.pages[page][y:y+height, x:x+width]
+
+
+class SpriteRenderer:
+    """Draws Sprite entities into an offscreen frame buffer.
+
+    Culling and sorting run as NumPy operations over the Sprite columns.
+    Visible sprites are ordered by (layer, atlas page, texture) and drawn
+    one batch per layer/page, compositing straight into a single PIL image
+    instead of creating a canvas item per sprite. No display is needed.
+    """
+
+    def __init__(self, width, height, texture_root=None, clear_color=(0, 0, 0), assets=None):
+        self.width = width
+        self.height = height
+        self.texture_root = texture_root
+        self.clear_color = clear_color
+        self.atlas = TextureAtlas()
+        # Optional AssetPipeline with prebuilt atlas pages and decoded images
+        self.assets = assets
+        if assets is not None:
+            self.atlas.load_pages(*assets.load_atlas())
+        self.camera = np.zeros(2, dtype=np.float32)
+        self.tiles = {}
+        self.draw_calls = 0
+        self.sprites_drawn = 0
+        # Optional SpatialIndex used to cull before touching sprite columns
+        self.spatial = None
+        # Optional ParticleSystem whose particles are drawn with the sprites
+        self.particles = None
+        self.cull_margin = 256
+        self.frame = None
+
+    def _texture_path(self, name):
+        if self.texture_root is None:
+            return None
+        for candidate in (
+            os.path.join(self.texture_root, "assets", name),
+            os.path.join(self.texture_root, name),
+        ):
+            if os.path.isfile(candidate):
+                return candidate
+        return None
+
+    def load_texture(self, texture_id, name):
+        """Pack a texture into the atlas, falling back to a placeholder"""
+        if name and self.atlas.add_named(texture_id, name):
+            return self.atlas.regions[texture_id]
+        image = None
+        if name and self.assets is not None:
+            pixels = self.assets.load_image(name)
+            if pixels is not None:
+                image = Image.fromarray(np.asarray(pixels), "RGBA")
+        if image is None:
+            path = self._texture_path(name) if name else None
+            image = images.get(path) if path else None
+        if image is not None:
+            if max(image.size) <= self.atlas.page_size:
+                return self.atlas.add(texture_id, image)
+            print(f"Texture {name} {image.size} is larger than an atlas page")
+        return self.atlas.add(texture_id, create_placeholder_texture())
+
+    def _sync_textures(self, world, texture_ids):
+        missing = [
+            (texture_id, world.strings.lookup(texture_id))
+            for texture_id in np.unique(texture_ids).tolist()
+            if texture_id not in self.atlas.regions
+        ]
+        # Decode every new file in the background first, so a batch of
+        # new textures isn't decoded one after another
+        built = self.assets.manifest["assets"] if self.assets is not None else {}
+        paths = [
+            self._texture_path(name) for _, name in missing
+            if name and name not in self.atlas.named and name not in built
+        ]
+        images.prefetch([path for path in paths if path])
+        for texture_id, name in missing:
+            self.load_texture(texture_id, name)
+
+    def build_batches(self, world):
+        """Cull and sort visible sprites and particles.
+
+        Returns (texture_ids, screen_xy, batches) where texture_ids and
+        screen_xy are in draw order and batches is a list of
+        (layer, page, start, end) runs over them. Particles come after
+        the sprites in their layer and page, one batch per texture.
+        """
+        texture_ids, xy, batches = self._sprite_batches(world)
+        if self.particles is None or not len(self.particles):
+            return texture_ids, xy, batches
+        particle_ids, particle_xy, particle_batches = self._particle_batches(world, len(texture_ids))
+        if not particle_batches:
+            return texture_ids, xy, batches
+        batches = sorted(batches + particle_batches, key=lambda batch: batch[:2])
+        return (np.concatenate([texture_ids] + particle_ids),
+                np.concatenate([xy] + particle_xy), batches)
+
+    def _screen_xy(self, position, sizes):
+        """Top-left screen corners of textures of the given sizes centred on position"""
+        xy = position - (self.camera + sizes / 2).astype(np.float32)
+        return np.floor(xy, out=xy).astype(np.int64)
+
+    def _on_screen(self, xy, sizes):
+        return (
+            (xy[:, 0] < self.width) & (xy[:, 1] < self.height)
+            & (xy[:, 0] + sizes[:, 0] > 0) & (xy[:, 1] + sizes[:, 1] > 0)
+        )
+
+    def _particle_batches(self, world, start):
+        """Visible particles as (texture ids, screen xy, batches) lists, per texture"""
+        particles = self.particles
+        n = particles.count
+        groups = sorted((layer, texture) for layer, texture in particles.groups if texture >= 0)
+        self._sync_textures(world, np.array([texture for _, texture in groups], dtype=np.int64))
+        texture_ids, xys, batches = [], [], []
+        for layer, texture in groups:
+            position = particles.position[:n]
+            if len(particles.groups) > 1:
+                position = position[(particles.texture[:n] == texture) & (particles.layer[:n] == layer)]
+            page, _, _, width, height = self.atlas.regions[texture]
+            size = np.array([width, height])
+            xy = self._screen_xy(position, size)
+            xy = xy[self._on_screen(xy, np.broadcast_to(size, xy.shape))]
+            if not len(xy):
+                continue
+            texture_ids.append(np.full(len(xy), texture, dtype=np.int32))
+            xys.append(xy)
+            batches.append((layer, page, start, start + len(xy)))
+            start += len(xy)
+        return texture_ids, xys, batches
+
+    def _sprite_batches(self, world):
+        transforms = world.store(Transform)
+        sprites = world.store(Sprite)
+        candidates = None
+        if self.spatial is not None:
+            # Widen the view by the largest texture so sprites centred just
+            # off screen but overlapping its edge are still found
+            sizes = [max(region[3:]) for region in self.atlas.regions.values()]
+            margin = max([self.cull_margin] + sizes)
+            candidates = self.spatial.query_aabb(
+                self.camera - margin,
+                self.camera + (self.width + margin, self.height + margin),
+            )
+        _, (t_slots, s_slots) = world.view(Transform, Sprite, entities=candidates)
+        texture_ids = sprites.columns["texture"][s_slots]
+        # Sprites without a texture have nothing to draw
+        textured = texture_ids >= 0
+        t_slots, s_slots = t_slots[textured], s_slots[textured]
+        texture_ids = texture_ids[textured]
+        layers = sprites.columns["layer"][s_slots]
+        self._sync_textures(world, texture_ids)
+        if not len(texture_ids):
+            return texture_ids, np.empty((0, 2), dtype=np.int64), []
+
+        # Per-texture lookup tables so regions can be fetched as arrays
+        table_size = int(texture_ids.max()) + 1
+        pages = np.zeros(table_size, dtype=np.int64)
+        sizes = np.zeros((table_size, 2), dtype=np.int64)
+        for texture_id, (page, _, _, width, height) in self.atlas.regions.items():
+            if texture_id < table_size:
+                pages[texture_id] = page
+                sizes[texture_id] = (width, height)
+
+        # Sprites are centred on their transform position
+        sprite_sizes = sizes[texture_ids]
+        xy = self._screen_xy(transforms.columns["position"][t_slots], sprite_sizes)
+        visible = self._on_screen(xy, sprite_sizes)
+        texture_ids = texture_ids[visible]
+        layers = layers[visible]
+        xy = xy[visible]
+        sprite_pages = pages[texture_ids]
+
+        order = np.lexsort((texture_ids, sprite_pages, layers))
+        texture_ids = texture_ids[order]
+        xy = xy[order]
+        keys = np.stack((layers[order], sprite_pages[order]), axis=1)
+
+        batches = []
+        if len(keys):
+            breaks = np.flatnonzero(np.any(keys[1:] != keys[:-1], axis=1)) + 1
+            starts = np.concatenate(([0], breaks))
+            ends = np.concatenate((breaks, [len(keys)]))
+            for start, end in zip(starts, ends):
+                batches.append((int(keys[start, 0]), int(keys[start, 1]), int(start), int(end)))
+        return texture_ids, xy, batches
+
+    def _tile(self, texture_id):
+        """PIL image and paste mask for a packed texture, cached per id"""
+        tile = self.tiles.get(texture_id)
+        if tile is None:
+            pixels = self.atlas.pixels(texture_id)
+            image = Image.fromarray(pixels, "RGBA")
+            # Fully opaque textures can skip alpha blending entirely
+            mask = None if pixels[:, :, 3].min() == 255 else image
+            tile = self.tiles[texture_id] = (image, mask)
+        return tile
+
+    def _splat(self, frame, texture_id, xy):
+        """Draw many copies of one small texture onto frame.
+
+        Works per texture pixel rather than per copy: the copies' corners
+        are marked in a padded mask, and for each distinct colour in the
+        texture the mask is shifted to every pixel of that colour, OR-ed
+        together and pasted with the colour in one call. Overlapping
+        copies therefore don't blend with each other, which is fine for
+        particles.
+        """
+        texture = self.atlas.pixels(texture_id)
+        height, width = texture.shape[:2]
+        # Partly visible copies start up to one texture size off screen
+        corners = np.zeros((self.height + height, self.width + width), dtype=bool)
+        corners[xy[:, 1] + height, xy[:, 0] + width] = True
+
+        colors = {}
+        for dy, dx in zip(*np.nonzero(texture[:, :, 3])):
+            colors.setdefault(tuple(texture[dy, dx].tolist()), []).append((dy, dx))
+        for (r, g, b, a), offsets in colors.items():
+            if len(offsets) == width * height:
+                # One colour over the whole texture: widen the corners
+                # into boxes with a few doubling shifts
+                mask = corners
+                for axis, size in ((1, width), (0, height)):
+                    covered = 1
+                    while covered < size:
+                        shift = min(covered, size - covered)
+                        if axis:
+                            mask[:, shift:] |= mask[:, :-shift]
+                        else:
+                            mask[shift:] |= mask[:-shift]
+                        covered += shift
+                mask = np.ascontiguousarray(mask[height:, width:])
+            else:
+                mask = np.zeros((self.height, self.width), dtype=bool)
+                for dy, dx in offsets:
+                    mask |= corners[height - dy:height - dy + self.height,
+                                    width - dx:width - dx + self.width]
+            if a == 255:
+                mask = Image.fromarray(mask)
+            else:
+                mask = Image.fromarray(mask.view(np.uint8) * np.uint8(a), "L")
+            frame.paste((r, g, b), (0, 0), mask)
+
+    def render(self, world):
+        """Render one frame and return it as a PIL image.
+
+        Long runs of one small texture (particles, mostly) are drawn
+        with ``_splat`` instead of one paste per sprite.
+        """
+        texture_ids, xy, batches = self.build_batches(world)
+
+        frame = Image.new("RGB", (self.width, self.height), self.clear_color)
+        paste = frame.paste
+        # Python lists for the paste loop, made once a batch needs them
+        texture_list = xy_list = None
+        for _, _, start, end in batches:
+            texture_id = int(texture_ids[start])
+            if end - start >= SPLAT_MIN and texture_id == texture_ids[end - 1]:
+                region = self.atlas.regions[texture_id]
+                if region[3] * region[4] <= SPLAT_MAX_PIXELS:
+                    self._splat(frame, texture_id, xy[start:end])
+                    continue
+            if texture_list is None:
+                texture_list = texture_ids.tolist()
+                xy_list = xy.tolist()
+            # Sorted by texture within a batch, so the tile lookup only
+            # changes at texture boundaries
+            current = None
+            for i in range(start, end):
+                if texture_list[i] != current:
+                    current = texture_list[i]
+                    image, mask = self._tile(current)
+                paste(image, xy_list[i], mask)
+
+        self.draw_calls = len(batches)
+        self.sprites_drawn = len(texture_ids)
+        self.frame = frame
+        return frame
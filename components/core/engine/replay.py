@@ -0,0 +1,351 @@
+"""Recording engine sessions and replaying them frame for frame.
+
+A replay file holds every frame's dt and input events, plus periodic
+snapshots of the world's arrays and of every system with state (any
+system with ``snapshot``/``restore`` methods). Every ``keyframe_interval``
+snapshots is a full keyframe; the ones between store each array XOR-ed
+with the previous snapshot, which leaves mostly zero bytes for the
+compressor. The simulation is deterministic for a given dt and input,
+so the state at any frame is the nearest snapshot before it plus the
+recorded frames after it, re-simulated.
+
+The file is a sequence of records, each a (kind, frame, size) header
+and a compressed payload, so a reader finds every snapshot by skipping
+over payloads. Inspect or check a recording from the repository root:
+
+    python -m components.core.engine.replay session.axreplay
+    python -m components.core.engine.replay session.axreplay --verify --project path
+"""
+import argparse
+import bisect
+import json
+import lzma
+import os
+import struct
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+MAGIC = b"AXREPLAY"
+VERSION = 1
+RECORD = struct.Struct("<cQQ")
+HEADER, INPUT, KEYFRAME, DELTA = b"H", b"I", b"K", b"D"
+EXTENSION = ".axreplay"
+
+COMPRESSORS = {
+    "zlib": (lambda data: zlib.compress(data, 1), zlib.decompress),
+    "lzma": (lambda data: lzma.compress(data, preset=0), lzma.decompress),
+}
+
+
+def capture_state(engine):
+    """Copy the engine state a replay resumes from.
+
+    Returns (meta, arrays): JSON values and NumPy arrays by name. Only
+    copying happens here; encoding is left to the writer thread.
+    """
+    arrays = {"world/" + name: array for name, array in engine.world.snapshot().items()}
+    systems = {}
+    for system in engine.systems:
+        if not hasattr(system, "snapshot"):
+            continue
+        values = systems[system.name] = {}
+        for key, value in system.snapshot().items():
+            if isinstance(value, np.ndarray):
+                arrays[f"system/{system.name}/{key}"] = value
+            else:
+                values[key] = value
+    meta = {
+        "frame": engine.frame_index,
+        "strings": len(engine.world.strings),
+        "input": engine.input.snapshot(),
+        "systems": systems,
+    }
+    return meta, arrays
+
+
+def restore_state(engine, meta, arrays, strings):
+    """Put an engine back into a captured state"""
+    world = {name[6:]: array for name, array in arrays.items() if name.startswith("world/")}
+    engine.world.restore(world, strings)
+    for system in engine.systems:
+        if not hasattr(system, "restore"):
+            continue
+        state = dict(meta["systems"].get(system.name, {}))
+        prefix = f"system/{system.name}/"
+        state.update({name[len(prefix):]: array for name, array in arrays.items()
+                      if name.startswith(prefix)})
+        system.restore(state)
+    engine.input.restore(meta["input"])
+    engine.frame_index = meta["frame"]
+
+
+def encode_snapshot(meta, arrays, previous=None):
+    """Snapshot payload; arrays matching previous in shape and dtype are XOR-ed with it"""
+    specs, blocks = [], []
+    for name, array in arrays.items():
+        data = np.ascontiguousarray(array).reshape(-1).view(np.uint8)
+        old = previous.get(name) if previous is not None else None
+        xor = old is not None and old.shape == array.shape and old.dtype == array.dtype
+        if xor:
+            data = np.bitwise_xor(data, np.ascontiguousarray(old).reshape(-1).view(np.uint8))
+        specs.append([name, array.dtype.str, list(array.shape), xor])
+        blocks.append(data.tobytes())
+    header = json.dumps({"meta": meta, "arrays": specs}).encode("utf-8")
+    return struct.pack("<Q", len(header)) + header + b"".join(blocks)
+
+
+def decode_snapshot(payload, previous=None):
+    """(meta, arrays) from a payload, undoing XOR against previous"""
+    (size,) = struct.unpack_from("<Q", payload)
+    header = json.loads(payload[8:8 + size])
+    offset = 8 + size
+    arrays = {}
+    for name, dtype, shape, xor in header["arrays"]:
+        dtype = np.dtype(dtype)
+        count = int(np.prod(shape)) if shape else 1
+        data = np.frombuffer(payload, dtype=np.uint8, count=count * dtype.itemsize, offset=offset)
+        offset += count * dtype.itemsize
+        if xor:
+            data = np.bitwise_xor(data, previous[name].reshape(-1).view(np.uint8))
+        else:
+            data = data.copy()
+        arrays[name] = data.view(dtype).reshape(shape)
+    return header["meta"], arrays
+
+
+class ReplayRecorder:
+    """Writes a replay of an engine session as it runs.
+
+    ``record`` is called by the engine after each frame's update. It
+    keeps the frame's dt and input events and, every
+    ``snapshot_interval`` frames, copies the engine state. Encoding,
+    compression and writing happen on a single background thread, in
+    order, so the frame only pays for the copies.
+    """
+
+    def __init__(self, engine, path, snapshot_interval=30, keyframe_interval=10,
+                 compression="zlib"):
+        self.path = path
+        self.snapshot_interval = snapshot_interval
+        self.keyframe_interval = keyframe_interval
+        self.compress = COMPRESSORS[compression][0]
+        self.file = open(path, "wb")
+        self.writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="replay")
+        self.jobs = []
+        self.inputs = []
+        self.snapshots = 0
+        self.last_snapshot = engine.frame_index
+        # Strings already written; the table is append-only while recording
+        self.strings = 0
+        # Last snapshot's arrays, used by the writer thread only
+        self.previous = None
+
+        self.file.write(MAGIC)
+        header = json.dumps({
+            "version": VERSION,
+            "compression": compression,
+            "snapshot_interval": snapshot_interval,
+            "keyframe_interval": keyframe_interval,
+            # None for the built-in template
+            "project": engine.project_path if engine.assets is not None else None,
+        }).encode("utf-8")
+        self._write(HEADER, engine.frame_index, header)
+        self.snapshot(engine)
+
+    def _write(self, kind, frame, payload):
+        self.file.write(RECORD.pack(kind, frame, len(payload)))
+        self.file.write(payload)
+
+    def _submit(self, fn, *args):
+        self.jobs = [job for job in self.jobs if not job.done() or job.exception()]
+        self.jobs.append(self.writer.submit(fn, *args))
+
+    def record(self, engine, dt):
+        self.inputs.append([engine.frame_index, dt, engine.input.events])
+        if engine.frame_index - self.last_snapshot >= self.snapshot_interval:
+            self.snapshot(engine)
+
+    def snapshot(self, engine):
+        """Write any pending input, then the engine's current state"""
+        self._flush_inputs(engine.frame_index)
+        meta, arrays = capture_state(engine)
+        keyframe = self.snapshots % self.keyframe_interval == 0
+        self.snapshots += 1
+        self.last_snapshot = engine.frame_index
+        strings = engine.world.strings.strings
+        self._submit(self._write_snapshot, meta, arrays, keyframe,
+                     strings[:] if keyframe else strings[self.strings:len(strings)])
+        self.strings = len(strings)
+
+    def _flush_inputs(self, frame):
+        if self.inputs:
+            inputs, self.inputs = self.inputs, []
+            self._submit(self._write_inputs, frame, inputs)
+
+    def _write_inputs(self, frame, inputs):
+        payload = self.compress(json.dumps(inputs).encode("utf-8"))
+        self._write(INPUT, frame, payload)
+
+    def _write_snapshot(self, meta, arrays, keyframe, strings):
+        meta = dict(meta, new_strings=strings, keyframe=keyframe)
+        payload = encode_snapshot(meta, arrays, None if keyframe else self.previous)
+        self.previous = arrays
+        self._write(KEYFRAME if keyframe else DELTA, meta["frame"], self.compress(payload))
+
+    def close(self, engine=None):
+        """Write what is pending (and a final snapshot, given the engine)"""
+        if engine is not None and engine.frame_index != self.last_snapshot:
+            self.snapshot(engine)
+        else:
+            self._flush_inputs(self.last_snapshot)
+        self.writer.shutdown(wait=True)
+        for job in self.jobs:
+            if job.exception():
+                print(f"Failed to write replay {self.path}: {job.exception()}")
+        self.file.close()
+
+
+class Replay:
+    """A recorded session: its inputs and snapshots, with seeking.
+
+    Opening reads the record headers and the (small) input blocks;
+    snapshots are decoded when needed, continuing from the last one
+    decoded when seeking forward.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.header = None
+        self.snapshots = []   # (frame, kind, offset, size), in frame order
+        self.inputs = {}      # frame -> (dt, events)
+        self.file = open(path, "rb")
+        if self.file.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"Not a replay: {path}")
+        file_size = os.fstat(self.file.fileno()).st_size
+        while True:
+            record = self.file.read(RECORD.size)
+            if len(record) < RECORD.size:
+                break
+            kind, frame, size = RECORD.unpack(record)
+            offset = self.file.tell()
+            if offset + size > file_size:
+                # A recording cut short ends at its last complete record
+                break
+            if kind == HEADER:
+                self.header = json.loads(self.file.read(size))
+                self.decompress = COMPRESSORS[self.header["compression"]][1]
+            elif kind == INPUT:
+                data = self.file.read(size)
+                for f, dt, events in json.loads(self.decompress(data)):
+                    self.inputs[f] = (dt, events)
+            else:
+                self.snapshots.append((frame, kind, offset, size))
+                self.file.seek(size, 1)
+        if self.header is None or not self.snapshots:
+            raise ValueError(f"Empty or damaged replay: {path}")
+        self.frames = [s[0] for s in self.snapshots]
+        self.first_frame = self.frames[0]
+        self.last_frame = max([self.frames[-1]] + list(self.inputs))
+        self.cached = None    # (snapshot index, meta, arrays, strings)
+
+    def close(self):
+        self.file.close()
+
+    def _read(self, index):
+        _, _, offset, size = self.snapshots[index]
+        self.file.seek(offset)
+        return self.decompress(self.file.read(size))
+
+    def state(self, frame):
+        """(meta, arrays, strings) of the last snapshot at or before frame"""
+        target = bisect.bisect_right(self.frames, frame) - 1
+        if target < 0:
+            raise ValueError(f"Frame {frame} is before the recording starts")
+        start = target
+        while self.snapshots[start][1] != KEYFRAME:
+            start -= 1
+        if self.cached is not None and start <= self.cached[0] <= target:
+            index, meta, arrays, strings = self.cached
+        else:
+            index, arrays, strings = start - 1, None, []
+        while index < target:
+            index += 1
+            meta, arrays = decode_snapshot(self._read(index), arrays)
+            strings = meta["new_strings"] if meta["keyframe"] else strings + meta["new_strings"]
+        self.cached = (index, meta, arrays, strings)
+        return meta, arrays, strings
+
+    def seek(self, engine, frame):
+        """Bring engine to the state after frame by restoring and re-simulating"""
+        meta, arrays, strings = self.state(frame)
+        restore_state(engine, meta, arrays, strings)
+        for f in range(meta["frame"] + 1, frame + 1):
+            self.step(engine, f)
+        return engine
+
+    def step(self, engine, frame):
+        dt, events = self.inputs[frame]
+        engine.step(dt, events)
+
+    def play(self, engine, start=None, end=None):
+        """Seek to start, then yield each following frame number once it is simulated"""
+        start = self.first_frame if start is None else start
+        end = self.last_frame if end is None else end
+        self.seek(engine, start)
+        for frame in range(start + 1, end + 1):
+            self.step(engine, frame)
+            yield frame
+
+    def verify(self, engine):
+        """Replay everything, comparing with each snapshot bit for bit.
+
+        Returns [(frame, [differing array names])] for snapshots that
+        don't match; empty means the replay is frame-exact.
+        """
+        mismatches = []
+        snapshot_frames = set(self.frames)
+        for frame in self.play(engine):
+            if frame not in snapshot_frames:
+                continue
+            expected_meta, expected, _ = self.state(frame)
+            meta, arrays = capture_state(engine)
+            names = sorted(
+                name for name in expected.keys() | arrays.keys()
+                if name not in arrays or name not in expected
+                or expected[name].dtype != arrays[name].dtype
+                or not np.array_equal(expected[name].view(np.uint8), arrays[name].view(np.uint8))
+            )
+            if meta["systems"] != expected_meta["systems"]:
+                names.append("systems")
+            if names:
+                mismatches.append((frame, names))
+        return mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect or verify a replay")
+    parser.add_argument("replay")
+    parser.add_argument("--verify", action="store_true",
+                        help="re-simulate the whole recording and compare with its snapshots")
+    parser.add_argument("--project", help="project the replay was recorded in")
+    args = parser.parse_args()
+
+    replay = Replay(args.replay)
+    keyframes = sum(kind == KEYFRAME for _, kind, _, _ in replay.snapshots)
+    print(f"{args.replay}: frames {replay.first_frame}-{replay.last_frame}, "
+          f"{len(replay.snapshots)} snapshots ({keyframes} keyframes), "
+          f"{replay.header['compression']} compression")
+    if args.verify:
+        from components.core.engine.engine import Engine
+        engine = Engine(args.project or replay.header["project"])
+        mismatches = replay.verify(engine)
+        for frame, names in mismatches:
+            print(f"Frame {frame} differs: {', '.join(names)}")
+        print("Replay is frame-exact" if not mismatches else f"{len(mismatches)} snapshots differ")
+    replay.close()
+
+
+if __name__ == "__main__":
+    main()
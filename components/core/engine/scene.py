@@ -0,0 +1,119 @@
+import os
+import json
+
+import numpy as np
+
+from components.core.engine.ecs import World, PrefabInstance
+from components.core.engine.prefab import Prefab
+
+
+def load_scene(scene_path, world=None):
+    """Load a .scene file into a World"""
+    with open(scene_path, "r") as f:
+        data = json.load(f)
+    return load_scene_data(data, world, base_path=os.path.dirname(scene_path))
+
+
+def load_prefabs(definitions, base_path=None):
+    """Prefabs from a scene's "prefabs" block.
+
+    Each entry is either an inline definition or the path of a prefab
+    file relative to the scene.
+    """
+    prefabs = {}
+    for name, definition in definitions.items():
+        if isinstance(definition, str):
+            path = os.path.join(base_path or "", definition)
+            try:
+                prefabs[name] = Prefab.load(name, path)
+            except (OSError, json.JSONDecodeError) as e:
+                print(f"Error loading prefab {name}: {e}")
+        else:
+            prefabs[name] = Prefab.from_data(name, definition)
+    return prefabs
+
+
+def load_scene_data(data, world=None, base_path=None):
+    """Populate a World from parsed scene JSON.
+
+    Entities are created in one batch, then each component type is added
+    column-wise so the stores are filled with a single bulk copy per type.
+    Entities with a "prefab" list only their overrides: each prefab's
+    instances are filled from the shared definition in one broadcast per
+    field, then the overridden fields are written into just those rows.
+    Component type strings are mapped to the world's type ids as they
+    are read, and the name index behind ``World.find`` is built once at
+    the end.
+    """
+    if world is None:
+        world = World()
+    prefabs = load_prefabs(data.get("prefabs", {}), base_path)
+    world.prefabs.update(prefabs)
+
+    entities = data.get("entities", [])
+    eids = world.create_entities(len(entities), [e.get("name") for e in entities])
+
+    # Gather rows per component type id before touching the stores
+    type_ids = world.type_ids
+    types = list(world.types.values())
+    batches = {}
+    instances = {}
+    overrides = {}
+    for eid, entity in zip(eids, entities):
+        prefab = entity.get("prefab")
+        if prefab is not None and prefab not in prefabs:
+            print(f"Unknown prefab: {prefab}")
+            prefab = None
+        if prefab is not None:
+            instances.setdefault(prefab, []).append(eid)
+        for component in entity.get("components", []):
+            type_name = component.get("type")
+            type_id = type_ids.get(type_name)
+            if type_id is None:
+                print(f"Unknown component type: {type_name}")
+                continue
+            if prefab is not None and type_name in prefabs[prefab].components:
+                # Written over the prefab's values once instances exist
+                for name, value in component.items():
+                    if name != "type":
+                        rows = overrides.setdefault((type_name, name), ([], []))
+                        rows[0].append(eid)
+                        rows[1].append(value)
+                continue
+            rows = batches.setdefault(type_id, ([], []))
+            rows[0].append(eid)
+            rows[1].append(component)
+
+    for type_id, (type_eids, components) in batches.items():
+        ctype = types[type_id]
+        columns = {}
+        for name, field in ctype.fields.items():
+            if not any(name in c for c in components):
+                continue
+            default = np.broadcast_to(field.default, field.shape).tolist()
+            columns[name] = [c.get(name, default) for c in components]
+        world.add_components(ctype, type_eids, **columns)
+
+    for name, prefab_eids in instances.items():
+        prefab = prefabs[name]
+        for type_name in prefab.components:
+            ctype = world.types.get(type_name)
+            if ctype is None:
+                print(f"Unknown component type: {type_name}")
+                continue
+            world.add_components(ctype, prefab_eids, **prefab.columns(
+                world, ctype, len(prefab_eids)))
+        world.add_components(PrefabInstance, prefab_eids, prefab=np.full(
+            len(prefab_eids), world.strings.intern(name), dtype=np.int32))
+
+    for (type_name, name), (override_eids, values) in overrides.items():
+        store = world.store(type_name)
+        field = store.type.fields.get(name)
+        if field is None:
+            continue
+        if field.interned:
+            values = [world.strings.intern(v) if isinstance(v, str) else v for v in values]
+        store.columns[name][store.sparse[override_eids]] = values
+
+    world.index_names()
+    return world
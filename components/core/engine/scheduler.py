@@ -0,0 +1,153 @@
+import os
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+
+def access_names(items):
+    """Component types (or plain resource names) as a set of names"""
+    return {getattr(item, "name", item) for item in items}
+
+
+def conflicts(a, b):
+    """True if systems a and b can't run at the same time.
+
+    Systems that don't declare ``reads``/``writes`` conflict with
+    everything, so undeclared systems keep running in order.
+    """
+    if not (hasattr(a, "writes") and hasattr(b, "writes")):
+        return True
+    a_reads, a_writes = access_names(getattr(a, "reads", ())), access_names(a.writes)
+    b_reads, b_writes = access_names(getattr(b, "reads", ())), access_names(b.writes)
+    return bool(a_writes & (b_reads | b_writes) or b_writes & a_reads)
+
+
+def build_graph(systems):
+    """For each system, the indexes of earlier systems it must wait for"""
+    return [
+        [j for j in range(i) if conflicts(systems[j], system)]
+        for i, system in enumerate(systems)
+    ]
+
+
+def overlap_time(intervals):
+    """Seconds during which at least two of the (start, end, ...) intervals ran"""
+    events = sorted([(i[0], 1) for i in intervals] + [(i[1], -1) for i in intervals])
+    running = 0
+    parallel = 0.0
+    last = None
+    for t, step in events:
+        if running >= 2:
+            parallel += t - last
+        running += step
+        last = t
+    return parallel
+
+
+class Scheduler:
+    """Runs engine systems in dependency order, in parallel where allowed.
+
+    Each system may declare the component types it ``reads`` and
+    ``writes`` (class attributes holding ComponentTypes or resource
+    names such as "spatial"). Two systems conflict when one writes
+    something the other touches; a system waits for every earlier
+    system it conflicts with, so the result matches running them in
+    list order. Everything else runs on a thread pool; the NumPy kernels
+    systems are built from release the GIL while they work.
+
+    Systems running in parallel may only change component columns in
+    place (plus ``World.despawn`` and ``World.query``, which lock).
+    Creating or destroying entities and components must happen in a
+    system that conflicts with the others.
+
+    After ``run`` the per-system durations are in ``timings`` and
+    ``parallel`` holds the fraction of the update during which two or
+    more systems were running.
+    """
+
+    def __init__(self, systems=(), workers=None):
+        cpus = os.cpu_count() or 1
+        # With one CPU a pool only adds overhead, so run serially
+        self.workers = 1 if cpus == 1 else workers or min(4, cpus)
+        self.pool = None
+        self.systems = []
+        self.graph = []
+        self.timings = {}
+        # (start, end, thread id) per system from the last run
+        self.intervals = []
+        self.parallel = 0.0
+        self.speedup = 1.0
+        self.set_systems(systems)
+
+    def set_systems(self, systems):
+        self.systems = list(systems)
+        self.graph = build_graph(self.systems)
+        # A chain where every system waits for the previous one gains
+        # nothing from threads
+        self.serial = self.workers < 2 or all(
+            i - 1 in deps for i, deps in enumerate(self.graph) if i
+        )
+        if not self.serial and self.pool is None:
+            self.pool = ThreadPoolExecutor(self.workers, thread_name_prefix="system")
+
+    def shutdown(self):
+        if self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
+
+    def _timed(self, system, world, dt):
+        start = time.perf_counter()
+        system.update(world, dt)
+        return start, time.perf_counter(), threading.get_ident()
+
+    def run(self, world, dt):
+        """Update every system once"""
+        start = time.perf_counter()
+        if self.serial:
+            intervals = [self._timed(system, world, dt) for system in self.systems]
+        else:
+            intervals = self._run_parallel(world, dt)
+        wall = time.perf_counter() - start
+
+        self.intervals = intervals
+        self.timings = {
+            system.name: end - begin
+            for system, (begin, end, _) in zip(self.systems, intervals)
+        }
+        busy = sum(self.timings.values())
+        self.parallel = overlap_time(intervals) / wall if wall > 0 else 0.0
+        self.speedup = busy / wall if wall > 0 else 1.0
+
+    def _run_parallel(self, world, dt):
+        systems = self.systems
+        waiting = {i: set(deps) for i, deps in enumerate(self.graph)}
+        dependents = {i: [] for i in waiting}
+        for i, deps in waiting.items():
+            for j in deps:
+                dependents[j].append(i)
+        intervals = [None] * len(systems)
+        running = {}
+
+        def release(i):
+            for k in dependents[i]:
+                waiting[k].discard(i)
+
+        while waiting or running:
+            ready = sorted(i for i, deps in waiting.items() if not deps)
+            for i in ready:
+                del waiting[i]
+            if ready:
+                # Run one ready system on this thread instead of handing
+                # it to the pool and then blocking
+                inline = ready.pop()
+                for i in ready:
+                    running[self.pool.submit(self._timed, systems[i], world, dt)] = i
+                intervals[inline] = self._timed(systems[inline], world, dt)
+                release(inline)
+                continue
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                i = running.pop(future)
+                intervals[i] = future.result()
+                release(i)
+        return intervals
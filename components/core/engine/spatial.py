@@ -0,0 +1,161 @@
+import numpy as np
+
+from components.core.engine.ecs import Transform
+
+
+def cell_keys(cells):
+    """Pack (n, 2) integer cell coordinates into one int64 key each"""
+    return (cells[:, 0].astype(np.int64) << 32) + (cells[:, 1].astype(np.int64) & 0xFFFFFFFF)
+
+
+class SpatialIndex:
+    """Spatial hash over Transform positions.
+
+    Entities are bucketed by the grid cell their position falls in.
+    ``sync`` compares every position's cell against the one it was indexed
+    under (as array operations) and only touches buckets for entities that
+    changed cell, were added, or lost their Transform. Queries gather the
+    buckets overlapping the query shape and filter candidates exactly.
+    """
+
+    name = "spatial"
+    reads = (Transform,)
+    # Systems that query the index declare reads = ("spatial",)
+    writes = ("spatial",)
+
+    def __init__(self, cell_size=128.0):
+        self.cell_size = float(cell_size)
+        self.buckets = {}
+        # Per entity id: cell key it is filed under, and whether it is filed
+        self.keys = np.zeros(0, dtype=np.int64)
+        self.indexed = np.zeros(0, dtype=bool)
+        self.world = None
+
+    def __len__(self):
+        return int(self.indexed.sum())
+
+    def _reserve(self, count):
+        if count <= len(self.keys):
+            return
+        capacity = max(count, len(self.keys) * 2, 64)
+        keys = np.zeros(capacity, dtype=np.int64)
+        keys[:len(self.keys)] = self.keys
+        indexed = np.zeros(capacity, dtype=bool)
+        indexed[:len(self.indexed)] = self.indexed
+        self.keys, self.indexed = keys, indexed
+
+    def _file(self, eids, old_keys, new_keys, was_indexed):
+        buckets = self.buckets
+        for eid, old, new, was in zip(eids.tolist(), old_keys.tolist(),
+                                      new_keys.tolist(), was_indexed.tolist()):
+            if was:
+                bucket = buckets[old]
+                bucket.discard(eid)
+                if not bucket:
+                    del buckets[old]
+            bucket = buckets.get(new)
+            if bucket is None:
+                bucket = buckets[new] = set()
+            bucket.add(eid)
+
+    def sync(self, world):
+        """Bring the index up to date with the world; returns entities moved"""
+        self.world = world
+        store = world.store(Transform)
+        eids = store.entity_ids()
+        self._reserve(max(world.entity_count, len(store.sparse)))
+
+        # Entities that lost their Transform (or were destroyed)
+        present = np.zeros(len(self.indexed), dtype=bool)
+        present[eids] = True
+        gone = np.flatnonzero(self.indexed & ~present)
+        for eid, key in zip(gone.tolist(), self.keys[gone].tolist()):
+            bucket = self.buckets[key]
+            bucket.discard(eid)
+            if not bucket:
+                del self.buckets[key]
+        self.indexed[gone] = False
+
+        cells = np.floor(store.column("position") / self.cell_size)
+        keys = cell_keys(cells)
+        was_indexed = self.indexed[eids]
+        changed = ~was_indexed | (self.keys[eids] != keys)
+        if changed.any():
+            moved = eids[changed]
+            self._file(moved, self.keys[moved], keys[changed], was_indexed[changed])
+            self.keys[moved] = keys[changed]
+            self.indexed[moved] = True
+        return int(changed.sum()) + len(gone)
+
+    def update(self, world, dt):
+        self.sync(world)
+
+    def snapshot(self):
+        # Derived from Transform positions; rebuilt after a restore
+        return {}
+
+    def restore(self, state):
+        self.buckets = {}
+        self.indexed[:] = False
+        if self.world is not None:
+            self.sync(self.world)
+
+    def _candidates(self, lo, hi):
+        lo_cell = np.floor(np.asarray(lo, dtype=np.float64) / self.cell_size).astype(np.int64)
+        hi_cell = np.floor(np.asarray(hi, dtype=np.float64) / self.cell_size).astype(np.int64)
+        xs = np.arange(lo_cell[0], hi_cell[0] + 1)
+        ys = np.arange(lo_cell[1], hi_cell[1] + 1)
+        # Huge queries are cheaper as a walk over the occupied buckets
+        if len(xs) * len(ys) > len(self.buckets):
+            keys = [k for k in self.buckets
+                    if lo_cell[0] <= (k >> 32) <= hi_cell[0]
+                    and lo_cell[1] <= ((k + (1 << 31)) & 0xFFFFFFFF) - (1 << 31) <= hi_cell[1]]
+        else:
+            grid = np.stack(np.meshgrid(xs, ys, indexing="ij"), axis=-1).reshape(-1, 2)
+            keys = cell_keys(grid).tolist()
+        buckets = self.buckets
+        found = [buckets[k] for k in keys if k in buckets]
+        if not found:
+            return np.empty(0, dtype=np.int64)
+        return np.fromiter(
+            (eid for bucket in found for eid in bucket),
+            dtype=np.int64, count=sum(len(b) for b in found),
+        )
+
+    def _positions(self, eids):
+        """Candidates that still have a Transform, and their positions.
+
+        Buckets keep entities destroyed since the last ``sync``; they are
+        dropped here rather than reported at a garbage position.
+        """
+        store = self.world.store(Transform)
+        eids = eids[eids < len(store.sparse)]
+        slots = store.sparse[eids]
+        present = slots >= 0
+        return eids[present], store.columns["position"][slots[present]]
+
+    def query_aabb(self, lo, hi):
+        """Entity ids whose position lies inside the box [lo, hi]"""
+        eids = self._candidates(lo, hi)
+        if not len(eids):
+            return eids
+        eids, p = self._positions(eids)
+        inside = np.all((p >= lo) & (p <= hi), axis=1)
+        return eids[inside]
+
+    def query_radius(self, center, radius):
+        """Entity ids within radius of center, nearest first"""
+        center = np.asarray(center, dtype=np.float64)
+        eids = self._candidates(center - radius, center + radius)
+        if not len(eids):
+            return eids
+        eids, p = self._positions(eids)
+        d2 = np.sum((p - center) ** 2, axis=1)
+        inside = d2 <= radius * radius
+        eids, d2 = eids[inside], d2[inside]
+        return eids[np.argsort(d2, kind="stable")]
+
+    def pick(self, point, radius=16.0):
+        """Closest entity to point within radius, or None"""
+        eids = self.query_radius(point, radius)
+        return int(eids[0]) if len(eids) else None
@@ -0,0 +1,266 @@
+"""Streaming world chunks.
+
+A large scene is split into square chunks by Transform position and
+stored next to the scene as a directory of cooked chunk files::
+
+    scene/main.chunks/index.json
+    scene/main.chunks/resident.cscene   entities without a Transform
+    scene/main.chunks/3_-1.cscene       one file per occupied chunk
+
+At runtime ChunkStreamer keeps the chunks near the camera loaded: files
+are read on a background thread, merged into the live World a few at a
+time, and destroyed again once the camera moves away or the memory
+budget needs the room. Split a scene from the repository root with:
+
+    python -m components.core.engine.streaming path/to/main.scene --chunk-size 1024
+"""
+import argparse
+import json
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from components.core.engine.ecs import World, Transform
+from components.core.engine.scene import load_scene
+from components.core.engine.cooked import load_cooked, save_cooked, EXTENSION as COOKED_EXTENSION
+
+EXTENSION = ".chunks"
+INDEX_NAME = "index.json"
+RESIDENT_NAME = "resident" + COOKED_EXTENSION
+
+
+def chunk_directory(project_path, scene_name):
+    return os.path.join(project_path, "scene", scene_name + EXTENSION)
+
+
+def world_bytes(world):
+    """Approximate memory held by a world's component data"""
+    return sum(
+        column[:store.count].nbytes + store.count * 8
+        for store in world.stores.values()
+        for column in store.columns.values()
+    )
+
+
+def split_scene(scene_path, chunk_size=1024.0, out_dir=None):
+    """Split a .scene (or cooked scene) into a chunk directory"""
+    if out_dir is None:
+        out_dir = os.path.splitext(scene_path)[0] + EXTENSION
+    if scene_path.endswith(COOKED_EXTENSION):
+        world = load_cooked(scene_path)
+    else:
+        world = load_scene(scene_path)
+    return split_world(world, out_dir, chunk_size)
+
+
+def split_world(world, out_dir, chunk_size=1024.0):
+    """Write world into out_dir as chunk files plus an index"""
+    os.makedirs(out_dir, exist_ok=True)
+    transforms = world.store(Transform)
+    placed = transforms.entity_ids()
+    cells = np.floor(transforms.column("position") / chunk_size).astype(np.int64)
+
+    alive = np.flatnonzero(world.alive[:world.entity_count])
+    resident = np.setdiff1d(alive, placed)
+    part = World()
+    part.merge(world, resident)
+    save_cooked(part, os.path.join(out_dir, RESIDENT_NAME))
+
+    chunks = []
+    order = np.lexsort((cells[:, 1], cells[:, 0]))
+    cells, placed = cells[order], placed[order]
+    starts = np.flatnonzero(np.any(np.diff(cells, axis=0) != 0, axis=1)) + 1
+    for group in np.split(np.arange(len(placed)), starts):
+        if not len(group):
+            continue
+        x, y = (int(v) for v in cells[group[0]])
+        part = World()
+        part.merge(world, placed[group])
+        file_name = f"{x}_{y}{COOKED_EXTENSION}"
+        save_cooked(part, os.path.join(out_dir, file_name))
+        chunks.append({
+            "x": x, "y": y, "file": file_name,
+            "entities": len(group), "bytes": world_bytes(part),
+        })
+
+    index = {"version": 1, "chunk_size": chunk_size,
+             "resident": RESIDENT_NAME, "chunks": chunks}
+    with open(os.path.join(out_dir, INDEX_NAME), "w") as f:
+        json.dump(index, f, indent=2)
+    return out_dir
+
+
+def _read_chunk(path):
+    """Worker: map a chunk file and touch its pages so the merge doesn't"""
+    world = load_cooked(path)
+    for store in world.stores.values():
+        for column in store.columns.values():
+            column.sum()
+    return world
+
+
+class ChunkStreamer:
+    """Loads and unloads scene chunks around the camera.
+
+    Every update the chunks within ``load_radius`` of the view centre
+    are wanted, nearest first. Missing ones are read on a background
+    thread; finished reads are merged into the World on the main thread,
+    stopping once ``merge_budget`` seconds have been spent so a burst of
+    loads is spread over several frames. Chunks further than
+    ``unload_radius`` are destroyed. Loaded chunks are kept in LRU order
+    of when they were last wanted; when a new chunk would take resident
+    data past ``budget_bytes`` the least recently wanted chunks that are
+    no longer wanted are evicted first, and if that isn't enough the
+    load waits.
+
+    The streamer creates and destroys entities, so it declares no
+    component access and the scheduler never runs it beside another
+    system.
+    """
+
+    name = "streaming"
+
+    def __init__(self, directory, load_radius=2048.0, unload_radius=None,
+                 budget_bytes=256 * 1024 * 1024, merge_budget=0.002, view=None):
+        self.directory = directory
+        with open(os.path.join(directory, INDEX_NAME), "r") as f:
+            self.index = json.load(f)
+        self.chunk_size = float(self.index["chunk_size"])
+        self.chunks = {(c["x"], c["y"]): c for c in self.index["chunks"]}
+        self.load_radius = load_radius
+        self.unload_radius = unload_radius or load_radius * 1.5
+        self.budget_bytes = budget_bytes
+        self.merge_budget = merge_budget
+        # Anything with camera, width and height (the SpriteRenderer)
+        self.view = view
+        self.center = np.zeros(2)
+
+        # key -> entity handles, least recently wanted first; handles, since
+        # ids of chunk entities destroyed in play are handed out again
+        self.loaded = OrderedDict()
+        self.pending = {}            # key -> future
+        self.resident_bytes = 0
+        self.loads = 0
+        self.evictions = 0
+        self.pool = ThreadPoolExecutor(1, thread_name_prefix="chunks")
+
+    @classmethod
+    def from_settings(cls, directory, settings, view=None):
+        """Build from the "streaming" block of project.axie settings"""
+        streaming = settings.get("streaming", {})
+        return cls(
+            directory,
+            load_radius=streaming.get("load_radius", 2048.0),
+            unload_radius=streaming.get("unload_radius"),
+            budget_bytes=int(streaming.get("budget_mb", 256) * 1024 * 1024),
+            view=view,
+        )
+
+    def load_resident(self, world=None):
+        """World holding the entities that belong to no chunk"""
+        resident = load_cooked(os.path.join(self.directory, self.index["resident"]))
+        if world is None:
+            return resident
+        world.merge(resident)
+        return world
+
+    def shutdown(self):
+        self.pool.shutdown(cancel_futures=True)
+
+    def _distance(self, key):
+        """Distance from the view centre to the nearest point of a chunk"""
+        lo = np.array(key, dtype=np.float64) * self.chunk_size
+        nearest = np.clip(self.center, lo, lo + self.chunk_size)
+        return float(np.hypot(*(self.center - nearest)))
+
+    def _nearby(self, radius):
+        """Chunk keys within radius of the centre, nearest first"""
+        lo = np.floor((self.center - radius) / self.chunk_size).astype(int)
+        hi = np.floor((self.center + radius) / self.chunk_size).astype(int)
+        keys = [
+            (x, y)
+            for x in range(lo[0], hi[0] + 1)
+            for y in range(lo[1], hi[1] + 1)
+            if (x, y) in self.chunks
+        ]
+        distances = {key: self._distance(key) for key in keys}
+        return sorted((k for k in keys if distances[k] <= radius), key=distances.get)
+
+    def unload(self, world, key):
+        eids = world.resolve_many(self.loaded.pop(key))
+        world.destroy_entities(eids[eids >= 0])
+        self.resident_bytes -= self.chunks[key]["bytes"]
+
+    def _make_room(self, world, needed, wanted):
+        """Evict unwanted chunks, oldest first, until needed bytes fit"""
+        for key in list(self.loaded):
+            if self.resident_bytes + needed <= self.budget_bytes:
+                break
+            if key not in wanted:
+                self.unload(world, key)
+                self.evictions += 1
+        return self.resident_bytes + needed <= self.budget_bytes
+
+    def update(self, world, dt):
+        if self.view is not None:
+            self.center = self.view.camera + (self.view.width / 2, self.view.height / 2)
+
+        wanted = self._nearby(self.load_radius)
+        keep = set(self._nearby(self.unload_radius))
+        for key in [k for k in self.loaded if k not in keep]:
+            self.unload(world, key)
+        for key in [k for k in self.pending if k not in keep]:
+            self.pending.pop(key).cancel()
+        for key in wanted:
+            if key in self.loaded:
+                self.loaded.move_to_end(key)
+
+        # Queue reads nearest first, as far as the budget allows
+        in_flight = sum(self.chunks[k]["bytes"] for k in self.pending)
+        for key in wanted:
+            if key in self.loaded or key in self.pending:
+                continue
+            size = self.chunks[key]["bytes"]
+            if not self._make_room(world, in_flight + size, set(wanted)):
+                break
+            path = os.path.join(self.directory, self.chunks[key]["file"])
+            self.pending[key] = self.pool.submit(_read_chunk, path)
+            in_flight += size
+
+        self._merge_finished(world)
+
+    def _merge_finished(self, world):
+        start = time.perf_counter()
+        for key, future in list(self.pending.items()):
+            if time.perf_counter() - start >= self.merge_budget:
+                break
+            if not future.done():
+                continue
+            del self.pending[key]
+            try:
+                chunk = future.result()
+            except (OSError, ValueError) as e:
+                print(f"Failed to load chunk {key}: {e}")
+                continue
+            self.loaded[key] = world.handles(world.merge(chunk))
+            self.resident_bytes += self.chunks[key]["bytes"]
+            self.loads += 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Split a scene into streaming chunks")
+    parser.add_argument("scene", help=".scene or cooked scene file")
+    parser.add_argument("--chunk-size", type=float, default=1024.0)
+    parser.add_argument("--out", help="chunk directory (default: next to the scene)")
+    args = parser.parse_args()
+    out_dir = split_scene(args.scene, args.chunk_size, args.out)
+    with open(os.path.join(out_dir, INDEX_NAME), "r") as f:
+        count = len(json.load(f)["chunks"])
+    print(f"Split {args.scene} into {count} chunks in {out_dir}")
+
+
+if __name__ == "__main__":
+    main()
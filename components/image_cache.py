@@ -0,0 +1,184 @@
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from PIL import Image
+
+
+def image_bytes(image):
+    """Decoded size of a PIL image"""
+    width, height = image.size
+    return width * height * len(image.getbands())
+
+
+def decode(path, size=None, mode="RGBA"):
+    """Read an image file, converted to mode and resized to size"""
+    with Image.open(path) as img:
+        image = img.convert(mode)
+    if size and image.size != tuple(size):
+        image = image.resize(size, Image.LANCZOS)
+    return image
+
+
+class ImageCache:
+    """Decoded images shared by everything in the process.
+
+    Entries are keyed by (path, size, mode) and kept in LRU order; once
+    the decoded bytes exceed ``budget_bytes`` the least recently used
+    entries are dropped. Images are shared, so callers must not modify
+    what they get back. ``get_async`` and ``prefetch`` decode on a small
+    thread pool; a request for an image already being decoded waits for
+    that decode instead of starting another.
+
+    Generated images (placeholders) go through ``get`` with ``create``
+    instead of a file. Any value can be cached that way if its size is
+    passed as ``nbytes``.
+    """
+
+    def __init__(self, budget_bytes=64 * 1024 * 1024, workers=2):
+        self.budget_bytes = budget_bytes
+        self.workers = workers
+        self.entries = OrderedDict()  # key -> (value, nbytes)
+        self.pending = {}             # key -> future
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.lock = threading.Lock()
+        self.pool = None
+
+    def configure(self, budget_bytes=None):
+        if budget_bytes is not None:
+            with self.lock:
+                self.budget_bytes = budget_bytes
+                self._evict()
+
+    def key(self, path, size=None, mode="RGBA"):
+        if not path.startswith("generated:"):
+            path = os.path.abspath(path)
+        return (path, tuple(size) if size else None, mode)
+
+    def _lookup(self, key):
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+        self.misses += 1
+        return None
+
+    def _store(self, key, value, nbytes):
+        old = self.entries.pop(key, None)
+        if old is not None:
+            self.bytes -= old[1]
+        self.entries[key] = (value, nbytes)
+        self.bytes += nbytes
+        self._evict()
+
+    def _evict(self):
+        # Keep the newest entry even if it alone is over budget
+        while self.bytes > self.budget_bytes and len(self.entries) > 1:
+            _, (_, nbytes) = self.entries.popitem(last=False)
+            self.bytes -= nbytes
+            self.evictions += 1
+
+    def get(self, path, size=None, mode="RGBA", create=None, nbytes=None):
+        """Cached image for path, decoding it on a miss.
+
+        Returns None if the file can't be read. With create, path is a
+        name starting with "generated:" and create() makes the value on
+        a miss.
+        """
+        key = self.key(path, size, mode)
+        with self.lock:
+            value = self._lookup(key)
+            if value is not None:
+                return value
+            future = self.pending.get(key)
+        if future is not None:
+            return future.result()
+
+        if create is not None:
+            value = create()
+        else:
+            try:
+                value = decode(key[0], size, mode)
+            except OSError as e:
+                print(f"Failed to load image {path}: {str(e)}")
+                return None
+        with self.lock:
+            self._store(key, value, nbytes if nbytes is not None else image_bytes(value))
+        return value
+
+    def _decode_into(self, key, future):
+        image = error = None
+        try:
+            image = decode(*key)
+        except OSError as e:
+            print(f"Failed to load image {key[0]}: {str(e)}")
+        except Exception as e:
+            error = e
+        with self.lock:
+            # Invalidated while decoding: the result is for the old file
+            if self.pending.get(key) is future:
+                if image is not None:
+                    self._store(key, image, image_bytes(image))
+                del self.pending[key]
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(image)
+
+    def get_async(self, path, size=None, mode="RGBA"):
+        """Future resolving to the cached image (None if unreadable)"""
+        key = self.key(path, size, mode)
+        with self.lock:
+            value = self._lookup(key)
+            if value is None:
+                future = self.pending.get(key)
+                if future is None:
+                    if self.pool is None:
+                        self.pool = ThreadPoolExecutor(self.workers, thread_name_prefix="images")
+                    future = self.pending[key] = Future()
+                    self.pool.submit(self._decode_into, key, future)
+                return future
+        future = Future()
+        future.set_result(value)
+        return future
+
+    def prefetch(self, paths, size=None, mode="RGBA"):
+        """Start decoding every path not cached yet"""
+        return [self.get_async(path, size, mode) for path in paths]
+
+    def invalidate(self, path):
+        """Drop every entry decoded from path (e.g. after the file changed)"""
+        path = self.key(path)[0]
+        with self.lock:
+            for key in [k for k in self.entries if k[0] == path]:
+                self.bytes -= self.entries.pop(key)[1]
+            # Decodes in flight finish for their callers but aren't cached
+            for key in [k for k in self.pending if k[0] == path]:
+                del self.pending[key]
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.bytes = 0
+
+    def stats(self):
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self.entries),
+                "bytes": self.bytes,
+                "budget_bytes": self.budget_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+            }
+
+
+# The process-wide cache
+images = ImageCache()
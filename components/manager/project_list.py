@@ -0,0 +1,227 @@
+import customtkinter as ctk
+
+
+class ProjectCard(ctk.CTkFrame):
+    """One reusable row of the project list"""
+
+    def __init__(self, parent, project_list):
+        super().__init__(
+            parent,
+            height=80,
+            fg_color="transparent",
+            border_width=1,
+            border_color="gray20"
+        )
+        self.project_list = project_list
+        self.project = None
+        self.shown = None
+        self.shown_icon = project_list.icon
+        self.is_selected = False
+        self.grid_columnconfigure(1, weight=1)
+
+        # Project icon
+        self.icon = ctk.CTkLabel(self, text="", image=project_list.icon, width=60)
+        self.icon.grid(row=0, column=0, rowspan=2, padx=10, pady=10, sticky="ns")
+
+        # Project info
+        self.name_label = ctk.CTkLabel(self, text="", font=("Arial", 14, "bold"), anchor="w")
+        self.name_label.grid(row=0, column=1, sticky="we", padx=(0, 10), pady=(10, 0))
+
+        self.path_label = ctk.CTkLabel(
+            self, text="", text_color=project_list.path_fg_color, anchor="w")
+        self.path_label.grid(row=1, column=1, sticky="we", padx=(0, 10), pady=(0, 10))
+
+        self.modified_label = ctk.CTkLabel(self, text="", anchor="e")
+        self.modified_label.grid(row=0, column=2, rowspan=2, padx=10, pady=10, sticky="ns")
+
+        self.labels = [self.name_label, self.path_label, self.modified_label, self.icon]
+
+        # Hover effects
+        self.bind("<Enter>", self.on_enter)
+        self.bind("<Leave>", self.on_leave)
+
+        # Click and scroll handling
+        for widget in [self] + self.labels:
+            widget.bind("<Button-1>", lambda e: project_list.select(self.project))
+            project_list.bind_scroll(widget)
+
+    def on_enter(self, e):
+        if not self.is_selected:
+            self.configure(border_color="gray40")
+
+    def on_leave(self, e):
+        if not self.is_selected:
+            self.configure(border_color="gray20")
+
+    def show(self, project, selected):
+        """Bind this card to a project, touching only what changed"""
+        self.project = project
+        values = (project["name"], project["path"], project["modified"])
+        if values != self.shown:
+            self.name_label.configure(text=values[0])
+            self.path_label.configure(text=values[1])
+            self.modified_label.configure(text=f"Modified: {values[2]}")
+            self.shown = values
+        self.show_icon()
+        if selected != self.is_selected:
+            self.set_selected(selected)
+
+    def show_icon(self):
+        """Project thumbnail when there is one, the shared icon until then"""
+        thumbnails = self.project_list.thumbnails
+        icon = thumbnails.get(self.project) if thumbnails else None
+        icon = icon or self.project_list.icon
+        if icon is not self.shown_icon:
+            self.icon.configure(image=icon)
+            self.shown_icon = icon
+
+    def set_selected(self, selected):
+        project_list = self.project_list
+        if selected:
+            self.configure(fg_color=project_list.selected_bg_color)
+            for label in self.labels:
+                label.configure(text_color=project_list.selected_fg_color)
+        else:
+            self.configure(fg_color="transparent", border_color="gray20")
+            for label in self.labels:
+                if label is self.path_label:
+                    label.configure(text_color=project_list.path_fg_color)
+                else:
+                    label.configure(text_color=project_list.default_fg_color)
+        self.is_selected = selected
+
+
+class VirtualProjectList(ctk.CTkFrame):
+    """Scrollable project list that only builds widgets for visible rows.
+
+    A small pool of ProjectCard widgets is placed over the visible part of
+    the list and re-bound to different projects as the view scrolls, so
+    the widget count depends on the window height rather than the number
+    of projects. Selection is tracked by project path. With thumbnails
+    (a ThumbnailLoader) only visible cards ask for their thumbnail.
+    """
+
+    def __init__(self, parent, icon, on_select, row_height=96, thumbnails=None,
+                 selected_bg_color="#1e6ba8", selected_fg_color="white",
+                 default_fg_color="white", path_fg_color="gray"):
+        super().__init__(parent, fg_color="transparent")
+        self.icon = icon
+        self.thumbnails = thumbnails
+        self.on_select = on_select
+        self.row_height = row_height
+        self.selected_bg_color = selected_bg_color
+        self.selected_fg_color = selected_fg_color
+        self.default_fg_color = default_fg_color
+        self.path_fg_color = path_fg_color
+
+        self.projects = []
+        self.index = {}
+        self.selected_path = None
+        self.offset = 0
+        self.cards = []
+        # Visible cards by project path, rebuilt on every layout
+        self.visible = {}
+
+        self.grid_rowconfigure(0, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+        self.viewport = ctk.CTkFrame(self, fg_color="transparent")
+        self.viewport.grid(row=0, column=0, sticky="nswe")
+        self.scrollbar = ctk.CTkScrollbar(self, command=self.on_scrollbar)
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
+
+        self.viewport.bind("<Configure>", lambda e: self.layout())
+        self.bind_scroll(self.viewport)
+
+    def bind_scroll(self, widget):
+        widget.bind("<MouseWheel>", self.on_mousewheel)
+        widget.bind("<Button-4>", lambda e: self.scroll_by(-self.row_height))
+        widget.bind("<Button-5>", lambda e: self.scroll_by(self.row_height))
+
+    def set_projects(self, projects):
+        """Show a new project list; visible cards only update what changed"""
+        self.projects = projects
+        self.index = {project["path"]: i for i, project in enumerate(projects)}
+        if self.selected_path not in self.index:
+            self.selected_path = None
+        self.layout()
+
+    def select(self, project):
+        if project is None:
+            return
+        previous = self.visible.get(self.selected_path)
+        if previous is not None:
+            previous.set_selected(False)
+        self.selected_path = project["path"]
+        card = self.visible.get(self.selected_path)
+        if card is not None:
+            card.set_selected(True)
+        self.on_select(project)
+
+    def refresh_icon(self, path):
+        """Show a thumbnail that just became ready, if its card is visible"""
+        card = self.visible.get(path)
+        if card is not None:
+            card.show_icon()
+
+    def selected_project(self):
+        i = self.index.get(self.selected_path)
+        return self.projects[i] if i is not None else None
+
+    def view_height(self):
+        return max(self.viewport.winfo_height(), 1)
+
+    def max_offset(self):
+        return max(len(self.projects) * self.row_height - self.view_height(), 0)
+
+    def scroll_by(self, pixels):
+        self.scroll_to(self.offset + pixels)
+
+    def scroll_to(self, offset):
+        offset = min(max(int(offset), 0), self.max_offset())
+        if offset != self.offset:
+            self.offset = offset
+            self.layout()
+
+    def on_mousewheel(self, e):
+        # Windows reports multiples of 120, macOS small deltas
+        step = e.delta // 120 if abs(e.delta) >= 120 else e.delta
+        self.scroll_by(-step * self.row_height // 3)
+
+    def on_scrollbar(self, *args):
+        total = max(len(self.projects) * self.row_height, 1)
+        if args[0] == "moveto":
+            self.scroll_to(float(args[1]) * total)
+        elif args[0] == "scroll":
+            amount = int(args[1])
+            unit = self.view_height() if args[2] == "pages" else self.row_height
+            self.scroll_by(amount * unit)
+
+    def layout(self):
+        """Place pooled cards over the rows currently in view"""
+        height = self.view_height()
+        self.offset = min(self.offset, self.max_offset())
+
+        # Enough cards to cover the view plus one partially scrolled row
+        needed = height // self.row_height + 2
+        while len(self.cards) < needed:
+            self.cards.append(ProjectCard(self.viewport, self))
+
+        first = self.offset // self.row_height
+        self.visible = {}
+        for slot, card in enumerate(self.cards):
+            i = first + slot
+            if slot >= needed or i >= len(self.projects):
+                card.place_forget()
+                card.project = None
+                continue
+            project = self.projects[i]
+            card.show(project, project["path"] == self.selected_path)
+            # CTk widgets take their height from the constructor, not place()
+            card.place(x=0, y=i * self.row_height - self.offset, relwidth=1)
+            self.visible[project["path"]] = card
+
+        total = len(self.projects) * self.row_height
+        if total <= height:
+            self.scrollbar.set(0, 1)
+        else:
+            self.scrollbar.set(self.offset / total, (self.offset + height) / total)
@@ -1,10 +1,46 @@
 import os
 import json
-import shutil
 import customtkinter as ctk
 from tkinter import filedialog
 from PIL import Image, ImageDraw
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+from components.manager.tasks import BackgroundJob
+from components.manager.project_list import VirtualProjectList
+from components.manager.registry import ProjectRegistry
+from components.manager.thumbnails import ThumbnailLoader
+from components.manager.templates import create_project
+from components.image_cache import images
+
+
+def read_project_file(project):
+    """Read a project's project.axie unless it is unchanged since the last scan.
+
+    Runs on a worker thread, so it must not touch any widgets. Returns
+    None when the file is missing or its mtime and size match the values
+    cached on the project entry.
+    """
+    axie_path = os.path.join(project["path"], "project.axie")
+    try:
+        stat = os.stat(axie_path)
+    except OSError:
+        return None
+    if (project.get("axie_mtime"), project.get("axie_size")) == (stat.st_mtime_ns, stat.st_size):
+        return None
+    with open(axie_path, "r") as f:
+        return (stat.st_mtime_ns, stat.st_size), json.load(f)
+
+
+def apply_project_file(project, result):
+    """Copy a read_project_file result onto the project entry"""
+    (mtime, size), axie_data = result
+    project["name"] = axie_data.get("name", project["name"])
+    project["version"] = axie_data.get("version", project["version"])
+    project["modified"] = axie_data.get("modified", project["modified"])
+    project["axie_mtime"] = mtime
+    project["axie_size"] = size
+
 
 class NewProjectDialog(ctk.CTkToplevel):
     def __init__(self, parent, callback):
@@ -124,14 +160,21 @@ class NewProjectDialog(ctk.CTkToplevel):
 class ProjectManager:
     def __init__(self):
         self.app = ctk.CTk()
-        self.projects_file = "projects.json"
+        self.registry = ProjectRegistry("projects.db", legacy_json="projects.json")
         self.projects = []
+        self.search_text = ""
         self.selected_project = None
         self.selected_bg_color = "#1e6ba8"
         self.selected_fg_color = "white"
         self.default_fg_color = "white"
         self.path_fg_color = "gray"
         
+        # File system work runs here so slow disks never block the UI
+        self.pool = ThreadPoolExecutor(max_workers=8)
+        self.scan_job = None
+        self.thumbnails = ThumbnailLoader(
+            self.app, self.pool, on_ready=lambda path: self.project_list.refresh_icon(path))
+        
         # Setup window first
         self.setup_window()
         
@@ -156,6 +199,15 @@ class ProjectManager:
         
         self.app.grid_rowconfigure(0, weight=1)
         self.app.grid_columnconfigure(1, weight=1)
+        self.app.protocol("WM_DELETE_WINDOW", self.on_close)
+        
+    def on_close(self):
+        if self.scan_job:
+            self.scan_job.cancel()
+        self.thumbnails.shutdown()
+        self.pool.shutdown(wait=False, cancel_futures=True)
+        self.registry.close()
+        self.app.destroy()
         
     def center_window(self):
         """Properly center the window on screen"""
@@ -189,21 +241,18 @@ class ProjectManager:
         }
         
     def create_placeholder_icon(self, size=(16,16)):
-        img = Image.new("RGBA", size, (0,0,0,0))
-        draw = ImageDraw.Draw(img)
-        draw.rectangle([0, 0, size[0]-1, size[1]-1], outline="gray")
-        return ctk.CTkImage(img)
+        # Placeholders of the same size are identical, so build each once
+        def draw_icon():
+            img = Image.new("RGBA", size, (0,0,0,0))
+            draw = ImageDraw.Draw(img)
+            draw.rectangle([0, 0, size[0]-1, size[1]-1], outline="gray")
+            return ctk.CTkImage(img)
+        return images.get("generated:placeholder_icon", size, "CTkImage",
+                          create=draw_icon, nbytes=size[0] * size[1] * 4)
         
     def load_projects(self):
-        try:
-            with open(self.projects_file, "r") as f:
-                self.projects = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            self.projects = []
-            
-    def save_projects(self):
-        with open(self.projects_file, "w") as f:
-            json.dump(self.projects, f, indent=2)
+        # The registry sorts and filters; the UI only shows the result
+        self.projects = self.registry.search(self.search_text)
             
     def create_widgets(self):
         # Configure appearance
@@ -217,7 +266,7 @@ class ProjectManager:
         # Main content area
         self.main_content = ctk.CTkFrame(self.app, corner_radius=0)
         self.main_content.grid(row=0, column=1, sticky="nswe")
-        self.main_content.grid_rowconfigure(0, weight=1)
+        self.main_content.grid_rowconfigure(1, weight=1)
         self.main_content.grid_columnconfigure(0, weight=1)
         
         # Sidebar buttons
@@ -277,139 +326,88 @@ class ProjectManager:
         )
         self.run_btn.grid(row=5, column=0, padx=10, pady=5, sticky="we")
         
+        # Progress of background work
+        self.status_label = ctk.CTkLabel(
+            self.sidebar, text="", text_color=self.path_fg_color, anchor="w")
+        self.status_label.grid(row=6, column=0, padx=10, pady=5, sticky="swe")
+        
         # Version label
         ctk.CTkLabel(self.sidebar, text=f"Version: 0.1dev1").grid(
             row=7, column=0, padx=10, pady=(10, 20), sticky="w")
         
-        # Project list
-        self.project_frame = ctk.CTkScrollableFrame(self.main_content)
-        self.project_frame.grid(row=0, column=0, sticky="nswe", padx=20, pady=20)
-        self.project_frame.grid_columnconfigure(0, weight=1)
+        # Search box
+        self.search_entry = ctk.CTkEntry(
+            self.main_content,
+            placeholder_text="Search projects",
+            height=35
+        )
+        self.search_entry.grid(row=0, column=0, sticky="we", padx=20, pady=(20, 0))
+        self.search_entry.bind("<KeyRelease>", lambda e: self.search_projects())
+        
+        # Project list (only visible rows get widgets)
+        self.project_list = VirtualProjectList(
+            self.main_content,
+            icon=self.icons["project"],
+            thumbnails=self.thumbnails,
+            on_select=self.select_project,
+            selected_bg_color=self.selected_bg_color,
+            selected_fg_color=self.selected_fg_color,
+            default_fg_color=self.default_fg_color,
+            path_fg_color=self.path_fg_color
+        )
+        self.project_list.grid(row=1, column=0, sticky="nswe", padx=20, pady=20)
         
         self.refresh_project_list()
         
     def refresh_project_list(self):
-        # Remember which project was selected
-        selected_path = self.selected_project["path"] if self.selected_project else None
-        
-        # Clear existing projects
-        for widget in self.project_frame.winfo_children():
-            widget.destroy()
-        
-        # Add current projects
-        for i, project in enumerate(self.projects):
-            card = self.add_project_card(project, i)
-            
-            # Re-select if it was the previously selected project
-            if selected_path and project["path"] == selected_path:
-                self.select_project_card(card)
+        # Visible cards are re-bound in place; selection is kept by path
+        self.project_list.set_projects(self.projects)
+        self.selected_project = self.project_list.selected_project()
+        if not self.selected_project:
+            self.open_btn.configure(state="disabled")
+            self.run_btn.configure(state="disabled")
     
-    def add_project_card(self, project, index):
-        card = ctk.CTkFrame(
-            self.project_frame, 
-            height=80,
-            fg_color="transparent",
-            border_width=1,
-            border_color="gray20"
-        )
-        card.grid(row=index, column=0, sticky="we", pady=(0, 10))
-        card.grid_columnconfigure(1, weight=1)
-        
-        # Store project reference in card
-        card.project_data = project
-        card.is_selected = False
-        
-        # Project icon
-        icon = ctk.CTkLabel(card, text="", image=self.icons["project"], width=60)
-        icon.grid(row=0, column=0, rowspan=2, padx=10, pady=10, sticky="ns")
-        
-        # Project info
-        name_label = ctk.CTkLabel(
-            card, 
-            text=project["name"], 
-            font=("Arial", 14, "bold"), 
-            anchor="w"
-        )
-        name_label.grid(row=0, column=1, sticky="we", padx=(0, 10), pady=(10, 0))
-        
-        path_label = ctk.CTkLabel(
-            card, 
-            text=project["path"], 
-            text_color=self.path_fg_color, 
-            anchor="w"
-        )
-        path_label.grid(row=1, column=1, sticky="we", padx=(0, 10), pady=(0, 10))
-        
-        modified_label = ctk.CTkLabel(
-            card, 
-            text=f"Modified: {project['modified']}", 
-            anchor="e"
-        )
-        modified_label.grid(row=0, column=2, rowspan=2, padx=10, pady=10, sticky="ns")
-        
-        # Store references to labels
-        card.labels = [name_label, path_label, modified_label, icon]
-        
-        # Hover effects
-        def on_enter(e):
-            if not card.is_selected:
-                card.configure(border_color="gray40")
-                
-        def on_leave(e):
-            if not card.is_selected:
-                card.configure(border_color="gray20")
-                
-        card.bind("<Enter>", on_enter)
-        card.bind("<Leave>", on_leave)
-        
-        # Click handling
-        card.bind("<Button-1>", lambda e, c=card: self.select_project_card(c))
-        for child in card.winfo_children():
-            child.bind("<Button-1>", lambda e, c=card: self.select_project_card(c))
-            
-        return card
+    def search_projects(self):
+        text = self.search_entry.get().strip()
+        if text != self.search_text:
+            self.search_text = text
+            self.load_projects()
+            self.refresh_project_list()
     
-    def select_project_card(self, card):
-        # Deselect all other cards first
-        for existing_card in self.project_frame.winfo_children():
-            if hasattr(existing_card, 'is_selected') and existing_card.is_selected:
-                self.deselect_card(existing_card)
-        
-        # Select the clicked card
-        card.configure(fg_color=self.selected_bg_color)
-        for label in card.labels:
-            if label == card.labels[1]:  # Path label
-                label.configure(text_color=self.selected_fg_color)
-            else:
-                label.configure(text_color=self.selected_fg_color)
-        card.is_selected = True
-        
+    def select_project(self, project):
         # Update selected project
-        self.selected_project = card.project_data
+        self.selected_project = project
         self.open_btn.configure(state="normal")
         self.run_btn.configure(state="normal")
     
-    def deselect_card(self, card):
-        card.configure(fg_color="transparent")
-        for label in card.labels:
-            if label == card.labels[1]:  # Path label
-                label.configure(text_color=self.path_fg_color)
-            else:
-                label.configure(text_color=self.default_fg_color)
-        card.is_selected = False
-        card.configure(border_color="gray20")
+    def set_status(self, text):
+        self.status_label.configure(text=text)
     
     def new_project(self):
         NewProjectDialog(self.app, self.create_new_project)
     
     def create_new_project(self, name, path):
         project_path = os.path.join(path, name)
+        self.set_status(f"Creating {name}...")
         
-        # Create project directory
-        os.makedirs(project_path, exist_ok=True)
+        def create(project_path):
+            # Create project directory
+            os.makedirs(project_path, exist_ok=True)
+            
+            # Create project from template
+            self.create_from_template(project_path, name)
         
-        # Create project from template
-        self.create_from_template(project_path, name)
+        BackgroundJob(
+            self.app, self.pool, [project_path], create,
+            on_result=lambda path, result, error: self.finish_new_project(name, path, error)
+        )
+    
+    def finish_new_project(self, name, project_path, error):
+        if error:
+            print(f"Failed to create project: {str(error)}")
+            self.set_status("Project creation failed")
+            return
+        self.set_status("")
         
         # Add to projects list
         project_data = {
@@ -420,44 +418,28 @@ class ProjectManager:
             "modified": datetime.now().strftime("%Y-%m-%d %H:%M")
         }
         
-        self.projects.append(project_data)
-        self.save_projects()
+        self.registry.add(project_data)
+        self.load_projects()
         self.refresh_project_list()
         
         # Open the project in editor
         self.open_project(project_path)
     
     def create_from_template(self, project_path, project_name):
-        """Create project structure from template"""
-        # Copy template files
-        if os.path.exists(self.template_path):
-            try:
-                # Copy entire template directory
-                shutil.copytree(
-                    self.template_path, 
-                    project_path, 
-                    dirs_exist_ok=True
-                )
-                
-                # Update project.axie file
-                axie_path = os.path.join(project_path, "project.axie")
-                if os.path.exists(axie_path):
-                    with open(axie_path, "r") as f:
-                        axie_data = json.load(f)
-                    
-                    # Update with project-specific data
-                    axie_data["name"] = project_name
-                    axie_data["version"] = "0.1dev1"
-                    created = datetime.now().strftime("%Y-%m-%d %H:%M")
-                    axie_data["created"] = created
-                    axie_data["modified"] = created
-                    
-                    with open(axie_path, "w") as f:
-                        json.dump(axie_data, f, indent=2)
-            except Exception as e:
-                print(f"Error creating from template: {str(e)}")
-        else:
-            print(f"Template path not found: {self.template_path}")
+        """Create project structure from template.
+
+        Errors propagate, so a project that failed to copy is reported
+        by finish_new_project and never registered.
+        """
+        if not os.path.exists(self.template_path):
+            raise FileNotFoundError(f"Template path not found: {self.template_path}")
+        created = datetime.now().strftime("%Y-%m-%d %H:%M")
+        create_project(self.template_path, project_path, {
+            "PROJECT_NAME": project_name,
+            "VERSION": "0.1dev1",
+            "CREATED_DATE": created,
+            "MODIFIED_DATE": created,
+        })
     
     def open_project(self, project_path):
         """Open project in editor"""
@@ -469,48 +451,74 @@ class ProjectManager:
     def import_project(self):
         path = filedialog.askdirectory(title="Select Project Folder")
         if path:
-            # Verify it's a valid project
-            if not os.path.exists(os.path.join(path, "project.axie")):
-                print("Not a valid project: missing project.axie file")
-                return
-                
-            name = os.path.basename(path)
-            project_data = {
-                "name": name,
-                "path": path,
-                "version": "0.1dev1",
-                "created": datetime.now().strftime("%Y-%m-%d"),
-                "modified": datetime.now().strftime("%Y-%m-%d %H:%M")
-            }
+            # Verify it's a valid project off the UI thread
+            BackgroundJob(
+                self.app, self.pool, [path],
+                lambda path: os.path.exists(os.path.join(path, "project.axie")),
+                on_result=self.finish_import
+            )
+    
+    def finish_import(self, path, valid, error):
+        if error or not valid:
+            print("Not a valid project: missing project.axie file")
+            return
             
-            self.projects.append(project_data)
-            self.save_projects()
-            self.refresh_project_list()
+        name = os.path.basename(path)
+        project_data = {
+            "name": name,
+            "path": path,
+            "version": "0.1dev1",
+            "created": datetime.now().strftime("%Y-%m-%d"),
+            "modified": datetime.now().strftime("%Y-%m-%d %H:%M")
+        }
+        
+        if not self.registry.add(project_data):
+            print(f"Project already registered: {path}")
+            return
+        self.load_projects()
+        self.refresh_project_list()
     
     def scan_projects(self):
-        """Scan for projects and update metadata"""
+        """Scan for projects and update metadata in the background"""
+        # Pressing the button again while a scan runs cancels it
+        if self.scan_job and not self.scan_job.finished:
+            self.scan_job.cancel()
+            return
+            
         print("Scanning for projects...")
-        updated_count = 0
-        
-        for project in self.projects:
+        self.scan_updated = []
+        self.scan_btn.configure(text="Cancel Scan")
+        self.scan_job = BackgroundJob(
+            self.app, self.pool, self.registry.all(), read_project_file,
+            on_result=self.apply_scan_result,
+            on_progress=lambda done, total: self.set_status(f"Scanned {done}/{total}"),
+            on_done=self.finish_scan
+        )
+    
+    def apply_scan_result(self, project, result, error):
+        if error:
             axie_path = os.path.join(project["path"], "project.axie")
-            if os.path.exists(axie_path):
-                try:
-                    with open(axie_path, "r") as f:
-                        axie_data = json.load(f)
-                    
-                    # Update metadata from project file
-                    project["name"] = axie_data.get("name", project["name"])
-                    project["version"] = axie_data.get("version", project["version"])
-                    project["modified"] = axie_data.get("modified", project["modified"])
-                    updated_count += 1
-                except:
-                    print(f"Failed to read project file: {axie_path}")
-        
+            print(f"Failed to read project file: {axie_path}")
+            return
+        if result is None:
+            return
+            
+        # Update metadata from project file
+        apply_project_file(project, result)
+        self.scan_updated.append(project)
+    
+    def finish_scan(self, cancelled):
+        self.scan_btn.configure(text="Scan Projects")
+        updated_count = len(self.scan_updated)
         if updated_count:
-            self.save_projects()
+            self.registry.update(self.scan_updated)
+            # Their previews may have changed along with project.axie
+            for project in self.scan_updated:
+                self.thumbnails.forget(project["path"])
+            self.load_projects()
             self.refresh_project_list()
             print(f"Updated {updated_count} projects")
+        self.set_status("Scan cancelled" if cancelled else f"Updated {updated_count} projects")
     
     def open_selected_project(self):
         if self.selected_project:
@@ -523,9 +531,12 @@ class ProjectManager:
             # from components.core.engine import engine
             # engine.run(self.selected_project["path"])
     
-    def run(self):
+    def run(self, on_ready=None):
+        # on_ready(app) fires once the first frame has been drawn
+        if on_ready:
+            self.app.after_idle(on_ready, self.app)
         self.app.mainloop()
 
-def run():
+def run(on_ready=None):
     pm = ProjectManager()
-    pm.run()
\ No newline at end of file
+    pm.run(on_ready)
\ No newline at end of file
@@ -0,0 +1,130 @@
+import os
+import json
+import sqlite3
+
+COLUMNS = ("path", "name", "version", "created", "modified", "axie_mtime", "axie_size")
+SORT_COLUMNS = {"name": "name COLLATE NOCASE", "modified": "modified", "path": "path"}
+
+
+def normalize_path(path):
+    """Canonical form used as the registry key, so one folder is one project"""
+    return os.path.normcase(os.path.normpath(os.path.abspath(path)))
+
+
+class ProjectRegistry:
+    """Known projects, stored in SQLite.
+
+    Every change is its own transaction, so several Project Manager
+    windows can share the database without overwriting each other.
+    Projects are keyed by normalized path, with indexes on name and
+    modified time for sorting and search. An existing projects.json is
+    imported the first time the database is opened.
+    """
+
+    def __init__(self, db_path="projects.db", legacy_json="projects.json"):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path, timeout=10)
+        self.conn.row_factory = sqlite3.Row
+        # WAL lets readers continue while another instance writes
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        with self.conn:
+            self.conn.executescript("""
+                CREATE TABLE IF NOT EXISTS projects (
+                    path TEXT PRIMARY KEY,
+                    name TEXT NOT NULL,
+                    version TEXT,
+                    created TEXT,
+                    modified TEXT,
+                    axie_mtime INTEGER,
+                    axie_size INTEGER
+                );
+                CREATE INDEX IF NOT EXISTS projects_name
+                    ON projects (name COLLATE NOCASE);
+                CREATE INDEX IF NOT EXISTS projects_modified
+                    ON projects (modified);
+                CREATE TABLE IF NOT EXISTS meta (
+                    key TEXT PRIMARY KEY,
+                    value TEXT
+                );
+            """)
+        if legacy_json:
+            self.migrate_json(legacy_json)
+
+    def close(self):
+        self.conn.close()
+
+    def migrate_json(self, json_path):
+        """Import a projects.json file once; later calls are no-ops"""
+        with self.conn:
+            done = self.conn.execute(
+                "SELECT value FROM meta WHERE key = 'migrated_json'").fetchone()
+            if done:
+                return 0
+            try:
+                with open(json_path, "r") as f:
+                    projects = json.load(f)
+            except (FileNotFoundError, json.JSONDecodeError):
+                projects = []
+            added = sum(self._insert(project) for project in projects)
+            self.conn.execute(
+                "INSERT INTO meta (key, value) VALUES ('migrated_json', ?)", (json_path,))
+        if added:
+            print(f"Migrated {added} projects from {json_path}")
+        return added
+
+    def _row(self, project):
+        row = {column: project.get(column) for column in COLUMNS}
+        row["path"] = normalize_path(project["path"])
+        return row
+
+    def _insert(self, project):
+        row = self._row(project)
+        cursor = self.conn.execute(
+            f"INSERT OR IGNORE INTO projects ({', '.join(COLUMNS)}) "
+            f"VALUES ({', '.join(':' + c for c in COLUMNS)})",
+            row,
+        )
+        return cursor.rowcount
+
+    def add(self, project):
+        """Register a project; returns False if its path is already known"""
+        with self.conn:
+            return bool(self._insert(project))
+
+    def update(self, projects):
+        """Write back changed fields for one or more known projects"""
+        if isinstance(projects, dict):
+            projects = [projects]
+        with self.conn:
+            self.conn.executemany(
+                f"UPDATE projects SET {', '.join(c + ' = :' + c for c in COLUMNS[1:])} "
+                "WHERE path = :path",
+                [self._row(project) for project in projects],
+            )
+
+    def remove(self, path):
+        with self.conn:
+            self.conn.execute("DELETE FROM projects WHERE path = ?", (normalize_path(path),))
+
+    def get(self, path):
+        row = self.conn.execute(
+            "SELECT * FROM projects WHERE path = ?", (normalize_path(path),)).fetchone()
+        return dict(row) if row else None
+
+    def search(self, text="", order_by="name", descending=False):
+        """Projects whose name or path contains text, sorted on an indexed column"""
+        order = SORT_COLUMNS[order_by] + (" DESC" if descending else "")
+        query = "SELECT * FROM projects"
+        params = ()
+        if text:
+            pattern = "%" + text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+            query += " WHERE name LIKE ? ESCAPE '\\' OR path LIKE ? ESCAPE '\\'"
+            params = (pattern, pattern)
+        rows = self.conn.execute(f"{query} ORDER BY {order}", params).fetchall()
+        return [dict(row) for row in rows]
+
+    def all(self, order_by="name", descending=False):
+        return self.search("", order_by, descending)
+
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(*) FROM projects").fetchone()[0]
@@ -0,0 +1,83 @@
+import queue
+import threading
+from concurrent.futures import Future
+
+
+class BackgroundJob:
+    """Runs work(item) for each item on a thread pool.
+
+    Tkinter isn't thread-safe, so workers only push results onto a queue;
+    the Tk thread drains it with ``after()`` and calls the callbacks:
+
+    - on_result(item, result, error) once per finished item
+    - on_progress(done, total) after every drained batch
+    - on_done(cancelled) once, when every item is accounted for
+
+    work may return a Future (e.g. from another executor) rather than
+    block a pool thread on it; the item finishes when that resolves.
+    """
+
+    def __init__(self, app, pool, items, work, on_result,
+                 on_progress=None, on_done=None, poll_ms=50):
+        self.app = app
+        self.items = list(items)
+        self.on_result = on_result
+        self.on_progress = on_progress
+        self.on_done = on_done
+        self.poll_ms = poll_ms
+        self.results = queue.Queue()
+        self.cancelled = threading.Event()
+        self.done = 0
+        self.finished = False
+
+        self.futures = []
+        for item in self.items:
+            future = pool.submit(self._run, work, item)
+            future.add_done_callback(lambda f, item=item: self._finished(item, f))
+            self.futures.append(future)
+        self.app.after(self.poll_ms, self._poll)
+
+    def _run(self, work, item):
+        # Items queued before a cancel still start; skip their work
+        if self.cancelled.is_set():
+            return None
+        return work(item)
+
+    def _finished(self, item, future):
+        if future.cancelled():
+            self.results.put((item, None, None, True))
+            return
+        error = future.exception()
+        result = None if error else future.result()
+        if isinstance(result, Future):
+            result.add_done_callback(lambda f: self._finished(item, f))
+            return
+        self.results.put((item, result, error, self.cancelled.is_set()))
+
+    def cancel(self):
+        """Stop handing out new items and drop results still in flight"""
+        self.cancelled.set()
+        for future in self.futures:
+            future.cancel()
+
+    def _poll(self):
+        drained = False
+        while True:
+            try:
+                item, result, error, skipped = self.results.get_nowait()
+            except queue.Empty:
+                break
+            self.done += 1
+            drained = True
+            if not skipped:
+                self.on_result(item, result, error)
+
+        if drained and self.on_progress:
+            self.on_progress(self.done, len(self.items))
+
+        if self.done >= len(self.items):
+            self.finished = True
+            if self.on_done:
+                self.on_done(self.cancelled.is_set())
+        else:
+            self.app.after(self.poll_ms, self._poll)
@@ -0,0 +1,209 @@
+"""Creating projects from a template directory.
+
+A template carries a precomputed manifest listing its directories and
+files, and which files contain ``{{PLACEHOLDER}}`` markers, so creating
+a project never walks the template tree. Files with placeholders are
+rewritten in one streaming pass; everything else is treated as an
+immutable asset and cloned (reflink) where the filesystem supports it,
+copied otherwise. Files are processed in parallel.
+
+Rebuild a template's manifest from the repository root with:
+
+    python -m components.manager.templates components/core/editor/template
+"""
+import os
+import re
+import json
+import shutil
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+MANIFEST_NAME = "template.manifest.json"
+PLACEHOLDER = re.compile(rb"\{\{([A-Z_][A-Z0-9_]*)\}\}")
+# Placeholders in these files sit inside JSON strings and need escaping
+JSON_EXTENSIONS = {".axie", ".scene", ".json", ".prefab"}
+TEXT_EXTENSIONS = JSON_EXTENSIONS | {".py", ".txt", ".md", ".cfg", ".ini", ".toml"}
+# Linux FICLONE ioctl: share the source's extents copy-on-write (btrfs, xfs)
+FICLONE = 0x40049409
+CHUNK_SIZE = 1 << 16
+
+
+def build_manifest(template_dir):
+    """Walk a template once and describe it"""
+    dirs, files = [], []
+    for path, dir_names, file_names in os.walk(template_dir):
+        dir_names.sort()
+        relative = os.path.relpath(path, template_dir)
+        if relative != ".":
+            dirs.append(relative.replace(os.sep, "/"))
+        for name in sorted(file_names):
+            if relative == "." and name == MANIFEST_NAME:
+                continue
+            full = os.path.join(path, name)
+            rel = os.path.relpath(full, template_dir).replace(os.sep, "/")
+            substitute = False
+            if os.path.splitext(name)[1].lower() in TEXT_EXTENSIONS:
+                with open(full, "rb") as f:
+                    substitute = PLACEHOLDER.search(f.read()) is not None
+            files.append({"path": rel, "size": os.path.getsize(full), "substitute": substitute})
+    return {"version": 1, "dirs": dirs, "files": files}
+
+
+def save_manifest(template_dir):
+    manifest = build_manifest(template_dir)
+    with open(os.path.join(template_dir, MANIFEST_NAME), "w") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def manifest_current(template_dir, manifest, built):
+    """Whether nothing in the template changed since the manifest was built"""
+    # Adding or removing a file touches its directory's mtime
+    for d in ["."] + manifest["dirs"]:
+        if os.path.getmtime(os.path.join(template_dir, d)) > built:
+            return False
+    # Editing a file in place doesn't, so check every listed file too
+    for entry in manifest["files"]:
+        stat = os.stat(os.path.join(template_dir, entry["path"]))
+        if stat.st_size != entry["size"] or stat.st_mtime > built:
+            return False
+    return True
+
+
+def load_manifest(template_dir):
+    """The template's manifest, rebuilt if missing or anything listed changed"""
+    path = os.path.join(template_dir, MANIFEST_NAME)
+    try:
+        with open(path, "r") as f:
+            manifest = json.load(f)
+        if manifest_current(template_dir, manifest, os.path.getmtime(path)):
+            return manifest
+    except (OSError, ValueError, KeyError):
+        pass
+    try:
+        return save_manifest(template_dir)
+    except OSError:
+        # Read-only install: use it without saving
+        return build_manifest(template_dir)
+
+
+def substitute_stream(src, dst, values, chunk_size=CHUNK_SIZE):
+    """Copy src to dst replacing {{NAME}} with values[NAME] in one pass.
+
+    Unknown placeholders are left as they are. A placeholder split
+    across two reads is carried over to the next chunk.
+    """
+    def replace(match):
+        value = values.get(match.group(1).decode("ascii"))
+        return match.group(0) if value is None else value
+
+    carry = b""
+    while True:
+        chunk = src.read(chunk_size)
+        data = carry + chunk
+        if not chunk:
+            dst.write(PLACEHOLDER.sub(replace, data))
+            return
+        # Hold back an unterminated "{{" so it is matched once complete
+        cut = data.rfind(b"{{")
+        if cut < 0 or data.find(b"}}", cut) >= 0 or len(data) - cut > 256:
+            cut = len(data) - 1 if data.endswith(b"{") else len(data)
+        dst.write(PLACEHOLDER.sub(replace, data[:cut]))
+        carry = data[cut:]
+
+
+def clone_file(src, dst, hardlink=False, reflink=True):
+    """Reflink src to dst if possible, else hardlink (if allowed) or copy.
+
+    Hard links share the inode with the template, so they are only safe
+    when nothing writes to project files in place; they are off unless
+    asked for. Returns "reflink", "hardlink" or "copy".
+    """
+    if reflink and fcntl is not None:
+        try:
+            with open(src, "rb") as s, open(dst, "wb") as d:
+                fcntl.ioctl(d.fileno(), FICLONE, s.fileno())
+            return "reflink"
+        except OSError:
+            pass
+    if hardlink:
+        try:
+            if os.path.exists(dst):
+                os.remove(dst)
+            os.link(src, dst)
+            return "hardlink"
+        except OSError:
+            pass
+    shutil.copyfile(src, dst)
+    return "copy"
+
+
+def encode_values(values, json_escape):
+    encoded = {}
+    for name, value in values.items():
+        value = str(value)
+        if json_escape:
+            value = json.dumps(value)[1:-1]
+        encoded[name] = value.encode("utf-8")
+    return encoded
+
+
+def create_project(template_dir, project_path, values, workers=8, hardlink=False):
+    """Create project_path from a template, filling in placeholder values.
+
+    Returns a count of files per method ("substituted", "reflink",
+    "hardlink", "copy").
+    """
+    manifest = load_manifest(template_dir)
+    os.makedirs(project_path, exist_ok=True)
+    for d in manifest["dirs"]:
+        os.makedirs(os.path.join(project_path, d), exist_ok=True)
+
+    plain = encode_values(values, json_escape=False)
+    escaped = encode_values(values, json_escape=True)
+    # Stop trying reflinks once the filesystem has refused one
+    can_reflink = [True]
+
+    def create_file(entry):
+        src = os.path.join(template_dir, entry["path"])
+        dst = os.path.join(project_path, entry["path"])
+        if not entry["substitute"]:
+            method = clone_file(src, dst, hardlink, can_reflink[0])
+            if method != "reflink":
+                can_reflink[0] = False
+            return method
+        json_file = os.path.splitext(dst)[1].lower() in JSON_EXTENSIONS
+        with open(src, "rb") as s, open(dst, "wb") as d:
+            substitute_stream(s, d, escaped if json_file else plain)
+        return "substituted"
+
+    def create_files(entries):
+        return [create_file(entry) for entry in entries]
+
+    # One task per worker rather than per file keeps small files cheap
+    files = manifest["files"]
+    counts = {}
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for methods in pool.map(create_files, [files[i::workers] for i in range(workers)]):
+            for method in methods:
+                counts[method] = counts.get(method, 0) + 1
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Precompute a project template's manifest")
+    parser.add_argument("templates", nargs="+", help="template directories")
+    args = parser.parse_args()
+    for template_dir in args.templates:
+        manifest = save_manifest(template_dir)
+        print(f"{template_dir}: {len(manifest['files'])} files, "
+              f"{sum(f['substitute'] for f in manifest['files'])} with placeholders")
+
+
+if __name__ == "__main__":
+    main()
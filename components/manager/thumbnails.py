@@ -0,0 +1,151 @@
+import os
+import json
+import hashlib
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import customtkinter as ctk
+
+from components.manager.tasks import BackgroundJob
+from components.image_cache import images
+
+THUMBNAIL_DIR = os.path.join(".axion", "thumbnails")
+
+
+def scene_hash(project_path):
+    """Content hash of a project's default scene files, or None if it has none.
+
+    Covers the JSON scene, its cooked copy and a chunk index, so editing
+    any of them gives a new thumbnail.
+    """
+    try:
+        with open(os.path.join(project_path, "project.axie"), "r") as f:
+            settings = json.load(f).get("settings", {})
+    except (OSError, json.JSONDecodeError):
+        return None
+    name = settings.get("default_scene", "main")
+    scene_dir = os.path.join(project_path, "scene")
+    digest = hashlib.sha1()
+    found = False
+    for file_name in (name + ".scene", name + ".cscene", os.path.join(name + ".chunks", "index.json")):
+        try:
+            with open(os.path.join(scene_dir, file_name), "rb") as f:
+                for block in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(block)
+            found = True
+        except OSError:
+            continue
+    return digest.hexdigest() if found else None
+
+
+def thumbnail_path(project_path, content_hash, size):
+    return os.path.join(
+        project_path, THUMBNAIL_DIR, f"{content_hash}_{size[0]}x{size[1]}.png")
+
+
+def render_thumbnail(project_path, out_path, size):
+    """Worker process: render the default scene offscreen, save it as a PNG and return it"""
+    from PIL import Image
+    from components.core.engine.engine import load_project, load_default_scene
+    from components.core.engine.renderer import SpriteRenderer
+
+    settings = load_project(project_path).get("settings", {})
+    width, height = settings.get("resolution", [1280, 720])
+    frame = SpriteRenderer(width, height, texture_root=project_path).render(
+        load_default_scene(project_path))
+    frame.thumbnail(size)
+    thumbnail = Image.new("RGBA", size, (0, 0, 0, 0))
+    thumbnail.paste(frame, ((size[0] - frame.width) // 2, (size[1] - frame.height) // 2))
+
+    # Older thumbnails of this size belong to previous versions of the scene
+    directory = os.path.dirname(out_path)
+    os.makedirs(directory, exist_ok=True)
+    suffix = f"_{size[0]}x{size[1]}.png"
+    for name in os.listdir(directory):
+        if name.endswith(suffix):
+            os.remove(os.path.join(directory, name))
+    partial = out_path + ".tmp"
+    thumbnail.save(partial, format="PNG")
+    os.replace(partial, out_path)
+    return thumbnail
+
+
+class ThumbnailLoader:
+    """Project thumbnails, loaded only when a card asks for one.
+
+    ``get`` returns a project's thumbnail if it is ready and otherwise
+    queues it; queued requests from one layout pass go out as a single
+    BackgroundJob. A worker thread hashes the default scene and looks
+    for a cached PNG under the project's .axion/thumbnails; on a miss
+    the scene is rendered in a separate process so the UI never waits
+    on the engine. on_ready(path) is called on the Tk thread when a
+    thumbnail arrives.
+    """
+
+    def __init__(self, app, pool, on_ready, size=(64, 64)):
+        self.app = app
+        self.pool = pool
+        self.on_ready = on_ready
+        self.size = size
+        self.icons = {}
+        self.requested = set()
+        self.queued = []
+        self.renderer = None
+        self.renderer_lock = threading.Lock()
+        self.jobs = []
+
+    def get(self, project):
+        path = project["path"]
+        icon = self.icons.get(path)
+        if icon is None and path not in self.requested:
+            self.requested.add(path)
+            if not self.queued:
+                self.app.after_idle(self._flush)
+            self.queued.append(path)
+        return icon
+
+    def forget(self, path):
+        """Check a project's scene again next time it is shown"""
+        self.icons.pop(path, None)
+        self.requested.discard(path)
+
+    def shutdown(self):
+        for job in self.jobs:
+            job.cancel()
+        with self.renderer_lock:
+            if self.renderer is not None:
+                self.renderer.shutdown(wait=False, cancel_futures=True)
+
+    def _flush(self):
+        paths, self.queued = self.queued, []
+        self.jobs = [job for job in self.jobs if not job.finished]
+        self.jobs.append(BackgroundJob(self.app, self.pool, paths, self._load, self._loaded))
+
+    def _render(self, project_path, out_path):
+        """Future for the rendered thumbnail; the worker thread doesn't wait on it"""
+        # _load runs on several pool threads at once
+        with self.renderer_lock:
+            if self.renderer is None:
+                # Spawned rather than forked: the parent is running Tk
+                self.renderer = ProcessPoolExecutor(
+                    max_workers=1, mp_context=multiprocessing.get_context("spawn"))
+            return self.renderer.submit(render_thumbnail, project_path, out_path, self.size)
+
+    def _load(self, project_path):
+        """Worker thread: decoded thumbnail image, or a Future if it must be rendered"""
+        content_hash = scene_hash(project_path)
+        if content_hash is None:
+            return None
+        out_path = thumbnail_path(project_path, content_hash, self.size)
+        if not os.path.exists(out_path):
+            return self._render(project_path, out_path)
+        return images.get(out_path, self.size)
+
+    def _loaded(self, path, image, error):
+        if error:
+            print(f"Failed to create thumbnail for {path}: {error}")
+        if image is None:
+            return
+        self.icons[path] = ctk.CTkImage(image, size=self.size)
+        self.on_ready(path)
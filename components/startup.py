@@ -0,0 +1,138 @@
+import os
+import sys
+import json
+import time
+import importlib.util
+
+# Compiled component modules by absolute path, so a component is only
+# executed once per process even if it is requested again (e.g. fallback)
+_components = {}
+
+
+def load_component(component_path):
+    """Load a component from a Python file, reusing it if already loaded.
+
+    Bytecode is cached in __pycache__ by the standard source loader, so
+    only the first launch after an edit pays for compiling.
+    """
+    path = os.path.abspath(component_path)
+    module = _components.get(path)
+    if module is not None:
+        return module
+    module_name = os.path.basename(component_path).replace('.py', '')
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    _components[path] = module
+    return module
+
+
+def lazy_import(name):
+    """Import a module on first attribute access instead of right away"""
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ImportError(f"No module named {name!r}")
+    spec.loader = importlib.util.LazyLoader(spec.loader)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+class _TimedLoader:
+    """Wraps a real loader and records how long exec_module takes"""
+
+    def __init__(self, loader, name, profiler):
+        self.loader = loader
+        self.name = name
+        self.profiler = profiler
+
+    def create_module(self, spec):
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module):
+        self.profiler._enter_import()
+        start = time.perf_counter()
+        try:
+            self.loader.exec_module(module)
+        finally:
+            self.profiler._exit_import(self.name, time.perf_counter() - start)
+
+    def __getattr__(self, name):
+        return getattr(self.loader, name)
+
+
+class _TimingFinder:
+    """Meta path finder that wraps every found loader in a _TimedLoader"""
+
+    def __init__(self, profiler):
+        self.profiler = profiler
+
+    def find_spec(self, name, path=None, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(name, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                    spec.loader = _TimedLoader(spec.loader, name, self.profiler)
+                return spec
+        return None
+
+
+class StartupProfiler:
+    """Records per-import and per-phase time from launch to first paint"""
+
+    def __init__(self, start=None):
+        self.start = start if start is not None else time.perf_counter()
+        self._last_mark = self.start
+        self.phases = []
+        self.imports = {}
+        self._child_time = [0.0]
+        self._finder = _TimingFinder(self)
+
+    def install(self):
+        sys.meta_path.insert(0, self._finder)
+
+    def uninstall(self):
+        if self._finder in sys.meta_path:
+            sys.meta_path.remove(self._finder)
+
+    def _enter_import(self):
+        self._child_time.append(0.0)
+
+    def _exit_import(self, name, seconds):
+        children = self._child_time.pop()
+        self._child_time[-1] += seconds
+        self.imports[name] = (seconds, seconds - children)
+
+    def mark(self, name):
+        """End the current phase, naming it name"""
+        now = time.perf_counter()
+        self.phases.append((name, now - self._last_mark))
+        self._last_mark = now
+
+    def report(self, top=15, path=None):
+        """Print a summary, and write it as JSON when path is given"""
+        total = time.perf_counter() - self.start
+        slowest = sorted(self.imports.items(), key=lambda item: -item[1][1])[:top]
+        summary = {
+            "total_ms": round(total * 1000, 2),
+            "phases_ms": {name: round(s * 1000, 2) for name, s in self.phases},
+            "imports_ms": {
+                name: {"cumulative": round(c * 1000, 2), "self": round(s * 1000, 2)}
+                for name, (c, s) in slowest
+            },
+        }
+        print(f"Startup: {summary['total_ms']:.1f} ms to first paint")
+        for name, ms in summary["phases_ms"].items():
+            print(f"  phase  {ms:8.1f} ms  {name}")
+        for name, times in summary["imports_ms"].items():
+            print(f"  import {times['self']:8.1f} ms  {name} ({times['cumulative']:.1f} ms cumulative)")
+        if path:
+            with open(path, "w") as f:
+                json.dump(summary, f, indent=2)
+        return summary
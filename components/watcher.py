@@ -0,0 +1,126 @@
+import os
+import sys
+import time
+import ctypes
+import ctypes.util
+import struct
+
+# inotify event flags (linux/inotify.h)
+IN_CLOSE_WRITE = 0x008
+IN_MOVED_FROM = 0x040
+IN_MOVED_TO = 0x080
+IN_CREATE = 0x100
+IN_DELETE = 0x200
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+EVENT_HEADER = struct.Struct("iIII")
+
+IGNORED_DIRS = {".axion", ".git", "__pycache__"}
+
+
+def _watched_dirs(root):
+    for path, dirs, _ in os.walk(root):
+        dirs[:] = [d for d in dirs if d not in IGNORED_DIRS]
+        yield path
+
+
+class InotifyWatcher:
+    """Change notifications from the Linux kernel, read without blocking"""
+
+    MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_MOVED_FROM | IN_CREATE | IN_DELETE
+
+    def __init__(self, roots):
+        libc_name = ctypes.util.find_library("c")
+        self.libc = ctypes.CDLL(libc_name, use_errno=True)
+        self.fd = self.libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.dirs = {}
+        for root in roots:
+            for path in _watched_dirs(root):
+                self._watch(path)
+
+    def _watch(self, path):
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(path), self.MASK)
+        if wd >= 0:
+            self.dirs[wd] = path
+
+    def changes(self):
+        """Paths changed since the last call"""
+        changed = set()
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+                offset += EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b"\0").decode("utf-8", "replace")
+                offset += length
+                directory = self.dirs.get(wd)
+                if directory is None or not name:
+                    continue
+                path = os.path.join(directory, name)
+                if mask & IN_ISDIR:
+                    if mask & (IN_CREATE | IN_MOVED_TO) and name not in IGNORED_DIRS:
+                        for sub in _watched_dirs(path):
+                            self._watch(sub)
+                    continue
+                changed.add(path)
+        return changed
+
+    def close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+class PollingWatcher:
+    """Finds changes by comparing file mtimes and sizes, at most every interval"""
+
+    def __init__(self, roots, interval=0.25):
+        self.roots = list(roots)
+        self.interval = interval
+        self.last_poll = time.perf_counter()
+        self.files = self._scan()
+
+    def _scan(self):
+        files = {}
+        for root in self.roots:
+            for path in _watched_dirs(root):
+                try:
+                    entries = list(os.scandir(path))
+                except OSError:
+                    continue
+                for entry in entries:
+                    if entry.is_file():
+                        st = entry.stat()
+                        files[entry.path] = (st.st_mtime_ns, st.st_size)
+        return files
+
+    def changes(self):
+        now = time.perf_counter()
+        if now - self.last_poll < self.interval:
+            return set()
+        self.last_poll = now
+        files = self._scan()
+        changed = {p for p, sig in files.items() if self.files.get(p) != sig}
+        changed |= self.files.keys() - files.keys()
+        self.files = files
+        return changed
+
+    def close(self):
+        pass
+
+
+def create_watcher(roots, interval=0.25):
+    """inotify where the platform has it, polling everywhere else"""
+    if sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(roots)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(roots, interval)
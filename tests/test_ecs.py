@@ -0,0 +1,32 @@
+import numpy as np
+
+from components.core.engine.ecs import World, Transform, Sprite
+
+
+def test_add_many_overwrites_entities_that_have_the_component():
+    world = World()
+    eids = world.create_entities(4)
+    world.add_components(Transform, eids[:2], position=[[1.0, 1.0], [2.0, 2.0]])
+    query = world.query(Transform)
+
+    world.add_components(Transform, eids, position=[[5.0, 5.0], [6.0, 6.0], [7.0, 7.0], [8.0, 8.0]])
+
+    store = world.store(Transform)
+    assert len(store) == 4
+    assert sorted(store.entity_ids().tolist()) == sorted(eids.tolist())
+    assert len(query) == 4
+    for eid, x in zip(eids, [5.0, 6.0, 7.0, 8.0]):
+        assert store.columns["position"][store.index(int(eid))].tolist() == [x, x]
+
+
+def test_add_many_twice_keeps_one_row_per_entity():
+    world = World()
+    eids = world.create_entities(3)
+    world.add_components(Sprite, eids)
+    world.add_components(Sprite, eids, layer=2)
+
+    store = world.store(Sprite)
+    assert len(store) == 3
+    assert store.column("layer").tolist() == [2, 2, 2]
+    world.destroy_entities(eids)
+    assert len(store) == 0
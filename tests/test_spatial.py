@@ -0,0 +1,35 @@
+import numpy as np
+
+from components.core.engine.ecs import World, Transform
+from components.core.engine.spatial import SpatialIndex
+
+
+def make_world(count=5):
+    world = World()
+    eids = world.create_entities(count)
+    world.add_components(Transform, eids, position=np.full((count, 2), 50.0))
+    index = SpatialIndex()
+    index.sync(world)
+    return world, index, eids
+
+
+def test_despawned_entities_are_not_returned_before_sync():
+    world, index, eids = make_world()
+    world.despawn(eids[1:3])
+    world.flush_despawned()
+
+    found = index.query_aabb((0, 0), (100, 100))
+    assert sorted(found.tolist()) == [eids[0], eids[3], eids[4]]
+    assert sorted(index.query_radius((50, 50), 10).tolist()) == [eids[0], eids[3], eids[4]]
+
+
+def test_reused_id_is_found_at_its_own_position():
+    world, index, eids = make_world()
+    world.destroy_entity(int(eids[0]))
+    reused = world.create_entity()
+    assert reused == eids[0]
+    world.add_component(reused, Transform, position=(5000.0, 5000.0))
+
+    assert reused not in index.query_aabb((0, 0), (100, 100)).tolist()
+    index.sync(world)
+    assert index.query_aabb((4900, 4900), (5100, 5100)).tolist() == [reused]